@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from .models import Finding
+
+BASELINE_VERSION = 1
+
+
+def normalize_path(path: str, base: str) -> str:
+    """Make a finding path independent of OS separators and of how the file was passed on the command line."""
+    p = path.replace(os.sep, "/")
+    base = base.replace(os.sep, "/").rstrip("/") + "/"
+    if p.startswith(base):
+        p = p[len(base) :]
+    while p.startswith("./"):
+        p = p[2:]
+    return p
+
+
+def fingerprint(f: Finding, base: str) -> str:
+    """
+    Stable 64-bit fingerprint (16 hex digits) of a finding: its code, normalized path,
+    document index and message. Severity is left out so overrides do not invalidate a baseline.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    doc = "" if f.document is None else str(f.document)
+    for part in (f.code.upper(), normalize_path(f.path, base), doc, f.message):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class Baseline:
+    """A set of accepted finding fingerprints; membership checks are O(1)."""
+
+    def __init__(self: Baseline, fingerprints: Iterable[str], *, base: str | None = None) -> None:
+        self.fingerprints = frozenset(fingerprints)
+        self.base = base if base is not None else str(Path.cwd())
+
+    def __len__(self: Baseline) -> int:
+        return len(self.fingerprints)
+
+    def __contains__(self: Baseline, f: Finding) -> bool:
+        return fingerprint(f, self.base) in self.fingerprints
+
+    def filter(self: Baseline, findings: Iterable[Finding]) -> list[Finding]:
+        """Return only the findings that are not in the baseline."""
+        return [f for f in findings if f not in self]
+
+    @classmethod
+    def from_findings(cls: type[Baseline], findings: Iterable[Finding], *, base: str | None = None) -> Baseline:
+        base = base if base is not None else str(Path.cwd())
+        return cls((fingerprint(f, base) for f in findings), base=base)
+
+    @classmethod
+    def load(cls: type[Baseline], path: Path, *, base: str | None = None) -> Baseline:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("version") != BASELINE_VERSION:
+            raise ValueError(f"{path}: not a dltlint baseline (version {BASELINE_VERSION})")
+        return cls(data.get("fingerprints", []), base=base)
+
+    def write(self: Baseline, path: Path) -> None:
+        # Sorted, one fingerprint per line: compact, deterministic and diff-friendly.
+        body = ",\n".join(f'"{x}"' for x in sorted(self.fingerprints))
+        path.write_text(f'{{"version": {BASELINE_VERSION}, "fingerprints": [\n{body}\n]}}\n', encoding="utf-8")
@@ -5,12 +5,38 @@ import importlib.metadata
 import json
 import os
 import sys
+import textwrap
+import time
+import warnings
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 
-from .config import load_config
-from .core import find_pipeline_files, lint_paths, severity_rank
+from .baseline import Baseline
+from .config import ConfigResolver, ToolConfig, load_config
+from .core import (
+    Document,
+    cross_file_findings,
+    find_pipeline_files,
+    iter_lint_documents,
+    iter_lint_files,
+    iter_lint_snapshot,
+    severity_rank,
+)
+from .index import PipelineIndex
+from .junit import JUnitWriter
+from .merge import merge_results
+from .metrics import Metrics
 from .models import Finding, Severity
 from .registry import rules_markdown
+from .schema import json_schema
+from .shard import parse_shard, select_shard
+from .stats import Statistics
+from .tracing import Tracer, install, span
+from .watch import Watcher
 
 __version__ = importlib.metadata.version("dltlint")
 
@@ -18,17 +44,206 @@ __version__ = importlib.metadata.version("dltlint")
 def _pretty(findings: list[Finding]) -> None:
     for x in findings:
         sym = {Severity.ERROR: "✖", Severity.WARNING: "⚠", Severity.INFO: "ℹ"}[Severity(x.severity)]
-        print(f"{sym} {x.code} {x.path}: {x.message}")
+        loc = x.path if x.document is None else f"{x.path} (document {x.document})"
+        print(f"{sym} {x.code} {loc}: {x.message}")
+
+
+def _iter_ndjson_records(lines: Iterable[str]) -> Iterator[tuple[str, Document]]:
+    for n, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        rec = json.loads(line)
+        if not isinstance(rec, dict) or "spec" not in rec:
+            raise ValueError(f"stdin line {n}: expected an object with a 'spec' field")
+        yield str(rec.get("name") or f"<stdin:{n}>"), rec["spec"]
+
+
+def _run_stdin_ndjson(fmt: str, cfg: ToolConfig, fail_on: Severity) -> int:
+    """
+    Lint one spec per stdin line, ``{"name": ..., "spec": <object or YAML/JSON text>}``, writing each
+    record's findings as soon as it is linted (one JSON line per record with ``--format json``).
+    """
+    worst = -1
+    junit = JUnitWriter(sys.stdout, fail_on) if fmt == "junit" else None
+    try:
+        with junit or nullcontext():
+            for name, findings in iter_lint_documents(_iter_ndjson_records(sys.stdin), cfg=cfg):
+                if junit is not None:
+                    junit.testcase(name, findings)
+                elif fmt == "json":
+                    print(json.dumps({"name": name, "findings": [x.model_dump() for x in findings]}))
+                else:
+                    _pretty(findings)
+                sys.stdout.flush()
+                worst = max([worst, *(severity_rank(x.severity) for x in findings)])
+    except Exception as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    return 1 if worst >= severity_rank(fail_on) else 0
+
+
+def _run_snapshot(paths: list[str], fmt: str, resolver: ConfigResolver, fail_on: Severity) -> int:
+    """
+    Stream ``bundle validate -o json`` snapshots, writing each pipeline's findings as soon as it is
+    linted (one JSON line per pipeline with ``--format json``).
+    """
+    worst = -1
+    junit = JUnitWriter(sys.stdout, fail_on) if fmt == "junit" else None
+    try:
+        with junit or nullcontext():
+            for p in paths:
+                path = Path(p)
+                for pid, findings in iter_lint_snapshot(path, cfg=resolver.for_path(path)):
+                    if junit is not None:
+                        junit.testcase(str(pid), findings, classname=str(path), file=str(path))
+                    elif fmt == "json":
+                        record = {"file": str(path), "pipeline": pid, "findings": [x.model_dump() for x in findings]}
+                        print(json.dumps(record))
+                    else:
+                        _pretty(findings)
+                    sys.stdout.flush()
+                    worst = max([worst, *(severity_rank(x.severity) for x in findings)])
+    except Exception as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    return 1 if worst >= severity_rank(fail_on) else 0
+
+
+def _run_watch(paths: list[str], fmt: str, cfg: ToolConfig, overrides: dict[str, object], interval: float) -> int:
+    """Lint once, then poll for changes and print only the findings that appear (+) or go away (-)."""
+    watcher = Watcher(paths, cfg=cfg, overrides=overrides)
+    initial = watcher.start()
+    if fmt == "json":
+        print(json.dumps({"added": [x.model_dump() for x in initial], "removed": []}))
+    else:
+        _pretty(initial)
+        print(f"dltlint: watching {len(watcher.findings)} pipeline file(s), {len(initial)} finding(s)")
+    sys.stdout.flush()
+    try:
+        while True:
+            time.sleep(interval)
+            added, removed = watcher.poll()
+            if not (added or removed):
+                continue
+            if fmt == "json":
+                print(
+                    json.dumps({"added": [x.model_dump() for x in added], "removed": [x.model_dump() for x in removed]})
+                )
+            else:
+                for prefix, items in (("-", removed), ("+", added)):
+                    for x in items:
+                        print(f"{prefix} {x.code} {x.path}: {x.message}")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        return 0
+
+
+@dataclass
+class _Collector:
+    """
+    Receives each linted file's findings: drops baselined ones, then counts them into ``stats`` or
+    writes them as a ``junit`` test case when given, else keeps them in ``findings`` (and counts them
+    into ``metrics`` when given). `add` reports
+    when the run should stop early: at the first finding at or above ``fail_fast``. Once
+    ``max_findings`` findings were kept, later findings are no longer reported but files are still
+    linted until one reaches ``fail_on``. ``worst`` is the highest severity rank of every finding
+    produced, including those cut by ``max_findings``, so truncating the output never changes the
+    exit code.
+    """
+
+    baseline: Baseline | None = None
+    stats: Statistics | None = None
+    metrics: Metrics | None = None
+    junit: JUnitWriter | None = None
+    fail_fast: Severity | None = None
+    max_findings: int | None = None
+    fail_on: Severity = Severity.ERROR
+    findings: list[Finding] = field(default_factory=list)
+    kept: int = 0
+    worst: int = -1
+
+    def add(self: _Collector, path: Path, file_findings: list[Finding], *, linted: bool = True) -> bool:
+        new = self.baseline.filter(file_findings) if self.baseline is not None else file_findings
+        stop = False
+        if self.fail_fast is not None:
+            threshold = severity_rank(self.fail_fast)
+            hit = next((i for i, x in enumerate(new) if severity_rank(x.severity) >= threshold), None)
+            if hit is not None:
+                new, stop = new[: hit + 1], True
+        self.worst = max([self.worst, *(severity_rank(x.severity) for x in new)])
+        if self.max_findings is not None:
+            # Past the cap, files only count toward the exit code: stop once the run fails anyway
+            failed = self.worst >= severity_rank(self.fail_on)
+            if self.kept >= self.max_findings:
+                return stop or failed
+            if self.kept + len(new) >= self.max_findings:
+                new, stop = new[: self.max_findings - self.kept], stop or failed
+        self.kept += len(new)
+        if self.metrics is not None:
+            self.metrics.add_findings(new)
+        if self.stats is not None:
+            self.stats.add(path, new, linted=linted)
+        elif self.junit is not None:
+            self.junit.testcase(str(path), new, classname="dltlint" if linted else "dltlint.cross_file")
+        else:
+            self.findings.extend(new)
+        return stop
+
+
+def _lint_files(files: list[Path], cfg: ToolConfig, resolver: ConfigResolver, sink: _Collector) -> None:
+    """
+    Lint ``files`` one at a time into ``sink``, then add cross-file findings when enabled.
+    Stopping early closes the lint iterator, which cancels queued reads and drops read-ahead work
+    still in flight.
+    """
+    index = PipelineIndex() if cfg.cross_file else None
+    lint = iter_lint_files(files, cfg=cfg, resolver=resolver, index=index, metrics=sink.metrics)
+    with closing(lint) as results:
+        for path, file_findings in results:
+            if sink.add(path, file_findings):
+                return
+    if index is not None:
+        for path, file_findings in cross_file_findings(index, cfg=cfg, resolver=resolver):
+            if sink.add(path, file_findings, linted=False):
+                return
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """Reads ``@FILE`` arguments one per line, skipping blank lines (an empty path would mean ".")."""
+
+    def convert_arg_line_to_args(self: _ArgumentParser, arg_line: str) -> list[str]:
+        return [arg_line] if arg_line.strip() else []
+
+
+def _shard_arg(spec: str) -> tuple[int, int]:
+    try:
+        return parse_shard(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
 
 
 def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(description="Linter for Databricks Lakeflow (DLT) pipeline YAML/JSON configs")
+    p = _ArgumentParser(
+        description="Linter for Databricks Lakeflow (DLT) pipeline YAML/JSON configs",
+        fromfile_prefix_chars="@",
+        epilog="Arguments can also be read from a file, one per line: dltlint @args.txt",
+    )
     p.add_argument(
         "paths",
         nargs="*",
         help="Files or directories. Files must end with .pipeline.yml/.pipeline.yaml; directories are searched recursively.",
     )
-    p.add_argument("--format", choices=["pretty", "json"], default="pretty", help="Output format (default: pretty)")
+    p.add_argument(
+        "--files-from",
+        metavar="FILE",
+        help="Also lint the paths listed in FILE ('-' for stdin), one per line or NUL-separated",
+    )
+    p.add_argument(
+        "--format",
+        choices=["pretty", "json", "junit"],
+        default="pretty",
+        help="Output format (default: pretty); junit writes JUnit XML with one test case per file",
+    )
     p.add_argument(
         "--fail-on",
         choices=[s.value for s in Severity],
@@ -36,62 +251,370 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p.add_argument("--quiet", action="store_true", help="Suppress 'no files found' message (still exits 0)")
     p.add_argument("--ok", action="store_true", help="Print a success message when no findings are found")
+    p.add_argument(
+        "--multi-document",
+        action="store_true",
+        help="Lint every document of '---'-separated YAML streams (default: from config or off)",
+    )
+    p.add_argument(
+        "--cross-file",
+        action="store_true",
+        help="Also report pipeline ids, names and publish destinations defined in more than one file",
+    )
+    p.add_argument(
+        "--shard",
+        type=_shard_arg,
+        metavar="INDEX/COUNT",
+        help="Lint only shard INDEX (1-based) of COUNT, split by a stable hash of each file's path",
+    )
+    p.add_argument(
+        "--shard-by-size",
+        action="store_true",
+        help="With --shard, balance shards by total file size instead of file count",
+    )
+    p.add_argument(
+        "--read-ahead",
+        type=int,
+        metavar="N",
+        help="Prefetch file bytes on N threads while linting earlier files (default: from config or 0)",
+    )
+    p.add_argument(
+        "--stdin-ndjson",
+        action="store_true",
+        help='Lint specs streamed on stdin, one {"name": ..., "spec": ...} JSON object per line',
+    )
+    p.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Treat paths as 'bundle validate -o json' snapshots and stream their pipelines one at a time",
+    )
+    p.add_argument("--baseline", metavar="FILE", help="Only report findings that are not recorded in FILE")
+    p.add_argument(
+        "--write-baseline",
+        action="store_true",
+        help="Record all current findings in the --baseline FILE and exit 0",
+    )
+    p.add_argument(
+        "--statistics",
+        action="store_true",
+        help="Print finding counts per code, severity and file instead of the findings",
+    )
+    p.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first finding at or above the --fail-on severity",
+    )
+    p.add_argument(
+        "--max-findings",
+        type=int,
+        metavar="N",
+        help="Report at most N findings. The remaining files are still linted, without output, until "
+        "one fails the --fail-on check, so the exit code counts findings cut from the report",
+    )
+    p.add_argument(
+        "--metrics-file",
+        metavar="PATH",
+        help="Write run metrics (files, bytes, timings, findings, peak RSS) to PATH in OpenMetrics text format",
+    )
+    p.add_argument(
+        "--trace-file",
+        metavar="PATH",
+        help="Write a timeline of discovery, config loading, reads, parsing, linting and output to PATH "
+        "(Chrome trace format; open in Perfetto or chrome://tracing)",
+    )
+    p.add_argument("--watch", action="store_true", help="Keep running and re-lint files as they change")
+    p.add_argument(
+        "--watch-interval",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="Polling interval for --watch (default: 0.5)",
+    )
     p.add_argument("--version", action="store_true", help="Print version and exit")
     p.add_argument("--gen-rules", metavar="PATH", help="Write RULES.md to PATH and exit")
+    p.add_argument("--json-schema", metavar="PATH", help="Write the pipeline spec as JSON Schema to PATH and exit")
     return p
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
-
+def _run_info(args: argparse.Namespace) -> int:
+    """--version / --gen-rules / --json-schema: print or write the artifact and exit 0."""
     if args.version:
         print(__version__)
-        return 0
-
-    if args.gen_rules:
+    elif args.gen_rules:
         out = Path(args.gen_rules)
         out.write_text(rules_markdown(), encoding="utf-8")
         print(f"Wrote rules to {out}")
-        return 0
+    else:
+        out = Path(args.json_schema)
+        out.write_text(json.dumps(json_schema(), indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote JSON Schema to {out}")
+    return 0
 
-    # Load config from nearest pyproject.toml
-    cfg = load_config(Path.cwd())
 
-    # CLI override of fail_on
+def _report(findings: list[Finding], args: argparse.Namespace, n_files: int) -> None:
+    """Print ``findings`` in the requested format."""
+    if not findings:
+        if args.ok and args.format == "pretty":
+            print(f"✔ No issues found in {n_files} pipeline file(s)")
+        return
+
+    if args.format == "json":
+        print(json.dumps([x.model_dump() for x in findings], indent=2))
+    else:
+        _pretty(findings)
+
+
+def _read_path_list(source: str) -> list[str]:
+    text = sys.stdin.read() if source == "-" else Path(source).read_text(encoding="utf-8")
+    return [p for p in (text.split("\0") if "\0" in text else text.splitlines()) if p.strip()]
+
+
+def build_merge_parser() -> argparse.ArgumentParser:
+    p = _ArgumentParser(
+        prog="dltlint merge",
+        description="Combine the JSON results of several dltlint runs: de-duplicate findings, re-apply the "
+        "configured ignore/severity policy, sort them and exit like a single run would",
+        fromfile_prefix_chars="@",
+    )
+    p.add_argument("inputs", nargs="+", help="--format json arrays or JSON-lines result files; '-' reads stdin")
+    p.add_argument(
+        "--format",
+        choices=["pretty", "json", "junit"],
+        default="pretty",
+        help="Output format (default: pretty); junit writes one test case per file with findings",
+    )
+    p.add_argument(
+        "--fail-on",
+        choices=[s.value for s in Severity],
+        help="Exit non-zero if any finding at or above this severity is present (default: from config or 'error')",
+    )
+    p.add_argument("--ok", action="store_true", help="Print a success message when no findings are found")
+    return p
+
+
+def _run_merge(argv: list[str]) -> int:
+    """`dltlint merge`: stream the merged findings in the requested format, then exit as `main` would."""
+    args = build_merge_parser().parse_args(argv)
+    cfg = load_config(Path.cwd())
     fail_on = Severity(args.fail_on) if args.fail_on else cfg.fail_on
+    resolver = ConfigResolver(fallback=cfg)
+    worst = -1
+    n = 0
+    junit = JUnitWriter(sys.stdout, fail_on) if args.format == "junit" else None
+    try:
+        with closing(merge_results(args.inputs, resolver)) as merged, junit or nullcontext():
+            if junit is not None:
+                # Merged findings are sorted by file, so each file's findings are consecutive
+                for file, group in groupby(merged, key=attrgetter("file")):
+                    findings = list(group)
+                    junit.testcase(file, findings)
+                    worst = max([worst, *(severity_rank(f.severity) for f in findings)])
+            else:
+                for n, f in enumerate(merged, start=1):
+                    if args.format == "json":
+                        # Same layout as json.dumps(findings, indent=2), one finding at a time
+                        item = textwrap.indent(json.dumps(f.model_dump(), indent=2), "  ")
+                        print(("[\n" if n == 1 else ",\n") + item, end="")
+                    else:
+                        _pretty([f])
+                    worst = max(worst, severity_rank(f.severity))
+    except Exception as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    if n and args.format == "json":
+        print("\n]")
+    if not n and args.ok and args.format == "pretty":
+        print(f"✔ No issues found in {len(args.inputs)} result file(s)")
+    return 1 if worst >= severity_rank(fail_on) else 0
+
 
+def _input_paths(args: argparse.Namespace) -> list[str]:
     # Force root scan if invoked via: pre-commit run --all-files
-    input_paths = ["."] if os.getenv("PRE_COMMIT_RUN_ALL_FILES") == "true" else args.paths if args.paths else ["."]
+    if os.getenv("PRE_COMMIT_RUN_ALL_FILES") == "true":
+        return ["."]
+    if args.files_from:
+        # An empty list means nothing to lint, not "lint the current directory"
+        return [*args.paths, *_read_path_list(args.files_from)]
+    return args.paths if args.paths else ["."]
 
+
+def _run_files(
+    args: argparse.Namespace,
+    cfg: ToolConfig,
+    resolver: ConfigResolver,
+    fail_on: Severity,
+    metrics: Metrics | None,
+) -> int:
+    """Discover, lint and report pipeline files: the default mode of `main`."""
     # 1) Find matching files first
+    try:
+        input_paths = _input_paths(args)
+    except OSError as e:
+        print(f"dltlint: cannot read --files-from {args.files_from}: {e}", file=sys.stderr)
+        return 2
     matched_files = find_pipeline_files(input_paths)
+    if metrics is not None:
+        metrics.files_discovered = len(matched_files)
+    if args.shard:
+        if cfg.cross_file:
+            print("dltlint: cross_file is enabled in the config, which needs every file in one run", file=sys.stderr)
+            return 2
+        matched_files = select_shard(matched_files, *args.shard, by_size=args.shard_by_size)
     if not matched_files:
-        if not args.quiet and args.format == "pretty":
+        if args.format == "junit":
+            with JUnitWriter(sys.stdout, fail_on):
+                pass  # an empty report
+        elif not args.quiet and args.format == "pretty":
             print("dltlint: no matching .pipeline.yml/.pipeline.yaml files found")
         return 0  # pre-commit friendly
 
-    # 2) Lint with config applied (config.ignore, severity_overrides, inline suppressions, require)
+    baseline = None
+    if args.baseline and not args.write_baseline:
+        try:
+            baseline = Baseline.load(Path(args.baseline))
+        except Exception as e:
+            print(f"dltlint: cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 2
+
+    # 2) Lint with config applied (config.ignore, severity_overrides, inline suppressions, require);
+    # JUnit test cases are written as each file completes
+    sink = _Collector(
+        baseline=baseline,
+        stats=Statistics() if args.statistics else None,
+        metrics=metrics,
+        junit=JUnitWriter(sys.stdout, fail_on) if args.format == "junit" and not args.write_baseline else None,
+        fail_fast=fail_on if args.fail_fast else None,
+        max_findings=args.max_findings,
+        fail_on=fail_on,
+    )
     try:
-        findings = lint_paths(input_paths, cfg=cfg)
+        with sink.junit or nullcontext():
+            _lint_files(matched_files, cfg, resolver, sink)
     except Exception as e:
         print(str(e), file=sys.stderr)
         return 2
+    exit_code = 1 if sink.worst >= severity_rank(fail_on) else 0
+    if sink.junit is not None:
+        return exit_code
+    findings, stats = sink.findings, sink.stats
 
     # 3) Output
-    if not findings:
-        if args.ok and args.format == "pretty":
-            print(f"✔ No issues found in {len(matched_files)} pipeline file(s)")
-        return 0
+    with span("output"):
+        if stats is not None:
+            print(json.dumps(stats.to_dict(), indent=2) if args.format == "json" else stats.table())
+            return exit_code
 
-    if args.format == "json":
-        print(json.dumps([x.model_dump() for x in findings], indent=2))
-    else:
-        _pretty(findings)
+        if args.write_baseline:
+            Baseline.from_findings(findings).write(Path(args.baseline))
+            print(f"Wrote baseline with {len(findings)} finding(s) to {args.baseline}")
+            return 0
+
+        _report(findings, args, len(matched_files))
+        return exit_code
+
+
+def _show_warning(message: Warning | str, *_: object) -> None:
+    print(f"dltlint: {message}", file=sys.stderr)
+
+
+@contextmanager
+def _plain_warnings() -> Iterator[None]:
+    """Print warnings (e.g. a `ConfigWarning`) like the CLI's other messages, without a source location."""
+    with warnings.catch_warnings():
+        warnings.showwarning = _show_warning
+        yield
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    # `dltlint merge ...` is the merge subcommand unless "merge" names a file or directory to lint
+    if argv[:1] == ["merge"] and not os.path.exists("merge"):
+        with _plain_warnings():
+            return _run_merge(argv[1:])
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.version or args.gen_rules or args.json_schema:
+        return _run_info(args)
+
+    if args.write_baseline and not args.baseline:
+        parser.error("--write-baseline requires --baseline FILE")
+    if args.max_findings is not None and args.max_findings < 1:
+        parser.error("--max-findings must be at least 1")
+    if args.write_baseline and (args.fail_fast or args.max_findings):
+        parser.error("--write-baseline records every finding; drop --fail-fast/--max-findings")
+    if args.write_baseline and args.statistics:
+        parser.error("--write-baseline writes findings, not statistics; drop --statistics")
+    if args.metrics_file and (args.stdin_ndjson or args.snapshot or args.watch):
+        parser.error("--metrics-file applies to file runs; drop --stdin-ndjson/--snapshot/--watch")
+    if args.snapshot and not args.paths:
+        parser.error("--snapshot needs at least one path")
+    if args.shard and args.cross_file:
+        parser.error("--cross-file needs every file in one run; drop --shard")
+    if (args.files_from or args.shard) and (args.stdin_ndjson or args.snapshot):
+        parser.error("--files-from/--shard apply to file runs; drop --stdin-ndjson/--snapshot")
+    if (args.snapshot or args.stdin_ndjson) and (
+        args.baseline or args.fail_fast or args.max_findings or args.statistics or args.cross_file
+    ):
+        parser.error(
+            "--snapshot/--stdin-ndjson stream every spec's findings; "
+            "drop --baseline/--fail-fast/--max-findings/--statistics/--cross-file"
+        )
+    if args.watch and (
+        args.baseline or args.fail_fast or args.max_findings or args.statistics or args.shard or args.cross_file
+    ):
+        parser.error(
+            "--watch reports every finding as files change; "
+            "drop --baseline/--fail-fast/--max-findings/--statistics/--shard/--cross-file"
+        )
+    if args.format == "junit" and (args.watch or args.statistics):
+        parser.error("--format junit reports findings per file; drop --watch/--statistics")
 
-    worst = max([severity_rank(x.severity) for x in findings], default=-1)
-    threshold = severity_rank(fail_on)
-    return 1 if (findings and worst >= threshold) else 0
+    tracer = Tracer() if args.trace_file else None
+    install(tracer)
+    try:
+        with _plain_warnings():
+            return _run(args)
+    finally:
+        if tracer is not None:
+            install(None)
+            tracer.write(Path(args.trace_file))
+
+
+def _run(args: argparse.Namespace) -> int:
+    """Everything after argument validation: resolve config and dispatch to the requested mode."""
+    # Load run-wide config from nearest pyproject.toml
+    cfg = load_config(Path.cwd())
+
+    # CLI override of fail_on
+    fail_on = Severity(args.fail_on) if args.fail_on else cfg.fail_on
+    # CLI settings win over every config file, including configs reloaded by --watch
+    overrides: dict[str, object] = {}
+    if args.multi_document:
+        cfg.multi_document = overrides["multi_document"] = True
+    if args.cross_file:
+        cfg.cross_file = overrides["cross_file"] = True
+    if args.read_ahead is not None:
+        cfg.read_ahead = overrides["read_ahead"] = max(args.read_ahead, 0)
+    # Per-file config: nearest dltlint.toml / pyproject.toml, inheriting from parent directories
+    resolver = ConfigResolver(fallback=cfg, overrides=overrides)
+
+    if args.stdin_ndjson:
+        return _run_stdin_ndjson(args.format, cfg, fail_on)
+
+    if args.snapshot:
+        return _run_snapshot(args.paths, args.format, resolver, fail_on)
+
+    if args.watch:
+        return _run_watch(_input_paths(args), args.format, cfg, overrides, args.watch_interval)
+
+    metrics = Metrics() if args.metrics_file else None
+    try:
+        return _run_files(args, cfg, resolver, fail_on, metrics)
+    finally:
+        if metrics is not None:
+            metrics.cache_hits, metrics.cache_misses = resolver.hits, resolver.misses
+            metrics.write(Path(args.metrics_file))
 
 
 if __name__ == "__main__":
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import os
+import warnings
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import tomli
 
 from .models import Severity
+from .policy import Policy
+from .tracing import span
+
+if TYPE_CHECKING:
+    from .reader import Buffer
 
 
 @dataclass
@@ -16,15 +24,52 @@ class ToolConfig:
     severity_overrides: dict[str, Severity] = field(default_factory=dict)  # {"DLT400": "info"}
 
     inline_disable_token: str = "dltlint: disable"  # comment token for inline suppression
+    multi_document: bool = False  # lint every document of a `---`-separated YAML stream
+    read_ahead: int = 0  # reader threads prefetching file bytes; 0 reads serially
+    read_ahead_bytes: int = 64 * 1024 * 1024  # cap on prefetched-but-unlinted bytes
+    mmap_threshold: int = 8 * 1024 * 1024  # memory-map files at least this large; 0 disables
+    cross_file: bool = False  # report duplicate pipeline ids/names/destinations across files (DLT5xx)
+    # Loading limits per file (0 disables); a file that breaks one gets a DLT003 finding instead
+    max_file_bytes: int = 64 * 1024 * 1024
+    max_aliases: int = 10_000
+    max_depth: int = 200
+    max_nodes: int = 1_000_000  # after YAML alias expansion
+    time_budget: float = 30.0  # seconds
+    # path glob -> code selectors, e.g. {"legacy/**": ["DLT4*"]}
+    per_file_ignores: dict[str, list[str]] = field(default_factory=dict)
+    # path glob -> {code selector: severity}, e.g. {"sandbox/*": {"DLT4": "info"}}
+    per_file_severity_overrides: dict[str, dict[str, Severity]] = field(default_factory=dict)
+    # Directories the per-file globs are relative to: where the declaring config file lives
+    # (None = the working directory)
+    per_file_ignores_root: str | None = None
+    per_file_severity_overrides_root: str | None = None
+
+    _policy: Policy | None = field(default=None, init=False, repr=False, compare=False)
+
+    def policy(self: ToolConfig) -> Policy:
+        """The ignore/severity settings compiled into a `Policy`, on first use."""
+        if self._policy is None:
+            self._policy = Policy.from_config(self)
+        return self._policy
 
 
 def _coerce_severity(x: str) -> Severity:
     return Severity(x.lower())
 
 
-def _read_pyproject(start: Path) -> dict | None:
+def _parse_severities(table: dict[str, Any]) -> dict[str, Severity]:
+    out: dict[str, Severity] = {}
+    for k, v in table.items():
+        try:
+            out[str(k).strip()] = _coerce_severity(str(v))
+        except Exception:
+            continue
+    return out
+
+
+def _read_pyproject(start: Path) -> tuple[dict, Path] | None:
     """
-    Load nearest pyproject.toml and return parsed dict or None.
+    Load nearest pyproject.toml and return the parsed dict and its directory, or None.
     Uses tomllib (3.11+) or tomli (<3.11).
     """
     # walk up directories
@@ -33,18 +78,27 @@ def _read_pyproject(start: Path) -> dict | None:
         pp = parent / "pyproject.toml"
         if pp.exists():
             with pp.open("rb") as f:
-                return tomli.load(f)
+                return tomli.load(f), parent
     return None
 
 
 def load_config(cwd: Path) -> ToolConfig:
-    data = _read_pyproject(cwd) or {}
+    with span("load_config"):
+        found = _read_pyproject(cwd)
+    if found is None:
+        return ToolConfig()
+    data, directory = found
     table = data.get("tool", {}).get("dltlint", {})
-    cfg = ToolConfig()
-
     if not isinstance(table, dict):
-        return cfg
+        return ToolConfig()
+    return _apply_table(ToolConfig(), table, str(directory))
+
 
+def _apply_table(cfg: ToolConfig, table: dict[str, Any], root: str | None = None) -> ToolConfig:
+    """
+    Apply a ``[tool.dltlint]``-style table onto ``cfg`` in place; keys it does not set are kept.
+    ``root`` is the directory of the config file the table came from, for its per-file globs.
+    """
     if isinstance(table.get("fail_on"), str):
         cfg.fail_on = _coerce_severity(table["fail_on"])
     if isinstance(table.get("ignore"), list):
@@ -52,21 +106,128 @@ def load_config(cwd: Path) -> ToolConfig:
     if isinstance(table.get("require"), list):
         cfg.require = [str(x).strip() for x in table["require"] if isinstance(x, str)]
     if isinstance(table.get("severity_overrides"), dict):
-        out: dict[str, Severity] = {}
-        for k, v in table["severity_overrides"].items():
-            try:
-                out[str(k).strip()] = _coerce_severity(str(v))
-            except Exception:
-                continue
-        cfg.severity_overrides = out
+        cfg.severity_overrides = _parse_severities(table["severity_overrides"])
+    per_file_ignores = table.get("per_file_ignores", table.get("per-file-ignores"))
+    if isinstance(per_file_ignores, dict):
+        cfg.per_file_ignores = {
+            str(pat): [str(x).strip() for x in codes if isinstance(x, str)]
+            for pat, codes in per_file_ignores.items()
+            if isinstance(codes, list)
+        }
+        cfg.per_file_ignores_root = root
+    if isinstance(table.get("per_file_severity_overrides"), dict):
+        cfg.per_file_severity_overrides = {
+            str(pat): _parse_severities(overrides)
+            for pat, overrides in table["per_file_severity_overrides"].items()
+            if isinstance(overrides, dict)
+        }
+        cfg.per_file_severity_overrides_root = root
 
     token = table.get("inline_disable_token")
     if isinstance(token, str) and token.strip():
         cfg.inline_disable_token = token.strip()
 
+    for key in ("multi_document", "cross_file"):
+        if isinstance(table.get(key), bool):
+            setattr(cfg, key, table[key])
+    for key in (
+        "read_ahead",
+        "read_ahead_bytes",
+        "mmap_threshold",
+        "max_file_bytes",
+        "max_aliases",
+        "max_depth",
+        "max_nodes",
+    ):
+        val = table.get(key)
+        if isinstance(val, int) and not isinstance(val, bool) and val >= 0:
+            setattr(cfg, key, val)
+    budget = table.get("time_budget")
+    if isinstance(budget, int | float) and not isinstance(budget, bool) and budget >= 0:
+        cfg.time_budget = float(budget)
+
     return cfg
 
 
+def _read_dir_table(directory: Path) -> dict[str, Any] | None:
+    """
+    The dltlint table configured in ``directory`` itself, or None: a standalone ``dltlint.toml``
+    (top-level keys) wins over ``[tool.dltlint]`` in ``pyproject.toml``.
+    """
+    standalone = directory / "dltlint.toml"
+    if standalone.is_file():
+        with standalone.open("rb") as f:
+            return tomli.load(f)
+    pp = directory / "pyproject.toml"
+    if pp.is_file():
+        with pp.open("rb") as f:
+            table = tomli.load(f).get("tool", {}).get("dltlint")
+        if isinstance(table, dict):
+            return table
+    return None
+
+
+class ConfigWarning(UserWarning):
+    """A config file sets something dltlint cannot honour where it is set."""
+
+
+class ConfigResolver:
+    """
+    Resolve the `ToolConfig` for each pipeline file from the ``dltlint.toml`` / ``pyproject.toml``
+    files in its directory and every parent: tables are applied from the outermost to the nearest,
+    so a subproject only states what it changes. Files with no config anywhere above them get
+    ``fallback``. ``overrides`` (e.g. from CLI flags) are applied last.
+
+    ``fail_on`` decides the exit code of the whole run, so only ``fallback``'s value counts; a table
+    that sets a different one emits a `ConfigWarning`.
+
+    Results are memoized per directory, so each config file is parsed once and each directory
+    chain is walked once per resolver.
+    """
+
+    def __init__(
+        self: ConfigResolver, fallback: ToolConfig | None = None, overrides: dict[str, Any] | None = None
+    ) -> None:
+        self.fallback = fallback or ToolConfig()
+        self.overrides = overrides or {}
+        self._fallback = replace(self.fallback, **self.overrides)
+        self._dirs: dict[str, ToolConfig | None] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def for_path(self: ConfigResolver, path: Path) -> ToolConfig:
+        return self.for_dir(os.path.dirname(os.path.abspath(path)))
+
+    def for_dir(self: ConfigResolver, directory: str | Path) -> ToolConfig:
+        cfg = self._resolve(os.path.abspath(directory))
+        return self._fallback if cfg is None else cfg
+
+    def _resolve(self: ConfigResolver, directory: str) -> ToolConfig | None:
+        if directory in self._dirs:
+            self.hits += 1
+            return self._dirs[directory]
+        self.misses += 1
+        parent = os.path.dirname(directory)
+        inherited = None if parent == directory else self._resolve(parent)
+        with span("read_config", directory=directory):
+            table = _read_dir_table(Path(directory))
+        if table is None:
+            cfg = inherited
+        else:
+            base = ToolConfig() if inherited is None else replace(inherited)
+            cfg = replace(_apply_table(base, table, directory), **self.overrides)
+            if "fail_on" in table and cfg.fail_on != self.fallback.fail_on:
+                warnings.warn(
+                    f"{directory}: fail_on = {cfg.fail_on.value!r} is ignored; fail_on applies to the "
+                    f"whole run ({self.fallback.fail_on.value!r}, set in the working directory's pyproject.toml "
+                    "or with --fail-on)",
+                    ConfigWarning,
+                    stacklevel=2,
+                )
+        self._dirs[directory] = cfg
+        return cfg
+
+
 def read_inline_suppressions(path: Path, token: str) -> list[str]:
     """
     File-level inline suppressions: any line containing e.g.
@@ -79,6 +240,11 @@ def read_inline_suppressions(path: Path, token: str) -> list[str]:
         txt = path.read_text(encoding="utf-8", errors="ignore")
     except Exception:
         return []
+    return parse_inline_suppressions(txt, token)
+
+
+def parse_inline_suppressions(txt: str, token: str) -> list[str]:
+    """Same as `read_inline_suppressions`, for text that has already been read."""
     codes: list[str] = []
     for line in txt.splitlines():
         if token in line:
@@ -91,3 +257,21 @@ def read_inline_suppressions(path: Path, token: str) -> list[str]:
                 if part.upper().startswith("DLT"):
                     codes.append(part.upper())
     return codes
+
+
+def scan_inline_suppressions(data: Buffer, token: str) -> list[str]:
+    """
+    Same as `parse_inline_suppressions`, searching the raw bytes (or a memory map) for ``token``
+    and decoding only the lines that contain it.
+    """
+    needle = token.encode("utf-8")
+    codes: list[str] = []
+    pos = data.find(needle)
+    while pos != -1:
+        start = data.rfind(b"\n", 0, pos) + 1
+        end = data.find(b"\n", pos)
+        if end == -1:
+            end = len(data)
+        codes.extend(parse_inline_suppressions(data[start:end].decode("utf-8", errors="ignore"), token))
+        pos = data.find(needle, end)
+    return codes
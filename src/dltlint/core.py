@@ -1,15 +1,43 @@
 from __future__ import annotations
 
 import json
-import re
-from collections.abc import Iterable
+import os
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import closing, nullcontext
+from dataclasses import replace
+from itertools import groupby
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
-from .config import ToolConfig, read_inline_suppressions
-from .models import Finding, Severity
+from .config import ConfigResolver, ToolConfig, scan_inline_suppressions
+from .index import PipelineIndex
+from .limits import LimitExceeded, Limits
+from .limits import load as limited_load
+from .limits import load_all as limited_load_all
+from .metrics import Metrics
+from .models import Finding, Issue, Loc, Severity
+from .policy import select_codes
+from .reader import ARCHIVE_SUFFIXES, Buffer, close_source, is_archive, read_ahead, read_archive
+from .registry import RULES
+from .schema import (
+    CHANNEL_VALUES,  # noqa F401 (re-export)
+    CLUSTER_FORBIDDEN_FIELDS,  # noqa F401 (re-export)
+    CONFIGURATION_FIELDS,
+    EDITION_VALUES,  # noqa F401 (re-export)
+    PIPELINE_OBJ,
+    STANDALONE,
+    TRIGGER_INTERVAL_RE,  # noqa F401 (re-export)
+    VALIDATE_PIPELINE_OBJ,
+    VALIDATE_STANDALONE,
+    Level,
+    field_checker,
+    memoized_subtrees,
+)
+from .snapshot import iter_snapshot_pipelines
+from .tracing import span
 
 try:
     import yaml  # PyYAML
@@ -23,574 +51,446 @@ class LintConfig(BaseModel):
 
 
 # ---- Spec / constants ------------------------------------------------------
-
-CHANNEL_VALUES = {"current", "preview", "CURRENT", "PREVIEW"}
-EDITION_VALUES = {"CORE", "PRO", "ADVANCED"}
-TRIGGER_INTERVAL_RE = re.compile(r"^\s*(\d+)\s*(second|seconds|minute|minutes|hour|hours|day|days)\s*$")
+# The spec itself lives in `schema`; these names are kept for callers that import them from here.
 
 # Top-level fields for a **standalone** pipeline file.
-KNOWN_FIELDS_STANDALONE: dict[str, Any] = {
-    "id": str,
-    "name": str,
-    "configuration": dict,
-    "libraries": list,
-    "clusters": list,
-    "development": bool,
-    "notifications": list,
-    "continuous": bool,
-    "catalog": str,
-    "schema": str,
-    "target": str,
-    "storage": str,
-    "channel": str,
-    "edition": str,
-    "photon": bool,
-    "trigger": dict,
-    "resources": dict,
-    "pipelines.trigger.interval": str,
-    "root_path": str,
-}
-
+KNOWN_FIELDS_STANDALONE: dict[str, Any] = dict(STANDALONE.fields or {})
 
 # Fields expected **inside** a bundle pipeline object at `resources.pipelines.<id>`
-KNOWN_FIELDS_PIPELINE_OBJ: dict[str, Any] = {
-    "id": str,
-    "name": str,
-    "configuration": dict,
-    "libraries": list,
-    "clusters": list,
-    "development": bool,
-    "notifications": list,
-    "continuous": bool,
-    "catalog": str,
-    "schema": str,
-    "target": str,
-    "storage": str,
-    "channel": str,
-    "edition": str,
-    "photon": bool,
-    "maxFlowRetryAttempts": int,
-    "numUpdateRetryAttempts": int,
-    "trigger": dict,
-    "serverless": bool,
-    "environment": dict,
-    "root_path": str,
-}
-
-CLUSTER_FORBIDDEN_FIELDS = {
-    "cluster_name",
-    "data_security_mode",
-    "access_mode",
-    "spark_version",
-    "autotermination_minutes",
-    "runtime_engine",
-    "effective_spark_version",
-    "cluster_source",
-    "docker_image",
-    "workload_type",
-}
-
-KNOWN_FIELDS_PIPELINE_CONFIGURATION_OBJ = {
-    "pipelines.maxFlowRetryAttempts": int,
-    "pipelines.numUpdateRetryAttempts": int,
-    "pipelines.trigger.interval": str,
-}
+KNOWN_FIELDS_PIPELINE_OBJ: dict[str, Any] = dict(PIPELINE_OBJ.fields or {})
+
+KNOWN_FIELDS_PIPELINE_CONFIGURATION_OBJ = dict(CONFIGURATION_FIELDS)
 
 # ---- IO utilities ----------------------------------------------------------
 
 
-def _load_doc(path: Path) -> tuple[Any, str]:
-    text = path.read_text(encoding="utf-8")
-    if path.suffix.lower() == ".json":
-        return json.loads(text), "json"
-    return yaml.safe_load(text), "yaml"
-
-
-def _type_name(x: Any) -> str:  # noqa ANN401
-    return type(x).__name__
-
-
-# ---- Deep validators  ---
-
-
-def _validate_libraries(doc: dict[str, Any], root: str) -> list[Finding]:
-    f: list[Finding] = []
-    libs = doc.get("libraries")
-    if not isinstance(libs, list):
-        return f
-    kinds = ["notebook", "file", "jar", "whl", "maven", "pypi", "glob"]
-    for i, item in enumerate(libs):
-        loc = f"{root}.libraries[{i}]"
-        if not isinstance(item, dict):
-            f.append(Finding(code="DLT420", message="libraries entries must be objects", path=loc))
-            continue
-        present = [k for k in kinds if k in item]
-        if len(present) == 0:
-            f.append(
-                Finding(
-                    code="DLT421",
-                    message="library should specify one of: notebook|file|jar|whl|maven|pypi|glob",
-                    path=loc,
-                    severity=Severity.WARNING,
-                )
-            )
-            continue
-        if len(present) > 1:
-            f.append(
-                Finding(
-                    code="DLT423",
-                    message=f"library must specify exactly one kind, found {present}",
-                    path=loc,
-                    severity=Severity.WARNING,
-                )
-            )
+def _yaml_input(data: Buffer) -> Any:  # noqa ANN401
+    # A memory map is handed to PyYAML as a stream so it is decoded in chunks, not copied whole.
+    if isinstance(data, bytes):
+        return data
+    data.seek(0)
+    return data
 
-        kind = present[0]
-
-        def _require_path(obj: Any, where: str) -> None:  # noqa ANN401
-            if isinstance(obj, str):
-                return
-            if not isinstance(obj, dict) or not isinstance(obj.get("path"), str):
-                f.append(
-                    Finding(code="DLT422", message="library requires a string or an object with 'path'", path=where)
-                )
-
-        if kind in ("notebook", "file"):
-            o = item[kind]
-            if not (isinstance(o, dict) and isinstance(o.get("path"), str)):
-                f.append(Finding(code="DLT422", message=f"{kind} must be an object with 'path'", path=loc))
-        elif kind in ("jar", "whl"):
-            _require_path(item[kind], loc)
-        elif kind == "maven":
-            o = item[kind]
-            if not isinstance(o, dict) or not isinstance(o.get("coordinates"), str):
-                f.append(
-                    Finding(
-                        code="DLT425",
-                        message="maven requires object with 'coordinates' (e.g., group:artifact:version)",
-                        path=loc,
-                    )
-                )
-            else:
-                if "exclusions" in o and (
-                    not isinstance(o["exclusions"], list) or not all(isinstance(x, str) for x in o["exclusions"])
-                ):
-                    f.append(
-                        Finding(
-                            code="DLT425",
-                            message="maven.exclusions must be a list of strings",
-                            path=f"{loc}.maven.exclusions",
-                        )
-                    )
-                if "repo" in o and not isinstance(o["repo"], str):
-                    f.append(Finding(code="DLT425", message="maven.repo must be a string", path=f"{loc}.maven.repo"))
-        elif kind == "pypi":
-            o = item[kind]
-            if not isinstance(o, dict) or not isinstance(o.get("package"), str):
-                f.append(
-                    Finding(
-                        code="DLT426", message="pypi requires object with 'package' (e.g., 'duckdb==1.0.0')", path=loc
-                    )
-                )
-            elif "repo" in o and not isinstance(o["repo"], str):
-                f.append(Finding(code="DLT426", message="pypi.repo must be a string", path=f"{loc}.pypi.repo"))
-        elif kind == "glob":
-            o = item[kind]
-            if not isinstance(o, dict) or not isinstance(o.get("include"), str):
-                f.append(
-                    Finding(
-                        code="DLT427",
-                        message="glob requires object with 'include' (e.g., 'src/**')",
-                        path=loc,
-                    )
-                )
-            elif not o["include"].endswith("**"):
-                f.append(
-                    Finding(
-                        code="DLT427",
-                        message="glob.include must be a path ending with '**'",
-                        path=f"{loc}.glob.include",
-                    )
-                )
-    return f
 
+def _load_doc(path: Path, data: Buffer | None = None, limits: Limits | None = None) -> tuple[Any, str]:
+    if data is None:
+        data = path.read_bytes()
+    with span("parse", file=str(path)):
+        if path.suffix.lower() == ".json":
+            try:
+                return json.loads(data if isinstance(data, bytes) else data[:]), "json"
+            except RecursionError as e:
+                raise LimitExceeded("document nesting is too deep to load") from e
+        if limits is None:
+            return yaml.safe_load(_yaml_input(data)), "yaml"
+        return limited_load(_yaml_input(data), limits), "yaml"
 
-def _validate_notifications(doc: dict[str, Any], root: str) -> list[Finding]:
-    f: list[Finding] = []
-    notifs = doc.get("notifications")
-    if not isinstance(notifs, list):
-        return f
-    for i, n in enumerate(notifs):
-        loc = f"{root}.notifications[{i}]"
-        if not isinstance(n, dict):
-            f.append(Finding(code="DLT440", message="notification entry must be an object", path=loc))
-            continue
-        recipients = n.get("email_recipients")
-        if not (isinstance(recipients, list) and recipients and all(isinstance(x, str) for x in recipients)):
-            f.append(
-                Finding(
-                    code="DLT450", message="notification.email_recipients must be a non-empty list of strings", path=loc
-                )
-            )
-        for flag in ("on_update_start", "on_update_success", "on_update_failure", "on_flow_failure"):
-            if flag in n and not isinstance(n[flag], bool):
-                f.append(Finding(code="DLT451", message=f"notification.{flag} must be a boolean", path=f"{loc}.{flag}"))
-    return f
 
+def _iter_docs(path: Path, data: Buffer | None = None, limits: Limits | None = None) -> Iterator[Any]:
+    """
+    Lazily yield every document of a `---`-separated YAML stream, one at a time,
+    so only the document being linted is held in memory. JSON files yield their single document.
+    An empty stream yields ``None`` once, matching ``_load_doc``.
+    """
+    if path.suffix.lower() == ".json":
+        yield _load_doc(path, data, limits)[0]
+        return
+    if data is None:
+        data = path.read_bytes()
+    empty = True
+    stream = _yaml_input(data)
+    for doc in yaml.safe_load_all(stream) if limits is None else limited_load_all(stream, limits):
+        empty = False
+        yield doc
+    if empty:
+        yield None
 
-def _validate_clusters(doc: dict[str, Any], root: str) -> list[Finding]:
-    f: list[Finding] = []
-    clusters = doc.get("clusters")
-    if not isinstance(clusters, list):
-        return f
-    for i, cl in enumerate(clusters):
-        loc = f"{root}.clusters[{i}]"
-        if not isinstance(cl, dict):
-            f.append(Finding(code="DLT430", message="clusters entries must be objects", path=loc))
-            continue
-        forbidden = CLUSTER_FORBIDDEN_FIELDS.intersection(cl.keys())
-        if forbidden:
-            f.append(
-                Finding(
-                    code="DLT431",
-                    message="These cluster fields are managed by Lakeflow and must not be set: "
-                    + ", ".join(sorted(forbidden)),
-                    path=loc,
-                )
-            )
 
-        nw = cl.get("num_workers")
-        as_ = cl.get("autoscale")
-        if nw is not None and not isinstance(nw, int):
-            f.append(Finding(code="DLT460", message="num_workers must be an integer", path=f"{loc}.num_workers"))
-        if isinstance(nw, int) and nw < 0:
-            f.append(Finding(code="DLT461", message="num_workers must be >= 0", path=f"{loc}.num_workers"))
-
-        if as_ is not None and not isinstance(as_, dict):
-            f.append(
-                Finding(
-                    code="DLT462",
-                    message="autoscale must be an object with 'min_workers' and 'max_workers'",
-                    path=f"{loc}.autoscale",
-                )
-            )
-        elif isinstance(as_, dict):
-            mw = as_.get("min_workers")
-            xw = as_.get("max_workers")
-            if not (isinstance(mw, int) and isinstance(xw, int)):
-                f.append(
-                    Finding(
-                        code="DLT463",
-                        message="autoscale.min_workers and autoscale.max_workers must be integers",
-                        path=f"{loc}.autoscale",
-                    )
-                )
-            else:
-                if mw < 0 or xw < 0:
-                    f.append(
-                        Finding(
-                            code="DLT464", message="autoscale min/max workers must be >= 0", path=f"{loc}.autoscale"
-                        )
-                    )
-                if mw > xw:
-                    f.append(
-                        Finding(
-                            code="DLT465",
-                            message="autoscale.min_workers must be <= autoscale.max_workers",
-                            path=f"{loc}.autoscale",
-                        )
-                    )
-        if isinstance(nw, int) and isinstance(as_, dict):
-            f.append(
-                Finding(
-                    code="DLT466",
-                    message="Specify either 'num_workers' or 'autoscale', not both",
-                    path=loc,
-                    severity=Severity.WARNING,
-                )
-            )
+ValueType = str | bool | int | list | dict
 
-        for fld in ("node_type_id", "driver_node_type_id", "policy_id"):
-            if fld in cl and not isinstance(cl[fld], str):
-                f.append(Finding(code="DLT467", message=f"{fld} must be a string", path=f"{loc}.{fld}"))
-
-        for mapfld in ("spark_conf", "custom_tags"):
-            m = cl.get(mapfld)
-            if m is not None:  # noqa SIM102
-                if (
-                    not isinstance(m, dict)
-                    or not all(isinstance(k, str) for k in m)
-                    or not all(isinstance(v, str) for v in m.values())
-                ):
-                    f.append(
-                        Finding(
-                            code="DLT468",
-                            message=f"{mapfld} must be a mapping of string->string",
-                            path=f"{loc}.{mapfld}",
-                        )
-                    )
-    return f
+_VALIDATORS = {STANDALONE.name: VALIDATE_STANDALONE, PIPELINE_OBJ.name: VALIDATE_PIPELINE_OBJ}
 
 
-ValueType = str | bool | int | list | dict
+# ---- Rule runner -----------------------------------------------------------
+def _render(issue: Issue, file: str, severity: Severity | None = None, document: int | None = None) -> Finding:
+    """
+    Turn a validator `Issue` into a `Finding`; message and path are only rendered when read. The
+    parts come from the validators and the rule registry, so they are not validated again.
+    """
+    return Finding.from_issue(issue, file, severity or issue.severity or RULES[issue.code].default_severity, document)
 
 
-# ---- Rule runner -----------------------------------------------------------
 def check_expected_type(v: ValueType, root: str, k: str, expected: ValueType, f: list[Finding]) -> None:
     """Check if value is of expected type, append to findings if not."""
+    issues: list[Issue] = []
+    field_checker(expected)(v, (), k, issues)
+    f.extend(_render(i, root) for i in issues)
 
-    if isinstance(v, str) and v.startswith("${"):
-        return
-
-    if expected is str and not isinstance(v, str):
-        f.append(
-            Finding(code="DLT100", message=f"Field '{k}' must be a string, got {_type_name(v)}", path=f"{root}.{k}")
-        )
-    elif expected is bool and not isinstance(v, bool):
-        f.append(
-            Finding(code="DLT101", message=f"Field '{k}' must be a boolean, got {_type_name(v)}", path=f"{root}.{k}")
-        )
-    elif expected is int and not (isinstance(v, int) or (isinstance(v, str) and v.isdigit())):
-        f.append(
-            Finding(
-                code="DLT102",
-                message=f"Field '{k}' must be an integer, got {_type_name(v)}",
-                path=f"{root}.{k}",
-            )
-        )
-    elif expected is list and not isinstance(v, list):
-        f.append(
-            Finding(
-                code="DLT103",
-                message=f"Field '{k}' must be a list/array, got {_type_name(v)}",
-                path=f"{root}.{k}",
-            )
-        )
-    elif expected is dict and not isinstance(v, dict):
-        f.append(
-            Finding(
-                code="DLT104",
-                message=f"Field '{k}' must be a mapping/object, got {_type_name(v)}",
-                path=f"{root}.{k}",
-            )
-        )
 
+def _lint_schema(doc: dict[str, Any], level: Level, *, loc: Loc = ()) -> list[Issue]:
+    f: list[Issue] = []
+    _VALIDATORS[level.name](doc, loc, f)
+    return f
 
-def _lint_schema(doc: dict[str, Any], known_fields: dict[str, ValueType], *, root: str) -> list[Finding]:
-    f: list[Finding] = []
 
-    for k, v in doc.items():
-        if k not in known_fields:
-            f.append(
-                Finding(
-                    code="DLT010",
-                    message=f"Unknown top-level field '{k}'",
-                    path=f"{root}.{k}",
-                    severity=Severity.WARNING,
-                )
-            )
-        else:
-            check_expected_type(v, root, k, known_fields[k], f)
-
-    if "channel" in doc and isinstance(doc["channel"], str):  # noqa SIM102
-        if doc["channel"] not in CHANNEL_VALUES:
-            f.append(
-                Finding(
-                    code="DLT200", message=f"channel must be one of {sorted(CHANNEL_VALUES)}", path=f"{root}.channel"
-                )
-            )
+def _pipeline_loc(pid: Any) -> Loc:  # noqa ANN401
+    return ("resources", "pipelines", pid if isinstance(pid, str) else str(pid))
 
-    if "edition" in doc and isinstance(doc["edition"], str):  # noqa SIM102
-        if doc["edition"] not in EDITION_VALUES:
-            f.append(
-                Finding(
-                    code="DLT201", message=f"edition must be one of {sorted(EDITION_VALUES)}", path=f"{root}.edition"
-                )
-            )
 
-    if "pipelines.trigger.interval" in doc and isinstance(doc["pipelines.trigger.interval"], str):  # noqa SIM102
-        if not TRIGGER_INTERVAL_RE.match(doc["pipelines.trigger.interval"]):
-            f.append(
-                Finding(
-                    code="DLT202",
-                    message="pipelines.trigger.interval must be like '10 minutes' | '1 hour' | '30 seconds'",
-                    path=f"{root}.pipelines.trigger.interval",
-                )
-            )
-
-    if "trigger" in doc:
-        if not isinstance(doc["trigger"], dict):
-            f.append(Finding(code="DLT104", message="Field 'trigger' must be a mapping/object", path=f"{root}.trigger"))
-        else:
-            ti = doc["trigger"].get("interval")
-            if isinstance(ti, str) and not TRIGGER_INTERVAL_RE.match(ti):
-                f.append(
-                    Finding(
-                        code="DLT202",
-                        message="trigger.interval must be like '10 minutes' | '1 hour' | '30 seconds'",
-                        path=f"{root}.trigger.interval",
-                    )
-                )
-
-    has_modern = ("catalog" in doc) or ("schema" in doc)
-    has_legacy = ("target" in doc) or ("storage" in doc)
-    if has_modern and has_legacy:
-        f.append(
-            Finding(
-                code="DLT300",
-                message="Use either modern (catalog/schema) or legacy (target/storage) publishing, not both",
-                path=root,
-            )
-        )
+def _pipeline_obj_issues(pid: Any, pobj: Any) -> list[Issue]:  # noqa ANN401
+    """Issues for the bundle pipeline ``resources.pipelines.<pid>``."""
+    loc = _pipeline_loc(pid)
+    if not isinstance(pobj, dict):
+        return [Issue("DLT002", loc, "Pipeline '{}' must be an object", (pid,), Severity.ERROR)]
+    return _lint_schema(pobj, PIPELINE_OBJ, loc=loc)
 
-    if "name" not in doc:
-        f.append(
-            Finding(code="DLT400", message="Missing recommended field 'name'", path=root, severity=Severity.WARNING)
-        )
 
-    for key in (
-        "pipelines.maxFlowRetryAttempts",
-        "pipelines.numUpdateRetryAttempts",
-    ):
-        if key in doc and isinstance(doc[key], int) and doc[key] < 0:
-            f.append(Finding(code="DLT401", message=f"{key} must be >= 0", path=f"{root}.{key}"))
-
-    if isinstance(doc.get("configuration"), dict):
-        for ck, cv in doc["configuration"].items():
-            if not isinstance(ck, str):
-                f.append(
-                    Finding(code="DLT410", message="configuration keys must be strings", path=f"{root}.configuration")
-                )
-                break
-
-            if ck in KNOWN_FIELDS_PIPELINE_CONFIGURATION_OBJ:
-                check_expected_type(cv, root, ck, KNOWN_FIELDS_PIPELINE_CONFIGURATION_OBJ[ck], f)
-
-            elif not isinstance(cv, str | int | float | bool):
-                f.append(
-                    Finding(
-                        code="DLT411",
-                        message=f"configuration value for '{ck}' should be a scalar (string/number/bool)",
-                        path=f"{root}.configuration.{ck}",
-                        severity=Severity.WARNING,
-                    )
-                )
-
-    f.extend(_validate_libraries(doc, root))
-    f.extend(_validate_notifications(doc, root))
-    f.extend(_validate_clusters(doc, root))
-    return f
+def _may_share(path: Path, data: Buffer) -> bool:
+    """
+    Whether a document loaded from ``data`` can hold shared objects: only YAML anchors and aliases
+    make them, and neither can be written without an ``&``.
+    """
+    return path.suffix.lower() != ".json" and data.find(b"&") != -1
 
 
-def lint_pipeline(doc: Any, *, root: str = "$") -> list[Finding]:  # noqa ANN401
-    findings: list[Finding] = []
+def _pipeline_issues(doc: Any) -> list[Issue]:  # noqa ANN401
+    issues: list[Issue] = []
 
     if not isinstance(doc, dict):
-        findings.append(Finding(code="DLT001", message="Top-level must be a mapping/object", path=root))
-        return findings
+        issues.append(Issue("DLT001", (), "Top-level must be a mapping/object", (), Severity.ERROR))
+        return issues
 
     resources = doc.get("resources")
     if isinstance(resources, dict) and isinstance(resources.get("pipelines"), dict):
         pipelines = resources["pipelines"]
         if not pipelines:
-            return findings
+            return issues
         for pid, pobj in pipelines.items():
-            if not isinstance(pobj, dict):
-                findings.append(
-                    Finding(
-                        code="DLT002",
-                        message=f"Pipeline '{pid}' must be an object",
-                        path=f"{root}.resources.pipelines.{pid}",
-                    )
-                )
-                continue
-            findings.extend(_lint_schema(pobj, KNOWN_FIELDS_PIPELINE_OBJ, root=f"{root}.resources.pipelines.{pid}"))
-        return findings
+            issues.extend(_pipeline_obj_issues(pid, pobj))
+        return issues
 
-    findings.extend(_lint_schema(doc, KNOWN_FIELDS_STANDALONE, root=root))
-    return findings
+    issues.extend(_lint_schema(doc, STANDALONE))
+    return issues
+
+
+def lint_pipeline(doc: Any, *, root: str = "$") -> list[Finding]:  # noqa ANN401
+    # Repeated clusters/libraries/notifications entries of the document are validated once
+    with memoized_subtrees():
+        return [_render(i, root) for i in _pipeline_issues(doc)]
 
 
 # ---- File discovery & orchestration ----------------------------------------
 
 
+PIPELINE_SUFFIXES = (".pipeline.yml", ".pipeline.yaml", ".pipeline.yml.resources", ".pipeline.yaml.resources")
+
+
 def find_pipeline_files(start_paths: Iterable[str]) -> list[Path]:
-    suffixes = (".pipeline.yml", ".pipeline.yaml", ".pipeline.yml.resources", ".pipeline.yaml.resources")
-    files: list[Path] = []
-    for sp in start_paths:
-        p = Path(sp)
-        if p.is_file():
-            if p.name.endswith(suffixes):
-                files.append(p)
-        elif p.is_dir():
+    """
+    Pipeline files under ``start_paths``; archives given explicitly are kept and linted member by member.
+
+    Explicit file names (e.g. thousands of them from pre-commit or ``--files-from``) are checked in
+    bulk: names without a pipeline or archive suffix are dropped as strings, and the rest are looked
+    up with one directory listing per parent directory instead of a stat call per file.
+    """
+    suffixes = PIPELINE_SUFFIXES
+    files: set[str] = set()  # as str(Path), so sorting and de-duplication stay on plain strings
+    dirs: list[Path] = []
+    by_parent: dict[str, list[str]] = {}
+    with span("discover"):
+        for sp in start_paths:
+            parent, name = os.path.split(sp)
+            if name.endswith(suffixes) or name.lower().endswith(ARCHIVE_SUFFIXES):
+                by_parent.setdefault(parent, []).append(name)
+                continue
+            p = Path(sp)
+            if p.is_dir():
+                dirs.append(p)
+        for parent, names in by_parent.items():
+            base = str(Path(parent))
+            entries = _list_dir(base)
+            for name in names:
+                entry = entries.get(name)
+                path = name if base == "." else os.path.join(base, name)
+                if entry is None:
+                    # Not listed under that spelling (e.g. a case-insensitive filesystem): check directly
+                    if os.path.isfile(path):
+                        files.add(path)
+                    elif os.path.isdir(path):
+                        dirs.append(Path(path))
+                elif entry.is_file():
+                    files.add(path)
+                elif entry.is_dir():
+                    dirs.append(Path(path))
+        for d in dirs:
             for suf in suffixes:
-                files.extend(p.rglob(f"*{suf}"))
-    return sorted(set(files), key=lambda x: str(x))
+                files.update(map(str, d.rglob(f"*{suf}")))
+        return [Path(f) for f in sorted(files)]
+
+
+def _list_dir(directory: str) -> dict[str, os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
 
 
-def lint_paths(paths: Iterable[str], *, cfg: ToolConfig | None = None) -> list[Finding]:
+def _require_findings(doc: Any, require: list[str]) -> list[Issue]:  # noqa ANN401
+    """'require' is a simple existence check at the pipeline object level(s)."""
+    findings: list[Issue] = []
+    if not isinstance(doc, dict) or not require:
+        return findings
+    res = doc.get("resources")
+    if isinstance(res, dict) and isinstance(res.get("pipelines"), dict):
+        for pid, pobj in res["pipelines"].items():
+            if isinstance(pobj, dict):
+                findings.extend(_require_issues(pobj, _pipeline_loc(pid), require))
+    else:
+        findings.extend(_require_issues(doc, (), require))
+    return findings
+
+
+def _require_issues(obj: dict[str, Any], loc: Loc, require: list[str]) -> list[Issue]:
+    return [
+        Issue("DLT400", loc, "Missing required field '{}'", (need,), Severity.ERROR)
+        for need in require
+        if need not in obj
+    ]
+
+
+def _apply_config(
+    issues: list[Issue], root: str, cfg: ToolConfig, suppress_codes: frozenset[str], document: int | None = None
+) -> list[Finding]:
+    # Inline suppressions (file-level) and the (per-file) ignore policy drop issues before anything is rendered
+    policy = cfg.policy().for_file(root)
+    ignored, severities = policy.ignored, policy.severities
+    out: list[Finding] = []
+    for i in issues:
+        code = i.code.upper()
+        if code not in suppress_codes and code not in ignored:
+            out.append(_render(i, root, severities.get(code), document))
+    return out
+
+
+def _lint_doc(
+    doc: Any,  # noqa ANN401
+    root: str,
+    cfg: ToolConfig,
+    suppress_codes: frozenset[str],
+    document: int | None = None,
+) -> list[Finding]:
+    issues = _pipeline_issues(doc)
+    issues.extend(_require_findings(doc, cfg.require))
+    return _apply_config(issues, root, cfg, suppress_codes, document)
+
+
+def _lint_source(
+    path: Path,
+    data: Buffer,
+    cfg: ToolConfig,
+    index: PipelineIndex | None = None,
+    metrics: Metrics | None = None,
+) -> list[Finding]:
+    """
+    Parse raw file contents and lint every document in them (see `lint_paths`). A file that breaks
+    the config's loading limits gets a single DLT003 finding (after findings for earlier documents).
+    With ``metrics``, the time spent loading and linting is recorded for the file.
+    """
+    start = time.perf_counter()
+    suppress_codes = select_codes(scan_inline_suppressions(data, cfg.inline_disable_token))
+    limits = Limits.from_config(cfg)
+    # The subtree memo only pays off for anchored entries; without any it is pure overhead
+    memo = memoized_subtrees if _may_share(path, data) else nullcontext
+    out: list[Finding] = []
+    idx: int | None = None
+    lint_time = 0.0  # the rest of the elapsed time is loading
+    try:
+        limits.check_size(len(data))
+        if not cfg.multi_document:
+            doc, _ = _load_doc(path, data, limits)
+            t = time.perf_counter()
+            with span("lint", file=str(path)), memo():
+                if index is not None:
+                    index.add(doc, str(path), None, suppress_codes)
+                out = _lint_doc(doc, str(path), cfg, suppress_codes)
+            lint_time += time.perf_counter() - t
+        else:
+            for idx, doc in enumerate(_iter_docs(path, data, limits)):
+                t = time.perf_counter()
+                with span("lint", file=str(path), document=idx), memo():
+                    if index is not None:
+                        index.add(doc, str(path), idx, suppress_codes)
+                    out.extend(_lint_doc(doc, str(path), cfg, suppress_codes, idx))
+                lint_time += time.perf_counter() - t
+    except LimitExceeded as e:
+        # zero-based index of the document that was being loaded
+        document = (0 if idx is None else idx + 1) if cfg.multi_document else None
+        issue = Issue("DLT003", (), "Input limit exceeded: {}", (str(e),))
+        out.extend(_apply_config([issue], str(path), cfg, suppress_codes, document))
+    if metrics is not None:
+        metrics.observe_file(len(data), time.perf_counter() - start - lint_time, lint_time)
+    return out
+
+
+def _read_sources(files: Iterable[Path], cfg: ToolConfig) -> Iterator[tuple[Path, Buffer, Path]]:
+    """
+    ``(path, data, config path)`` for each file in order: runs of plain files go through `read_ahead`,
+    archives are streamed member by member and take their config from the archive's directory.
+    """
+    for archived, group in groupby(files, key=is_archive):
+        if archived:
+            for archive in group:
+                with closing(read_archive(archive, PIPELINE_SUFFIXES, cfg.max_file_bytes)) as members:
+                    for member, data in members:
+                        yield member, data, archive
+        else:
+            reads = read_ahead(
+                group,
+                workers=cfg.read_ahead,
+                max_bytes=cfg.read_ahead_bytes,
+                mmap_threshold=cfg.mmap_threshold,
+                size_limit=cfg.max_file_bytes,
+            )
+            with closing(reads):
+                for path, data in reads:
+                    yield path, data, path
+
+
+def iter_lint_files(
+    files: Iterable[Path],
+    *,
+    cfg: ToolConfig | None = None,
+    resolver: ConfigResolver | None = None,
+    index: PipelineIndex | None = None,
+    metrics: Metrics | None = None,
+) -> Iterator[tuple[Path, list[Finding]]]:
+    """
+    Lint already-discovered pipeline ``files`` and yield ``(path, findings)`` per file as soon as it is
+    linted, so callers can stream results without holding every finding. See `lint_paths`.
+    Closing the iterator early stops outstanding read-ahead work. With an ``index``, every linted
+    document is also added to it for `cross_file_findings`; with ``metrics``, per-file sizes and
+    load/lint durations are recorded.
+    """
+    cfg = cfg or ToolConfig()
+    reads = _read_sources(files, cfg)
+    try:
+        for path, data, cfg_path in reads:
+            try:
+                with span("file", file=str(path)):
+                    file_cfg = cfg if resolver is None else resolver.for_path(cfg_path)
+                    if cfg.max_file_bytes and len(data) > cfg.max_file_bytes:
+                        # Reads stop at the run-wide limit: report it even where the file's config allows more
+                        file_cfg = replace(file_cfg, max_file_bytes=cfg.max_file_bytes)
+                    findings = _lint_source(path, data, file_cfg, index, metrics)
+            finally:
+                close_source(data)
+            yield path, findings
+    finally:
+        reads.close()
+
+
+def cross_file_findings(
+    index: PipelineIndex, *, cfg: ToolConfig | None = None, resolver: ConfigResolver | None = None
+) -> Iterator[tuple[Path, list[Finding]]]:
+    """
+    Findings for pipeline ids, names and publish destinations defined more than once across the
+    documents in ``index`` (DLT5xx), grouped per file in path order, after each file's config and
+    inline suppressions are applied.
+    """
+    cfg = cfg or ToolConfig()
+    by_file: dict[tuple[str, int], list[Issue]] = {}
+    with span("cross_file"):
+        for ref, issue in index.issues():
+            by_file.setdefault((ref.file, ref.document), []).append(issue)
+    for (file, document), issues in sorted(by_file.items()):
+        file_cfg = cfg if resolver is None else resolver.for_path(Path(file))
+        suppressed = index.suppressed.get(file, frozenset())
+        findings = _apply_config(issues, file, file_cfg, suppressed, None if document < 0 else document)
+        if findings:
+            yield Path(file), findings
+
+
+def lint_paths(
+    paths: Iterable[str],
+    *,
+    cfg: ToolConfig | None = None,
+    resolver: ConfigResolver | None = None,
+    cross_file: bool = False,
+) -> list[Finding]:
     """
     Lint and return findings, after applying:
       - inline suppressions (file-level)
       - config.ignore
       - config.severity_overrides
       - config.require (fields required; missing => DLT400-style warning/error depending on override)
+
+    With ``cfg.multi_document`` every document of a YAML stream is linted lazily and its
+    findings carry the zero-based ``document`` index.
+
+    With ``cfg.read_ahead`` > 0, file bytes are prefetched on that many threads while earlier
+    files are parsed and linted; findings keep the same order. Files of at least
+    ``cfg.mmap_threshold`` bytes are memory-mapped rather than read into the heap.
+
+    With a ``resolver``, each file is linted with the config resolved for its directory
+    (see `ConfigResolver`); ``cfg`` then only supplies the run-wide read settings.
+
+    With ``cross_file``, duplicate pipeline ids/names and shared publish destinations across all the
+    files are reported after the per-file findings (see `cross_file_findings`).
+    """
+    index = PipelineIndex() if cross_file else None
+    results = iter_lint_files(find_pipeline_files(paths), cfg=cfg, resolver=resolver, index=index)
+    findings = [f for _, file_findings in results for f in file_findings]
+    if index is not None:
+        findings.extend(
+            f for _, file_findings in cross_file_findings(index, cfg=cfg, resolver=resolver) for f in file_findings
+        )
+    return findings
+
+
+def iter_lint_snapshot(path: Path, *, cfg: ToolConfig | None = None) -> Iterator[tuple[str, list[Finding]]]:
+    """
+    Lint a ``bundle validate -o json`` snapshot one pipeline at a time, yielding
+    ``(pipeline id, findings)`` as each ``resources.pipelines`` entry is read from the file. Only
+    that entry is decoded, so memory stays flat however large the snapshot is. Each pipeline is
+    checked like a bundle pipeline object, with config ignore/override/require applied.
+    """
+    cfg = cfg or ToolConfig()
+    root = str(path)
+    with path.open("rb") as fh:
+        for pid, pobj in iter_snapshot_pipelines(fh):
+            issues = _pipeline_obj_issues(pid, pobj)
+            if isinstance(pobj, dict):
+                issues.extend(_require_issues(pobj, _pipeline_loc(pid), cfg.require))
+            yield pid, _apply_config(issues, root, cfg, frozenset())
+
+
+Document = bytes | str | dict[str, Any]
+
+
+def iter_lint_documents(
+    docs: Iterable[tuple[str, Document]], *, cfg: ToolConfig | None = None
+) -> Iterator[tuple[str, list[Finding]]]:
+    """
+    Lint in-memory specs without touching the filesystem, yielding ``(name, findings)`` per input
+    as soon as it is linted. Raw ``bytes``/``str`` are parsed like a file called ``name`` (JSON when
+    it ends with ``.json``, YAML otherwise) and honour inline suppressions; anything else is taken to
+    be an already-parsed document. Config ignore/override/require are applied as in `lint_paths`.
     """
     cfg = cfg or ToolConfig()
-    all_findings: list[Finding] = []
-
-    for path in find_pipeline_files(paths):
-        suppress_codes = set(read_inline_suppressions(path, cfg.inline_disable_token))
-        doc, _ = _load_doc(path)
-        findings = lint_pipeline(doc, root=str(path))
-
-        # Apply 'require' (simple existence check at the object level(s))
-        if isinstance(doc, dict) and cfg.require:
-            res = doc.get("resources")
-            if isinstance(res, dict) and isinstance(res.get("pipelines"), dict):
-                for pid, pobj in res["pipelines"].items():
-                    if not isinstance(pobj, dict):
-                        continue
-                    for need in cfg.require:
-                        if need not in pobj:
-                            findings.append(
-                                Finding(
-                                    code="DLT400",
-                                    message=f"Missing required field '{need}'",
-                                    path=f"{path}.resources.pipelines.{pid}",
-                                    severity=Severity.ERROR,
-                                )
-                            )
-            else:
-                for need in cfg.require:
-                    if need not in doc:
-                        findings.append(
-                            Finding(
-                                code="DLT400",
-                                message=f"Missing required field '{need}'",
-                                path=str(path),
-                                severity=Severity.ERROR,
-                            )
-                        )
-
-        # Inline suppressions (file-level)
-        findings = [f for f in findings if f.code.upper() not in suppress_codes]
-
-        # Ignore list
-        if cfg.ignore:
-            ig = {c.upper() for c in cfg.ignore}
-            findings = [f for f in findings if f.code.upper() not in ig]
-
-        # Severity overrides
-        if cfg.severity_overrides:
-            so = {k.upper(): v for k, v in cfg.severity_overrides.items()}
-            for f in findings:
-                if f.code.upper() in so:
-                    f.severity = so[f.code.upper()]
-
-        all_findings.extend(findings)
-
-    return all_findings
+    for name, content in docs:
+        raw = content.encode("utf-8") if isinstance(content, str) else content
+        if isinstance(raw, bytes):
+            yield name, _lint_source(Path(name), raw, cfg)
+        else:
+            with memoized_subtrees():  # a parsed document can share objects however it was built
+                findings = _lint_doc(raw, name, cfg, frozenset())
+            yield name, findings
+
+
+def lint_documents(docs: Iterable[tuple[str, Document]], *, cfg: ToolConfig | None = None) -> list[Finding]:
+    """List-returning form of `iter_lint_documents`, the in-memory counterpart of `lint_paths`."""
+    return [f for _, findings in iter_lint_documents(docs, cfg=cfg) for f in findings]
 
 
 def severity_rank(s: Severity | str) -> int:
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any
+
+from .models import Issue, Loc, render_path
+
+# Cross-file checks. Each linted document adds its pipelines to a `PipelineIndex` (hash maps from
+# pipeline id, name and publish destination to where they are defined); once every file is in,
+# keys defined more than once become findings. Indexes built separately (e.g. per worker, or loaded
+# from a cache) are combined with `merge`.
+
+
+@dataclass(frozen=True, order=True)
+class PipelineRef:
+    file: str
+    document: int  # -1 when the file is not linted as a multi-document stream
+    loc: Loc
+
+
+def _known(v: Any) -> bool:  # noqa ANN401
+    # Unresolved bundle variables may differ per target, so they never collide
+    return isinstance(v, str) and bool(v) and "${" not in v
+
+
+def _destination(obj: dict[str, Any]) -> str | None:
+    catalog, schema, target = obj.get("catalog"), obj.get("schema"), obj.get("target")
+    if _known(catalog) and _known(schema):
+        return f"{catalog}.{schema}"
+    if _known(target):
+        return target
+    return None
+
+
+@dataclass
+class PipelineIndex:
+    ids: dict[str, list[PipelineRef]] = field(default_factory=dict)
+    names: dict[str, list[PipelineRef]] = field(default_factory=dict)
+    destinations: dict[str, list[PipelineRef]] = field(default_factory=dict)
+    # inline-suppressed codes per file, so cross-file findings honour them too
+    suppressed: dict[str, frozenset[str]] = field(default_factory=dict)
+
+    def add(
+        self: PipelineIndex,
+        doc: Any,  # noqa ANN401
+        file: str,
+        document: int | None = None,
+        suppressed: frozenset[str] = frozenset(),
+    ) -> None:
+        """Record the pipelines of one parsed document: bundle ``resources.pipelines`` or a standalone file."""
+        if not isinstance(doc, dict):
+            return
+        if suppressed:
+            self.suppressed[file] = suppressed
+        doc_idx = -1 if document is None else document
+        resources = doc.get("resources")
+        if isinstance(resources, dict) and isinstance(resources.get("pipelines"), dict):
+            for pid, pobj in resources["pipelines"].items():
+                key = pid if isinstance(pid, str) else str(pid)
+                ref = PipelineRef(file, doc_idx, ("resources", "pipelines", key))
+                self.ids.setdefault(key, []).append(ref)
+                if isinstance(pobj, dict):
+                    self._add_settings(pobj, ref)
+            return
+        ref = PipelineRef(file, doc_idx, ())
+        if _known(doc.get("id")):
+            self.ids.setdefault(doc["id"], []).append(ref)
+        self._add_settings(doc, ref)
+
+    def _add_settings(self: PipelineIndex, obj: dict[str, Any], ref: PipelineRef) -> None:
+        if _known(obj.get("name")):
+            self.names.setdefault(obj["name"], []).append(ref)
+        dest = _destination(obj)
+        if dest is not None:
+            self.destinations.setdefault(dest, []).append(ref)
+
+    def merge(self: PipelineIndex, other: PipelineIndex) -> PipelineIndex:
+        """Fold ``other`` into this index (in place) and return it."""
+        for mine, theirs in (
+            (self.ids, other.ids),
+            (self.names, other.names),
+            (self.destinations, other.destinations),
+        ):
+            for key, refs in theirs.items():
+                mine.setdefault(key, []).extend(refs)
+        self.suppressed.update(other.suppressed)
+        return self
+
+    def by_file(self: PipelineIndex) -> dict[str, PipelineIndex]:
+        """Split into one index per file, the inverse of `merge`."""
+        parts: dict[str, PipelineIndex] = {}
+        for table, pick in (
+            (self.ids, attrgetter("ids")),
+            (self.names, attrgetter("names")),
+            (self.destinations, attrgetter("destinations")),
+        ):
+            for key, refs in table.items():
+                for ref in refs:
+                    pick(parts.setdefault(ref.file, PipelineIndex())).setdefault(key, []).append(ref)
+        for file, codes in self.suppressed.items():
+            parts.setdefault(file, PipelineIndex()).suppressed[file] = codes
+        return parts
+
+    def issues(self: PipelineIndex) -> Iterator[tuple[PipelineRef, Issue]]:
+        """
+        One issue per definition after the first (in file/document/location order, so the result
+        does not depend on the order files were added or merged) of a duplicated key.
+        """
+        checks = (
+            (self.ids, "DLT500", "Pipeline id '{}' is also defined at {}"),
+            (self.names, "DLT501", "Pipeline name '{}' is also used at {}"),
+            (self.destinations, "DLT502", "Pipeline publishes to '{}', as does {}"),
+        )
+        for table, code, template in checks:
+            for key in sorted(k for k, refs in table.items() if len(refs) > 1):
+                first, *rest = sorted(table[key])
+                where = render_path(first.file, first.loc)
+                for ref in rest:
+                    yield ref, Issue(code, ref.loc, template, (key, where))
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from types import TracebackType
+from typing import TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+from .core import severity_rank
+from .models import Finding, Severity
+
+# JUnit XML report (`--format junit`) for CI systems that render test results: every linted file is a
+# test case, failing once it has findings at or above `--fail-on`. Cases are written as files finish,
+# so the report never exists as a tree in memory. The suite therefore carries no up-front
+# tests/failures totals; consumers count the cases.
+
+# Characters XML 1.0 cannot carry at all, even escaped (messages may quote arbitrary YAML values)
+_INVALID_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+
+def _text(s: str) -> str:
+    return escape(_INVALID_XML.sub("\ufffd", s))
+
+
+def _attr(s: str) -> str:
+    return quoteattr(_INVALID_XML.sub("\ufffd", s))
+
+
+def _line(f: Finding) -> str:
+    loc = f.path if f.document is None else f"{f.path} (document {f.document})"
+    return f"{Severity(f.severity).value} {f.code} {loc}: {f.message}"
+
+
+class JUnitWriter:
+    """Streams one ``<testsuite>`` to ``out``; use as a context manager so the document is always closed."""
+
+    def __init__(self: JUnitWriter, out: TextIO, fail_on: Severity, name: str = "dltlint") -> None:
+        self.out = out
+        self.threshold = severity_rank(fail_on)
+        self.name = name
+        self.tests = 0
+        self.failed = 0
+
+    def __enter__(self: JUnitWriter) -> JUnitWriter:
+        self.out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.out.write(f"<testsuites name={_attr(self.name)}>\n  <testsuite name={_attr(self.name)}>\n")
+        return self
+
+    def __exit__(
+        self: JUnitWriter,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.out.write("  </testsuite>\n</testsuites>\n")
+        self.out.flush()
+
+    def testcase(
+        self: JUnitWriter, name: str, findings: list[Finding], *, classname: str = "dltlint", file: str | None = None
+    ) -> None:
+        """
+        Write the case for ``name`` (in ``file``, default ``name``): a ``<failure>`` per finding at or
+        above the threshold, the other findings as ``<system-out>`` lines.
+        """
+        failures = [f for f in findings if severity_rank(f.severity) >= self.threshold]
+        self.tests += 1
+        self.failed += bool(failures)
+        head = f"    <testcase classname={_attr(classname)} name={_attr(name)} file={_attr(name if file is None else file)}"
+        if not findings:
+            self.out.write(head + "/>\n")
+            return
+        parts = [head + ">\n"]
+        for f in failures:
+            parts.append(
+                f"      <failure type={_attr(f.code)} message={_attr(f'{f.code} {f.message}')}>"
+                f"{_text(_line(f))}</failure>\n"
+            )
+        others = [f for f in findings if severity_rank(f.severity) < self.threshold]
+        if others:
+            parts.append(f"      <system-out>{_text(chr(10).join(map(_line, others)))}</system-out>\n")
+        parts.append("    </testcase>\n")
+        self.out.write("".join(parts))
+        self.out.flush()
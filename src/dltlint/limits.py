@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+if TYPE_CHECKING:
+    from .config import ToolConfig
+
+# Resource limits for loading untrusted pipeline files. YAML anchors let a few hundred bytes describe
+# a structure with billions of nodes ("billion laughs"); PyYAML shares the aliased objects, but every
+# consumer that walks the result pays for the full expansion. The loader below measures the expanded
+# size while composing, and gives up as soon as a limit is crossed.
+
+# Compose nodes between two clock reads for the time budget
+_CLOCK_EVERY = 1024
+
+
+class LimitExceeded(ValueError):  # noqa N818
+    """A file broke one of the configured `Limits`; reported as a DLT003 finding."""
+
+
+@dataclass(frozen=True)
+class Limits:
+    """Per-file loading limits; ``0`` disables a limit."""
+
+    max_bytes: int = 0
+    max_aliases: int = 0
+    max_depth: int = 0
+    max_nodes: int = 0  # after alias expansion
+    time_budget: float = 0.0  # seconds spent loading
+
+    @classmethod
+    def from_config(cls: type[Limits], cfg: ToolConfig) -> Limits:
+        return cls(cfg.max_file_bytes, cfg.max_aliases, cfg.max_depth, cfg.max_nodes, cfg.time_budget)
+
+    def check_size(self: Limits, size: int) -> None:
+        if self.max_bytes and size > self.max_bytes:
+            # Readers stop at ``max_bytes + 1``, so ``size`` is only a lower bound
+            raise LimitExceeded(f"file is larger than the limit of {self.max_bytes} bytes")
+
+
+class LimitedLoader(yaml.SafeLoader):
+    """
+    `yaml.SafeLoader` that enforces `Limits` while composing the node graph. Node counts are per
+    document; the time budget only runs inside `loading` blocks, so time spent by whoever consumes
+    the documents in between does not count.
+    """
+
+    def __init__(self: LimitedLoader, stream: Any, limits: Limits) -> None:  # noqa ANN401
+        super().__init__(stream)
+        self.limits = limits
+        self._aliases = 0
+        self._depth = 0
+        self._spent = 0.0  # seconds spent in earlier `loading` blocks
+        self._deadline = 0.0
+        self._new_document()
+
+    def _new_document(self: LimitedLoader) -> None:
+        self._composed = 0  # nodes composed in this document
+        self._extra = 0  # nodes added by expanding its aliases
+        self._sizes: dict[int, int] = {}  # id(anchored node) -> its node count once aliases are expanded
+
+    @contextmanager
+    def loading(self: LimitedLoader) -> Iterator[None]:
+        """Load (the next) document inside the block: its node counts start at zero and the clock runs."""
+        self._new_document()
+        start = time.monotonic()
+        if self.limits.time_budget:
+            self._deadline = start + self.limits.time_budget - self._spent
+        try:
+            yield
+        finally:
+            self._spent += time.monotonic() - start
+
+    def compose_node(self: LimitedLoader, parent: yaml.Node | None, index: Any) -> yaml.Node:  # noqa ANN401
+        limits = self.limits
+        event = self.peek_event()
+        if isinstance(event, yaml.AliasEvent):
+            self._aliases += 1
+            if limits.max_aliases and self._aliases > limits.max_aliases:
+                raise LimitExceeded(f"more than {limits.max_aliases} YAML aliases")
+            node = super().compose_node(parent, index)
+            self._extra += self._sizes.get(id(node), 1)
+            self._check_nodes()
+            return node
+        self._depth += 1
+        if limits.max_depth and self._depth > limits.max_depth:
+            raise LimitExceeded(f"nesting deeper than {limits.max_depth} levels")
+        # Only anchored nodes can be aliased, so only their expanded size is kept
+        before = None if event.anchor is None else self._composed + self._extra
+        try:
+            node = super().compose_node(parent, index)
+        finally:
+            self._depth -= 1
+        self._composed = composed = self._composed + 1
+        if before is not None:
+            self._sizes[id(node)] = composed + self._extra - before
+        if limits.max_nodes and composed + self._extra > limits.max_nodes:
+            self._check_nodes()
+        if self._deadline and composed % _CLOCK_EVERY == 0 and time.monotonic() > self._deadline:
+            raise LimitExceeded(f"loading took longer than {limits.time_budget:g}s")
+        return node
+
+    def _check_nodes(self: LimitedLoader) -> None:
+        max_nodes = self.limits.max_nodes
+        if max_nodes and self._composed + self._extra > max_nodes:
+            raise LimitExceeded(f"more than {max_nodes} nodes once aliases are expanded")
+
+
+def _loader(stream: Any, limits: Limits) -> yaml.SafeLoader:  # noqa ANN401
+    """A `LimitedLoader`, or a plain `yaml.SafeLoader` when no limit applies while loading."""
+    if limits.max_aliases or limits.max_depth or limits.max_nodes or limits.time_budget:
+        return LimitedLoader(stream, limits)
+    return yaml.SafeLoader(stream)
+
+
+def load_all(stream: Any, limits: Limits) -> Iterator[Any]:  # noqa ANN401
+    """Like `yaml.safe_load_all`, under ``limits``; only the time spent loading counts against the budget."""
+    loader = _loader(stream, limits)
+    try:
+        while True:
+            with loader.loading() if isinstance(loader, LimitedLoader) else nullcontext():
+                if not loader.check_data():
+                    return
+                doc = loader.get_data()
+            yield doc
+    except RecursionError as e:
+        raise LimitExceeded("document nesting is too deep to load") from e
+    finally:
+        loader.dispose()
+
+
+def load(stream: Any, limits: Limits) -> Any:  # noqa ANN401
+    """Like `yaml.safe_load`, under ``limits``."""
+    loader = _loader(stream, limits)
+    try:
+        with loader.loading() if isinstance(loader, LimitedLoader) else nullcontext():
+            return loader.get_single_data()
+    except RecursionError as e:
+        raise LimitExceeded("document nesting is too deep to load") from e
+    finally:
+        loader.dispose()
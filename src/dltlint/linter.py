@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .config import ToolConfig
+from .core import cross_file_findings, find_pipeline_files, iter_lint_files, lint_documents
+from .index import PipelineIndex
+from .models import Finding
+from .reader import is_archive
+
+# (path, st_mtime_ns, st_size) of a pipeline file or archive as it was linted
+FileKey = tuple[str, int, int]
+# its findings, and with ``cfg.cross_file`` the pipelines it defines
+Entry = tuple[tuple[Finding, ...], PipelineIndex | None]
+
+
+def _file_key(path: str) -> FileKey | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return path, st.st_mtime_ns, st.st_size
+
+
+class Linter:
+    """
+    Long-lived linter for services that check specs over and over, safe to share between threads.
+
+    Built once from a `ToolConfig`, whose ignore/severity policy is compiled up front (the rule
+    validators themselves are compiled at import). `lint_files` keeps the findings of the last
+    ``cache_size`` files in an LRU keyed by ``(path, mtime, size)``: a file that has not changed
+    since it was linted is neither read nor parsed again. With ``cfg.cross_file`` the cache also
+    keeps the pipelines each file defines, and duplicates across the files of a call are reported
+    after the per-file findings (`lint_text` and `lint_doc` check their input alone). The config is
+    fixed for the life of the instance, so treat it as read-only; returned `Finding` objects may be
+    shared between calls.
+    """
+
+    def __init__(self: Linter, cfg: ToolConfig | None = None, *, cache_size: int = 1024) -> None:
+        self.cfg = cfg or ToolConfig()
+        self.cfg.policy()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[FileKey, Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lint_files(self: Linter, paths: Iterable[str | Path]) -> list[Finding]:
+        """Findings for the pipeline files and archives in ``paths`` (directories are searched), as `lint_paths`."""
+        files = find_pipeline_files(str(p) for p in paths)
+        keys = {str(f): _file_key(str(f)) for f in files}
+        found: dict[str, Entry] = {}
+        with self._lock:
+            for name, key in keys.items():
+                cached = None if key is None else self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    found[name] = cached
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        stale = [f for f in files if str(f) not in found]
+        if stale:
+            fresh = self._lint_stale(stale)
+            found.update(fresh)
+            # Only cache files that were not modified while they were being linted
+            unchanged = [name for name in fresh if keys[name] is not None and _file_key(name) == keys[name]]
+            with self._lock:
+                for name in unchanged:
+                    self._store(keys[name], fresh[name])
+        out = [f for name in keys for f in found[name][0]]
+        if self.cfg.cross_file:
+            index = PipelineIndex()
+            for name in keys:
+                part = found[name][1]
+                if part is not None:
+                    index.merge(part)
+            out.extend(f for _, findings in cross_file_findings(index, cfg=self.cfg) for f in findings)
+        return out
+
+    def _lint_stale(self: Linter, files: list[Path]) -> dict[str, Entry]:
+        out: dict[str, list[Finding]] = {str(f): [] for f in files}
+        archives = [str(f) for f in files if is_archive(f)]
+
+        def owner(name: str) -> str:
+            # a member of an archive is reported as archive!member
+            return name if name in out else next(a for a in archives if name.startswith(a + "!"))
+
+        index = PipelineIndex() if self.cfg.cross_file else None
+        for path, findings in iter_lint_files(files, cfg=self.cfg, index=index):
+            out[owner(str(path))].extend(findings)
+        parts: dict[str, PipelineIndex] = {}
+        if index is not None:
+            parts = {name: PipelineIndex() for name in out}
+            for file, part in index.by_file().items():
+                parts[owner(file)].merge(part)
+        return {name: (tuple(findings), parts.get(name)) for name, findings in out.items()}
+
+    def _store(self: Linter, key: FileKey, entry: Entry) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def lint_text(self: Linter, text: str | bytes, name: str = "<text>") -> list[Finding]:
+        """Findings for YAML/JSON ``text`` linted as a file called ``name`` (inline suppressions apply)."""
+        return lint_documents([(name, text)], cfg=self.cfg)
+
+    def lint_doc(self: Linter, doc: Any, name: str = "<doc>") -> list[Finding]:  # noqa ANN401
+        """Findings for an already-parsed document, reported under ``name`` (``str``/``bytes`` are parsed as text)."""
+        return lint_documents([(name, doc)], cfg=self.cfg)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import heapq
+import json
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from pathlib import Path
+from typing import IO
+
+from .config import ConfigResolver
+from .core import severity_rank
+from .models import Finding
+from .snapshot import iter_json_records
+
+# Combine the JSON results of several dltlint runs (`dltlint merge`). Each input is streamed record by
+# record, re-checked against the current ignore/severity policy, and sorted in bounded chunks that
+# spill to temporary files once they grow past `CHUNK_FINDINGS`; the sorted runs are then merged
+# lazily and duplicates, which end up adjacent, are dropped.
+
+# Findings held in memory per input before a sorted run is written to disk
+CHUNK_FINDINGS = 50_000
+
+SortKey = tuple[str, int, str, str, str, int]
+
+
+def sort_key(f: Finding) -> SortKey:
+    """File, document, location, code and message; for duplicates the most severe sorts first."""
+    doc = -1 if f.document is None else f.document
+    return (f.file, doc, f.path, f.code, f.message, -severity_rank(f.severity))
+
+
+def _same(a: SortKey, b: SortKey) -> bool:
+    return a[:5] == b[:5]
+
+
+def iter_result_findings(fh: IO[bytes], name: str = "<input>") -> Iterator[Finding]:
+    """
+    Findings from dltlint JSON output: a ``--format json`` array, or JSON lines holding findings or
+    ``{..., "findings": [...]}`` records (``--snapshot`` / ``--stdin-ndjson`` output).
+    """
+    for n, record in enumerate(iter_json_records(fh), start=1):
+        if isinstance(record, dict) and "code" in record:
+            yield Finding.model_validate(record)
+        elif isinstance(record, dict) and isinstance(record.get("findings"), list):
+            yield from map(Finding.model_validate, record["findings"])
+        else:
+            raise ValueError(f"{name}: record {n} is not a dltlint finding or result record")
+
+
+def _apply_policy(findings: Iterable[Finding], resolver: ConfigResolver) -> Iterator[Finding]:
+    for f in findings:
+        policy = resolver.for_path(Path(f.file)).policy().for_file(f.file)
+        code = f.code.upper()
+        if code in policy.ignored:
+            continue
+        override = policy.severities.get(code)
+        yield f if override is None or override == f.severity else f.model_copy(update={"severity": override})
+
+
+def _spill(chunk: list[Finding], stack: ExitStack) -> Iterator[Finding]:
+    chunk.sort(key=sort_key)
+    tmp = stack.enter_context(tempfile.TemporaryFile("w+", encoding="utf-8"))  # noqa SIM115 (closed with the merge)
+    for f in chunk:
+        tmp.write(json.dumps(f.model_dump(mode="json", exclude={"path"})) + "\n")
+    tmp.seek(0)
+    return (Finding.model_validate_json(line) for line in tmp)
+
+
+def _sorted_runs(findings: Iterable[Finding], stack: ExitStack) -> list[Iterator[Finding]]:
+    runs: list[Iterator[Finding]] = []
+    chunk: list[Finding] = []
+    for f in findings:
+        chunk.append(f)
+        if len(chunk) >= CHUNK_FINDINGS:
+            runs.append(_spill(chunk, stack))
+            chunk = []
+    chunk.sort(key=sort_key)
+    runs.append(iter(chunk))
+    return runs
+
+
+def merge_results(inputs: Iterable[str], resolver: ConfigResolver) -> Iterator[Finding]:
+    """
+    Every distinct finding in the result files ``inputs`` (``-`` is stdin), after the policy each
+    file resolves to, in `sort_key` order.
+    """
+    with ExitStack() as stack:
+        runs: list[Iterator[Finding]] = []
+        for name in inputs:
+            fh = sys.stdin.buffer if name == "-" else stack.enter_context(Path(name).open("rb"))
+            findings = _apply_policy(iter_result_findings(fh, name), resolver)
+            runs.extend(_sorted_runs(findings, stack))
+        last: SortKey | None = None
+        for f in heapq.merge(*runs, key=sort_key):
+            key = sort_key(f)
+            if last is None or not _same(key, last):
+                yield f
+            last = key
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+
+from .models import Finding, Severity
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+# Run telemetry written as an OpenMetrics text file (`--metrics-file`), for textfile collectors to
+# scrape after scheduled runs. Everything is plain counters updated once per file, so collecting
+# costs a few clock reads per file whether or not the file is written.
+
+# Upper bounds (seconds) of the per-file parse/lint duration histogram buckets
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus/OpenMetrics sense."""
+
+    def __init__(self: Histogram, buckets: tuple[float, ...] = DURATION_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self: Histogram, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def samples(self: Histogram, name: str) -> list[str]:
+        lines = []
+        acc = 0
+        for le, n in zip((*map(_number, self.buckets), "+Inf"), self.counts, strict=True):
+            acc += n
+            lines.append(f'{name}_bucket{{le="{le}"}} {acc}')
+        lines.append(f"{name}_count {self.count}")
+        lines.append(f"{name}_sum {_number(self.sum)}")
+        return lines
+
+
+def _number(v: float) -> str:
+    return repr(float(v))
+
+
+def _label(v: str) -> str:
+    return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process, or None where the platform does not report it."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # bytes on macOS, KiB elsewhere
+
+
+class Metrics:
+    """Counters for one lint run; `render` formats them as OpenMetrics text."""
+
+    def __init__(self: Metrics) -> None:
+        self.started = time.monotonic()
+        self.files_discovered = 0
+        self.files_linted = 0
+        self.bytes_read = 0
+        self.parse_seconds = Histogram()
+        self.lint_seconds = Histogram()
+        self.findings: Counter[tuple[str, Severity]] = Counter()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def observe_file(self: Metrics, size: int, parse: float, lint: float) -> None:
+        """Record one linted file (or archive member) of ``size`` bytes."""
+        self.files_linted += 1
+        self.bytes_read += size
+        self.parse_seconds.observe(parse)
+        self.lint_seconds.observe(lint)
+
+    def add_findings(self: Metrics, findings: list[Finding]) -> None:
+        for f in findings:
+            self.findings[f.code, Severity(f.severity)] += 1
+
+    def render(self: Metrics) -> str:
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_: str, unit: str = "") -> None:
+            lines.append(f"# TYPE {name} {kind}")
+            if unit:
+                lines.append(f"# UNIT {name} {unit}")
+            lines.append(f"# HELP {name} {help_}")
+
+        family("dltlint_files_discovered", "gauge", "Pipeline files and archives found under the given paths.")
+        lines.append(f"dltlint_files_discovered {self.files_discovered}")
+        family("dltlint_files_linted", "counter", "Pipeline files (including archive members) parsed and linted.")
+        lines.append(f"dltlint_files_linted_total {self.files_linted}")
+        family("dltlint_read_bytes", "counter", "Bytes of pipeline files read.", "bytes")
+        lines.append(f"dltlint_read_bytes_total {self.bytes_read}")
+        family("dltlint_parse_seconds", "histogram", "Time spent loading YAML/JSON, per file.", "seconds")
+        lines.extend(self.parse_seconds.samples("dltlint_parse_seconds"))
+        family("dltlint_lint_seconds", "histogram", "Time spent validating loaded documents, per file.", "seconds")
+        lines.extend(self.lint_seconds.samples("dltlint_lint_seconds"))
+        family("dltlint_findings", "counter", "Findings reported, by code and severity.")
+        for (code, sev), n in sorted(self.findings.items(), key=lambda kv: (kv[0][0], kv[0][1].value)):
+            lines.append(f'dltlint_findings_total{{code="{_label(code)}",severity="{sev.value}"}} {n}')
+        family("dltlint_config_cache_hits", "counter", "Directory config lookups served from the resolver cache.")
+        lines.append(f"dltlint_config_cache_hits_total {self.cache_hits}")
+        family("dltlint_config_cache_misses", "counter", "Directory config lookups that had to read the disk.")
+        lines.append(f"dltlint_config_cache_misses_total {self.cache_misses}")
+        family("dltlint_run_seconds", "gauge", "Wall-clock duration of the run.", "seconds")
+        lines.append(f"dltlint_run_seconds {_number(time.monotonic() - self.started)}")
+        rss = peak_rss_bytes()
+        if rss is not None:
+            family("dltlint_peak_rss_bytes", "gauge", "Peak resident set size of the process.", "bytes")
+            lines.append(f"dltlint_peak_rss_bytes {rss}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self: Metrics, path: Path) -> None:
+        """Write `render` to ``path`` atomically, so a collector never scrapes a partial file."""
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, path)
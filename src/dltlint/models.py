@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field, computed_field
+
+# Location of a finding below its file: mapping keys, with ints for list indices.
+Loc = tuple[str | int, ...]
 
 
 class Severity(str, Enum):
@@ -12,11 +15,77 @@ class Severity(str, Enum):
     INFO = "info"
 
 
+class Issue(NamedTuple):
+    """
+    A raw finding as emitted by the validators, before config is applied. Cheap to build and to
+    discard; survivors become `Finding` objects. ``severity`` of ``None`` means the rule's default.
+    """
+
+    code: str
+    loc: Loc
+    template: str
+    args: tuple[Any, ...] = ()
+    severity: Severity | None = None
+
+
+def render_path(file: str, loc: Loc) -> str:
+    parts = [file]
+    for s in loc:
+        parts.append(f"[{s}]" if type(s) is int else "." + str(s))
+    return "".join(parts)
+
+
 class Finding(BaseModel):
     code: str
-    message: str
-    path: str
     severity: Severity = Severity.ERROR
+    document: int | None = None  # index within a multi-document YAML stream
+    # ``path=`` is accepted for a plain, already-rendered location
+    file: str = Field("", validation_alias=AliasChoices("file", "path"))
+    loc: Loc = ()
+    # ``message`` is rendered from these on first access and kept; ``message=`` sets a literal message
+    template: str = Field("", validation_alias=AliasChoices("template", "message"), exclude=True, repr=False)
+    args: tuple[Any, ...] = Field((), exclude=True, repr=False)
+
+    # The rendered strings are kept in the instance dict next to the fields (pydantic ignores extra
+    # keys there when comparing and dumping); functools.cached_property would take a lock per access
+
+    @computed_field
+    @property
+    def message(self: Finding) -> str:
+        d = self.__dict__
+        if "message" not in d:
+            d["message"] = self.template.format(*self.args) if self.args else self.template
+        return d["message"]
+
+    @computed_field
+    @property
+    def path(self: Finding) -> str:
+        d = self.__dict__
+        if "path" not in d:
+            d["path"] = render_path(self.file, self.loc)
+        return d["path"]
+
+    @classmethod
+    def from_issue(cls: type[Finding], issue: Issue, file: str, severity: Severity, document: int | None) -> Finding:
+        """
+        Build the finding for a validator `Issue` (with its final ``severity``) without validating the
+        parts again: several times cheaper than the constructor or `model_construct`.
+        """
+        f = cls.__new__(cls)
+        fields = {
+            "code": issue.code,
+            "severity": severity,
+            "document": document,
+            "file": file,
+            "loc": issue.loc,
+            "template": issue.template,
+            "args": issue.args,
+        }
+        object.__setattr__(f, "__dict__", fields)
+        object.__setattr__(f, "__pydantic_fields_set__", set(fields))
+        object.__setattr__(f, "__pydantic_extra__", None)
+        object.__setattr__(f, "__pydantic_private__", None)
+        return f
 
     def to_dict(self: Finding) -> dict[str, Any]:
         # Convenience for callers; uses Pydantic v2 model_dump under the hood
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .baseline import normalize_path
+from .models import Severity
+from .registry import RULES
+
+if TYPE_CHECKING:
+    from .config import ToolConfig
+
+# Policy = which codes are dropped and which severities are overridden, for a given file.
+# Code selectors are exact codes ("DLT400"), prefixes ("DLT4") or globs ("DLT4*", "DLT4?0");
+# they are expanded against the rule registry once, so applying a policy is a set/dict lookup.
+# Path patterns are globs relative to the directory of the config file that declared them (the
+# working directory for configs built in code): "*" stays within a directory, "**" spans
+# directories, and a pattern without "/" matches the file name in any directory below it.
+
+
+def _specificity(selector: str) -> int:
+    """Length of the literal part of a selector: more specific selectors win for severity overrides."""
+    return len(re.split(r"[*?\[]", selector, maxsplit=1)[0])
+
+
+@lru_cache(maxsize=1024)
+def _expand(selector: str) -> frozenset[str]:
+    sel = selector.strip().upper()
+    if not sel:
+        return frozenset()
+    if any(c in sel for c in "*?["):
+        rx = re.compile(_glob_regex(sel, path=False))
+        return frozenset(c for c in RULES if rx.fullmatch(c))
+    # Exact code, or a prefix of registered codes (ruff-style "DLT4")
+    return frozenset({sel, *(c for c in RULES if c.startswith(sel))})
+
+
+def select_codes(selectors: Iterable[str]) -> frozenset[str]:
+    """Every code matched by any of ``selectors`` (see module comment)."""
+    out: set[str] = set()
+    for s in selectors:
+        out |= _expand(s)
+    return frozenset(out)
+
+
+def _glob_regex(pattern: str, *, path: bool = True) -> str:
+    sep = "[^/]" if path else "."
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if path and pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if path and pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append(f"{sep}*")
+        elif c == "?":
+            out.append(sep)
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                out.append(pattern[i : end + 1].replace("[!", "[^", 1))
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def _root(directory: str | None) -> str:
+    return os.path.abspath(os.getcwd() if directory is None else directory).replace(os.sep, "/")
+
+
+def _matches(rx: re.Pattern[str], full: str, root: str) -> bool:
+    """Whether the absolute path ``full`` lies below ``root`` and matches ``rx`` relative to it."""
+    rel = normalize_path(full, root)
+    return rel != full and rx.match(rel) is not None
+
+
+def compile_path_glob(pattern: str, root: str | None = None) -> re.Pattern[str]:
+    """Glob ``pattern`` (relative to ``root``, default the working directory) as a regex over relative paths."""
+    pat = normalize_path(pattern, _root(root))
+    rx = _glob_regex(pat)
+    if "/" not in pat:
+        rx = "(?:.*/)?" + rx
+    return re.compile(rx + r"\Z")
+
+
+def _severities(overrides: Mapping[str, Severity]) -> dict[str, Severity]:
+    out: dict[str, Severity] = {}
+    for sel in sorted(overrides, key=_specificity):
+        sev = Severity(overrides[sel])
+        out.update(dict.fromkeys(_expand(sel), sev))
+    return out
+
+
+@dataclass(frozen=True)
+class FilePolicy:
+    """The policy for one file: codes to drop and per-code severity overrides."""
+
+    ignored: frozenset[str]
+    severities: Mapping[str, Severity]
+
+
+class Policy:
+    """
+    Suppression and severity policy compiled once from a `ToolConfig`:
+    ``ignore``/``severity_overrides`` plus ``per_file_ignores`` and ``per_file_severity_overrides``
+    keyed by path globs. `for_file` matches the path patterns once per file and memoizes the result
+    (files matching the same patterns share one `FilePolicy`), so each finding is a set/dict lookup.
+    """
+
+    def __init__(
+        self: Policy,
+        ignore: Iterable[str] = (),
+        severity_overrides: Mapping[str, Severity] | None = None,
+        per_file_ignores: Mapping[str, Iterable[str]] | None = None,
+        per_file_severity_overrides: Mapping[str, Mapping[str, Severity]] | None = None,
+    ) -> None:
+        self.ignored = select_codes(ignore)
+        self.severities = _severities(severity_overrides or {})
+        # (directory, compiled glob, codes dropped, severity overrides) in config order; later entries win
+        self._patterns: list[tuple[str, re.Pattern[str], frozenset[str], dict[str, Severity]]] = []
+        self._default = FilePolicy(self.ignored, self.severities)
+        self._by_match: dict[tuple[int, ...], FilePolicy] = {(): self._default}
+        self._by_file: dict[str, FilePolicy] = {}
+        self.add_per_file_ignores(per_file_ignores or {})
+        self.add_per_file_severity_overrides(per_file_severity_overrides or {})
+
+    @classmethod
+    def from_config(cls: type[Policy], cfg: ToolConfig) -> Policy:
+        policy = cls(cfg.ignore, cfg.severity_overrides)
+        policy.add_per_file_ignores(cfg.per_file_ignores, cfg.per_file_ignores_root)
+        policy.add_per_file_severity_overrides(cfg.per_file_severity_overrides, cfg.per_file_severity_overrides_root)
+        return policy
+
+    def add_per_file_ignores(self: Policy, patterns: Mapping[str, Iterable[str]], root: str | None = None) -> None:
+        """Drop codes in files matching the globs of ``patterns``, relative to ``root`` (default the working directory)."""
+        root = _root(root)
+        for pat, selectors in patterns.items():
+            self._add(root, compile_path_glob(pat, root), select_codes(selectors), {})
+
+    def add_per_file_severity_overrides(
+        self: Policy, patterns: Mapping[str, Mapping[str, Severity]], root: str | None = None
+    ) -> None:
+        """Override severities in files matching the globs of ``patterns``, relative to ``root``."""
+        root = _root(root)
+        for pat, overrides in patterns.items():
+            self._add(root, compile_path_glob(pat, root), frozenset(), _severities(overrides))
+
+    def _add(self: Policy, root: str, rx: re.Pattern[str], codes: frozenset[str], sevs: dict[str, Severity]) -> None:
+        self._patterns.append((root, rx, codes, sevs))
+        self._by_file.clear()
+
+    def for_file(self: Policy, path: str) -> FilePolicy:
+        if not self._patterns:
+            return self._default
+        fp = self._by_file.get(path)
+        if fp is None:
+            full = os.path.abspath(path).replace(os.sep, "/")
+            matched = tuple(i for i, (root, rx, _, _) in enumerate(self._patterns) if _matches(rx, full, root))
+            fp = self._by_match.get(matched)
+            if fp is None:
+                ignored = set(self.ignored)
+                severities = dict(self.severities)
+                for i in matched:
+                    _, _, codes, sevs = self._patterns[i]
+                    ignored |= codes
+                    severities.update(sevs)
+                fp = self._by_match[matched] = FilePolicy(frozenset(ignored), severities)
+            self._by_file[path] = fp
+        return fp
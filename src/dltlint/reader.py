@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import mmap
+import os
+import tarfile
+import zipfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO
+
+from .tracing import span
+
+# Raw file contents: plain bytes, or a read-only mapping for files above the mmap threshold.
+Buffer = bytes | mmap.mmap
+
+# Archives whose members can be linted in place, without extracting them to disk.
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+# Files kept in flight per reader thread; bounds the queue independently of the byte budget.
+_WINDOW_PER_WORKER = 4
+
+
+def _read_capped(fh: IO[bytes], size_limit: int) -> bytes:
+    # One byte past the limit is enough to tell that the input is too large
+    return fh.read(size_limit + 1) if size_limit > 0 else fh.read()
+
+
+def read_source(path: Path, mmap_threshold: int = 0, size_limit: int = 0) -> Buffer:
+    """
+    Read ``path`` into memory, or map it read-only when it is at least ``mmap_threshold`` bytes
+    (``0`` never maps). Mapped pages are faulted in on demand, so large files are never copied
+    wholesale into the heap. Reads stop after ``size_limit + 1`` bytes (``0`` reads everything),
+    enough for the caller to reject the file. Release the result with `close_source`.
+    """
+    with span("read", file=str(path)), path.open("rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if mmap_threshold <= 0 or size == 0 or size < mmap_threshold:
+            return _read_capped(fh, size_limit)
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def close_source(data: Buffer) -> None:
+    if isinstance(data, mmap.mmap):
+        data.close()
+
+
+def _buffered_bytes(pending: deque[tuple[Path, Future[Buffer]]]) -> int:
+    # Mapped files are not resident until touched, so only heap copies count against the budget.
+    total = 0
+    for _, fut in pending:
+        if fut.done() and fut.exception() is None:
+            data = fut.result()
+            if isinstance(data, bytes):
+                total += len(data)
+    return total
+
+
+def read_ahead(
+    paths: Iterable[Path],
+    *,
+    workers: int = 0,
+    max_bytes: int = 64 * 1024 * 1024,
+    mmap_threshold: int = 0,
+    size_limit: int = 0,
+) -> Iterator[tuple[Path, Buffer]]:
+    """
+    Yield ``(path, data)`` in input order while up to ``workers`` threads prefetch later files.
+
+    New reads are only queued while fewer than ``workers * 4`` files are in flight and the
+    already-read but unconsumed bytes stay below ``max_bytes``; the next file in order is
+    always read, so a single oversized file cannot stall the pipeline. ``workers <= 0``
+    reads serially. Read errors are raised when the failing file's turn comes.
+    Files of at least ``mmap_threshold`` bytes are memory-mapped, others are read up to
+    ``size_limit + 1`` bytes (see `read_source`).
+    """
+    if workers <= 0:
+        for p in paths:
+            yield p, read_source(p, mmap_threshold, size_limit)
+        return
+
+    todo = iter(paths)
+    pending: deque[tuple[Path, Future[Buffer]]] = deque()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dltlint-read")
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < workers * _WINDOW_PER_WORKER:
+                if pending and _buffered_bytes(pending) >= max_bytes:
+                    break
+                nxt = next(todo, None)
+                if nxt is None:
+                    exhausted = True
+                    break
+                pending.append((nxt, pool.submit(read_source, nxt, mmap_threshold, size_limit)))
+            if not pending:
+                return
+            path, fut = pending.popleft()
+            yield path, fut.result()
+    finally:
+        # Abandoned iteration (error or early stop) must not wait for queued reads.
+        pool.shutdown(wait=False, cancel_futures=True)
+        for _, fut in pending:
+            if fut.done() and not fut.cancelled() and fut.exception() is None:
+                close_source(fut.result())
+
+
+def is_archive(path: Path) -> bool:
+    return path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def read_archive(path: Path, suffixes: tuple[str, ...], size_limit: int = 0) -> Iterator[tuple[Path, bytes]]:
+    """
+    Yield ``(archive!member, data)`` for every regular member of a zip or (compressed) tar archive
+    whose name ends with one of ``suffixes``. Zip members are picked from the central directory in
+    name order; tar archives are streamed once, in archive order, so only one member is in memory.
+    With ``size_limit``, at most ``size_limit + 1`` bytes of a member are decompressed, whatever
+    size its header declares, so an archive bomb never expands in memory.
+    """
+    if path.name.lower().endswith(".zip"):
+        with zipfile.ZipFile(path) as zf:
+            infos = sorted((i for i in zf.infolist() if not i.is_dir()), key=lambda i: i.filename)
+            for info in infos:
+                if info.filename.endswith(suffixes):
+                    with zf.open(info) as fh:
+                        yield _member_path(path, info.filename), _read_capped(fh, size_limit)
+        return
+    with tarfile.open(path, mode="r|*") as tf:
+        for member in tf:
+            if member.isfile() and member.name.endswith(suffixes):
+                fh = tf.extractfile(member)
+                if fh is not None:
+                    yield _member_path(path, member.name), _read_capped(fh, size_limit)
+
+
+def _member_path(archive: Path, name: str) -> Path:
+    while name.startswith("./"):
+        name = name[2:]
+    return Path(f"{archive}!{name}")
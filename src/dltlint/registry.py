@@ -25,13 +25,21 @@ RULES: dict[str, RuleInfo] = {
         Severity.ERROR,
         "Each key under resources.pipelines must map to a pipeline object.",
     ),
+    "DLT003": RuleInfo(
+        "DLT003",
+        "Input limit exceeded",
+        Severity.ERROR,
+        "File too large, too deeply nested, too many YAML aliases/expanded nodes, or too slow to load.",
+    ),
     "DLT010": RuleInfo("DLT010", "Unknown field", Severity.WARNING, "Field not recognized for this schema level."),
     "DLT100": RuleInfo("DLT100", "Type error: string", Severity.ERROR, "Value must be a string."),
     "DLT101": RuleInfo("DLT101", "Type error: boolean", Severity.ERROR, "Value must be a boolean."),
     "DLT102": RuleInfo("DLT102", "Type error: integer", Severity.ERROR, "Value must be an integer."),
     "DLT103": RuleInfo("DLT103", "Type error: list/array", Severity.ERROR, "Value must be a list/array."),
     "DLT104": RuleInfo("DLT104", "Type error: mapping/object", Severity.ERROR, "Value must be a mapping/object."),
-    "DLT200": RuleInfo("DLT200", "Invalid channel", Severity.ERROR, "Channel must be one of: current, preview, CURRENT, PREVIEW."),
+    "DLT200": RuleInfo(
+        "DLT200", "Invalid channel", Severity.ERROR, "Channel must be one of: current, preview, CURRENT, PREVIEW."
+    ),
     "DLT201": RuleInfo("DLT201", "Invalid edition", Severity.ERROR, "Edition must be one of: CORE, PRO, ADVANCED."),
     "DLT202": RuleInfo(
         "DLT202",
@@ -83,6 +91,9 @@ RULES: dict[str, RuleInfo] = {
         Severity.ERROR,
         "Glob must include 'include' with a path ending with '**'.",
     ),
+    "DLT430": RuleInfo(
+        "DLT430", "clusters entry must be object", Severity.ERROR, "Each clusters item must be a mapping."
+    ),
     "DLT431": RuleInfo(
         "DLT431", "forbidden cluster field", Severity.ERROR, "Field is managed by Lakeflow and must not be set."
     ),
@@ -130,6 +141,24 @@ RULES: dict[str, RuleInfo] = {
         Severity.ERROR,
         "spark_conf/custom_tags must map string keys to string values.",
     ),
+    "DLT500": RuleInfo(
+        "DLT500",
+        "Duplicate pipeline id",
+        Severity.ERROR,
+        "The same pipeline id is defined in more than one place (cross-file check).",
+    ),
+    "DLT501": RuleInfo(
+        "DLT501",
+        "Duplicate pipeline name",
+        Severity.WARNING,
+        "More than one pipeline uses this name (cross-file check).",
+    ),
+    "DLT502": RuleInfo(
+        "DLT502",
+        "Publish destination collision",
+        Severity.WARNING,
+        "More than one pipeline publishes to the same catalog.schema or target (cross-file check).",
+    ),
 }
 
 
@@ -0,0 +1,781 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from .models import Issue, Loc
+
+# Declarative description of the Lakeflow pipeline spec. Every level of the document (standalone file,
+# bundle pipeline object, clusters, libraries, notifications, trigger, environment, ...) is a `Level`
+# holding an ordered tuple of checks. `compile_level` turns a level into a closure once, at import time;
+# linting a document only runs those closures. `json_schema` exports the same description.
+
+# Element types for nested fields that must hold only strings.
+StrList = list[str]
+StrMap = dict[str, str]
+
+CHANNEL_VALUES = {"current", "preview", "CURRENT", "PREVIEW"}
+EDITION_VALUES = {"CORE", "PRO", "ADVANCED"}
+TRIGGER_INTERVAL_RE = re.compile(r"^\s*(\d+)\s*(second|seconds|minute|minutes|hour|hours|day|days)\s*$")
+TRIGGER_INTERVAL_HINT = "like '10 minutes' | '1 hour' | '30 seconds'"
+
+Validator = Callable[[dict[str, Any], Loc, list[Issue]], None]
+
+
+@dataclass(frozen=True)
+class Typed:
+    """Field ``key`` (when present; ``nullable`` also skips ``None``) must be of ``type``."""
+
+    key: str
+    type: Any
+    code: str
+    nullable: bool = False
+
+
+@dataclass(frozen=True)
+class OneOf:
+    """String field ``key`` must be one of ``values``."""
+
+    key: str
+    code: str
+    values: frozenset[str]
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """String field ``key`` must match ``regex``; ``hint`` completes "<key> must be ..."."""
+
+    key: str
+    code: str
+    regex: re.Pattern[str]
+    hint: str
+
+
+@dataclass(frozen=True)
+class Minimum:
+    key: str
+    code: str
+    minimum: int
+
+
+@dataclass(frozen=True)
+class Recommended:
+    key: str
+    code: str
+
+
+@dataclass(frozen=True)
+class Forbidden:
+    code: str
+    keys: frozenset[str]
+    message: str  # followed by the sorted offending keys
+
+
+@dataclass(frozen=True)
+class Nested:
+    """Field ``key`` holds an object validated by ``level``."""
+
+    key: str
+    level: Level
+
+
+@dataclass(frozen=True)
+class Items:
+    """Field ``key`` holds a list of objects validated by ``level``."""
+
+    key: str
+    level: Level
+
+
+@dataclass(frozen=True)
+class Kinds:
+    """Exactly one of the ``kinds`` keys should be present; the first one found is validated."""
+
+    kinds: dict[str, Level]
+    missing_code: str
+    missing_message: str  # formatted with {kinds}
+    multiple_code: str
+    multiple_message: str  # template, formatted with the list of kinds found
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Hand-written cross-field check, ``func(obj, loc, findings)``."""
+
+    func: Callable[[dict[str, Any], Loc, list[Issue]], None]
+    codes: tuple[str, ...] = ()
+
+
+Check = Typed | OneOf | Pattern | Minimum | Recommended | Forbidden | Nested | Items | Kinds | Rule
+
+
+@dataclass(frozen=True)
+class Level:
+    name: str
+    checks: tuple[Check, ...] = ()
+    # Closed levels: every key must be declared here (else ``unknown_code``); types are checked like
+    # `check_expected_type` (templates and digit strings allowed) before ``checks`` run.
+    fields: dict[str, Any] | None = None
+    unknown_code: str = "DLT010"
+    label: str = ""  # prefix for field names in messages, e.g. "notification."
+    not_object: tuple[str, str] | None = None  # (code, message) when the value is not a mapping
+    nullable: bool = False  # skip ``None`` values instead of reporting ``not_object``
+    # Library kinds: the value must be a mapping with string ``required`` (or a string if ``allow_string``).
+    required: str | None = None
+    allow_string: bool = False
+    invalid: tuple[str, str] | None = None
+    description: str = ""
+
+
+def _finding(code: str, loc: Loc, template: str, *args: Any) -> Issue:  # noqa ANN401
+    return Issue(code, loc, template, args)
+
+
+# ---- Hand-written rules ----------------------------------------------------
+
+
+def _publishing_mode(doc: dict[str, Any], root: Loc, f: list[Issue]) -> None:
+    has_modern = ("catalog" in doc) or ("schema" in doc)
+    has_legacy = ("target" in doc) or ("storage" in doc)
+    if has_modern and has_legacy:
+        f.append(
+            _finding(
+                "DLT300", root, "Use either modern (catalog/schema) or legacy (target/storage) publishing, not both"
+            )
+        )
+
+
+def _configuration(doc: dict[str, Any], root: Loc, f: list[Issue]) -> None:
+    conf = doc.get("configuration")
+    if not isinstance(conf, dict):
+        return
+    for ck, cv in conf.items():
+        if not isinstance(ck, str):
+            f.append(_finding("DLT410", (*root, "configuration"), "configuration keys must be strings"))
+            break
+        check = _CONFIGURATION_TYPES.get(ck)
+        if check is not None:
+            check(cv, root, ck, f)
+        elif not isinstance(cv, str | int | float | bool):
+            f.append(
+                _finding(
+                    "DLT411",
+                    (*root, "configuration", ck),
+                    "configuration value for '{}' should be a scalar (string/number/bool)",
+                    ck,
+                )
+            )
+
+
+def _recipients(n: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+    recipients = n.get("email_recipients")
+    if not (isinstance(recipients, list) and recipients and all(isinstance(x, str) for x in recipients)):
+        f.append(_finding("DLT450", loc, "notification.email_recipients must be a non-empty list of strings"))
+
+
+def _autoscale_bounds(as_: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+    mw = as_.get("min_workers")
+    xw = as_.get("max_workers")
+    if not (isinstance(mw, int) and isinstance(xw, int)):
+        f.append(_finding("DLT463", loc, "autoscale.min_workers and autoscale.max_workers must be integers"))
+        return
+    if mw < 0 or xw < 0:
+        f.append(_finding("DLT464", loc, "autoscale min/max workers must be >= 0"))
+    if mw > xw:
+        f.append(_finding("DLT465", loc, "autoscale.min_workers must be <= autoscale.max_workers"))
+
+
+def _workers_exclusive(cl: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+    if isinstance(cl.get("num_workers"), int) and isinstance(cl.get("autoscale"), dict):
+        f.append(_finding("DLT466", loc, "Specify either 'num_workers' or 'autoscale', not both"))
+
+
+# ---- Spec --------------------------------------------------------------------
+
+TRIGGER = Level(
+    "trigger",
+    label="trigger.",
+    checks=(Pattern("interval", "DLT202", TRIGGER_INTERVAL_RE, TRIGGER_INTERVAL_HINT),),
+    description="Triggered pipeline settings.",
+)
+
+ENVIRONMENT = Level(
+    "environment",
+    label="environment.",
+    checks=(Typed("dependencies", StrList, "DLT103"),),
+    description="Serverless environment; dependencies are pip requirement specifiers.",
+)
+
+_LIBRARY_PATH = "library requires a string or an object with 'path'"
+LIBRARY = Level(
+    "library",
+    not_object=("DLT420", "libraries entries must be objects"),
+    checks=(
+        Kinds(
+            {
+                "notebook": Level(
+                    "notebook", required="path", invalid=("DLT422", "notebook must be an object with 'path'")
+                ),
+                "file": Level("file", required="path", invalid=("DLT422", "file must be an object with 'path'")),
+                "jar": Level("jar", required="path", allow_string=True, invalid=("DLT422", _LIBRARY_PATH)),
+                "whl": Level("whl", required="path", allow_string=True, invalid=("DLT422", _LIBRARY_PATH)),
+                "maven": Level(
+                    "maven",
+                    label="maven.",
+                    required="coordinates",
+                    invalid=("DLT425", "maven requires object with 'coordinates' (e.g., group:artifact:version)"),
+                    checks=(Typed("exclusions", StrList, "DLT425"), Typed("repo", str, "DLT425")),
+                ),
+                "pypi": Level(
+                    "pypi",
+                    label="pypi.",
+                    required="package",
+                    invalid=("DLT426", "pypi requires object with 'package' (e.g., 'duckdb==1.0.0')"),
+                    checks=(Typed("repo", str, "DLT426"),),
+                ),
+                "glob": Level(
+                    "glob",
+                    label="glob.",
+                    required="include",
+                    invalid=("DLT427", "glob requires object with 'include' (e.g., 'src/**')"),
+                    checks=(
+                        Pattern("include", "DLT427", re.compile(r".*\*\*\Z", re.DOTALL), "a path ending with '**'"),
+                    ),
+                ),
+            },
+            missing_code="DLT421",
+            missing_message="library should specify one of: {kinds}",
+            multiple_code="DLT423",
+            multiple_message="library must specify exactly one kind, found {}",
+        ),
+    ),
+    description="A pipeline source or dependency.",
+)
+
+NOTIFICATION = Level(
+    "notification",
+    label="notification.",
+    not_object=("DLT440", "notification entry must be an object"),
+    checks=(
+        Rule(_recipients, ("DLT450",)),
+        *(
+            Typed(flag, bool, "DLT451")
+            for flag in ("on_update_start", "on_update_success", "on_update_failure", "on_flow_failure")
+        ),
+    ),
+    description="E-mail notification settings.",
+)
+
+CLUSTER_FORBIDDEN_FIELDS = frozenset(
+    {
+        "cluster_name",
+        "data_security_mode",
+        "access_mode",
+        "spark_version",
+        "autotermination_minutes",
+        "runtime_engine",
+        "effective_spark_version",
+        "cluster_source",
+        "docker_image",
+        "workload_type",
+    }
+)
+
+AUTOSCALE = Level(
+    "autoscale",
+    label="autoscale.",
+    not_object=("DLT462", "autoscale must be an object with 'min_workers' and 'max_workers'"),
+    nullable=True,
+    checks=(Rule(_autoscale_bounds, ("DLT463", "DLT464", "DLT465")),),
+    description="Autoscaling bounds.",
+)
+
+CLUSTER = Level(
+    "cluster",
+    not_object=("DLT430", "clusters entries must be objects"),
+    checks=(
+        Forbidden(
+            "DLT431", CLUSTER_FORBIDDEN_FIELDS, "These cluster fields are managed by Lakeflow and must not be set: "
+        ),
+        Typed("num_workers", int, "DLT460", nullable=True),
+        Minimum("num_workers", "DLT461", 0),
+        Nested("autoscale", AUTOSCALE),
+        Rule(_workers_exclusive, ("DLT466",)),
+        Typed("node_type_id", str, "DLT467"),
+        Typed("driver_node_type_id", str, "DLT467"),
+        Typed("policy_id", str, "DLT467"),
+        Typed("spark_conf", StrMap, "DLT468", nullable=True),
+        Typed("custom_tags", StrMap, "DLT468", nullable=True),
+    ),
+    description="Cluster settings for a classic-compute pipeline.",
+)
+
+CONFIGURATION_FIELDS: dict[str, Any] = {
+    "pipelines.maxFlowRetryAttempts": int,
+    "pipelines.numUpdateRetryAttempts": int,
+    "pipelines.trigger.interval": str,
+}
+
+_COMMON_FIELDS: dict[str, Any] = {
+    "id": str,
+    "name": str,
+    "configuration": dict,
+    "libraries": list,
+    "clusters": list,
+    "development": bool,
+    "notifications": list,
+    "continuous": bool,
+    "catalog": str,
+    "schema": str,
+    "target": str,
+    "storage": str,
+    "channel": str,
+    "edition": str,
+    "photon": bool,
+}
+
+_PIPELINE_CHECKS: tuple[Check, ...] = (
+    OneOf("channel", "DLT200", frozenset(CHANNEL_VALUES)),
+    OneOf("edition", "DLT201", frozenset(EDITION_VALUES)),
+    Pattern("pipelines.trigger.interval", "DLT202", TRIGGER_INTERVAL_RE, TRIGGER_INTERVAL_HINT),
+    Nested("trigger", TRIGGER),
+    Rule(_publishing_mode, ("DLT300",)),
+    Recommended("name", "DLT400"),
+    Minimum("pipelines.maxFlowRetryAttempts", "DLT401", 0),
+    Minimum("pipelines.numUpdateRetryAttempts", "DLT401", 0),
+    Rule(_configuration, ("DLT410", "DLT411")),
+    Items("libraries", LIBRARY),
+    Items("notifications", NOTIFICATION),
+    Items("clusters", CLUSTER),
+)
+
+# Top-level fields for a **standalone** pipeline file.
+STANDALONE = Level(
+    "standalone",
+    fields={
+        **_COMMON_FIELDS,
+        "trigger": dict,
+        "resources": dict,
+        "pipelines.trigger.interval": str,
+        "root_path": str,
+    },
+    checks=_PIPELINE_CHECKS,
+    description="A standalone pipeline settings file.",
+)
+
+# Fields expected **inside** a bundle pipeline object at `resources.pipelines.<id>`
+PIPELINE_OBJ = Level(
+    "pipeline",
+    fields={
+        **_COMMON_FIELDS,
+        "maxFlowRetryAttempts": int,
+        "numUpdateRetryAttempts": int,
+        "trigger": dict,
+        "serverless": bool,
+        "environment": dict,
+        "root_path": str,
+    },
+    checks=(*_PIPELINE_CHECKS, Nested("environment", ENVIRONMENT)),
+    description="A pipeline under resources.pipelines.<id> of a bundle.",
+)
+
+
+# ---- Compilation -------------------------------------------------------------
+
+FieldCheck = Callable[[Any, Loc, str, list[Issue]], None]
+
+# expected type -> (code, noun phrase, predicate), for top-level fields
+_TOP_TYPES: dict[Any, tuple[str, str, Callable[[Any], bool]]] = {
+    str: ("DLT100", "a string", lambda v: isinstance(v, str)),
+    bool: ("DLT101", "a boolean", lambda v: isinstance(v, bool)),
+    int: ("DLT102", "an integer", lambda v: isinstance(v, int) or (isinstance(v, str) and v.isdigit())),
+    list: ("DLT103", "a list/array", lambda v: isinstance(v, list)),
+    dict: ("DLT104", "a mapping/object", lambda v: isinstance(v, dict)),
+}
+
+# expected type -> (noun phrase, predicate), for strictly typed nested fields
+_NESTED_TYPES: dict[Any, tuple[str, Callable[[Any], bool]]] = {
+    str: ("a string", lambda v: isinstance(v, str)),
+    bool: ("a boolean", lambda v: isinstance(v, bool)),
+    int: ("an integer", lambda v: isinstance(v, int)),
+    StrList: ("a list of strings", lambda v: isinstance(v, list) and all(isinstance(x, str) for x in v)),
+    StrMap: (
+        "a mapping of string->string",
+        lambda v: isinstance(v, dict) and all(isinstance(k, str) and isinstance(x, str) for k, x in v.items()),
+    ),
+}
+
+
+def field_checker(expected: Any) -> FieldCheck:  # noqa ANN401
+    """
+    Specialized ``check(value, root, key, findings)`` for a top-level field of type ``expected``:
+    ``${...}`` templates always pass, integers may be given as digit strings.
+    """
+    if expected not in _TOP_TYPES:
+        return lambda *_: None
+    code, phrase, ok = _TOP_TYPES[expected]
+    template = "Field '{}' must be " + phrase + ", got {}"
+
+    def check(v: Any, root: Loc, k: str, f: list[Issue]) -> None:  # noqa ANN401
+        if ok(v) or (isinstance(v, str) and v.startswith("${")):
+            return
+        f.append(Issue(code, (*root, k), template, (k, type(v).__name__)))
+
+    return check
+
+
+_CONFIGURATION_TYPES: dict[str, FieldCheck] = {k: field_checker(t) for k, t in CONFIGURATION_FIELDS.items()}
+
+
+# ---- Subtree memo --------------------------------------------------------------
+# Generated bundles repeat the same cluster/library/notification entries across many pipelines, mostly
+# through YAML anchors, which load as one shared object. Within `memoized_subtrees` each such object is
+# validated once per level; later occurrences re-root the issues found at the first one.
+# Copies that are merely equal are validated again: fingerprinting an entry (repr, hashing a canonical
+# form) costs about as much as checking it.
+
+_scope = threading.local()
+
+
+# id(item) -> (item, loc it was validated at, its issues); holding on to the item keeps its id unique
+Seen = dict[int, tuple[Any, Loc, list[Issue]]]
+
+
+class SubtreeMemo:
+    """Validated list items per level, by identity."""
+
+    def __init__(self: SubtreeMemo) -> None:
+        self._levels: dict[int, Seen] = {}
+
+    def for_level(self: SubtreeMemo, level: Level) -> Seen:
+        seen = self._levels.get(id(level))
+        if seen is None:
+            seen = self._levels[id(level)] = {}
+        return seen
+
+
+@contextmanager
+def memoized_subtrees() -> Iterator[SubtreeMemo]:
+    """Share validation results of identical list items within the block (on this thread)."""
+    outer = getattr(_scope, "memo", None)
+    _scope.memo = memo = SubtreeMemo() if outer is None else outer
+    try:
+        yield memo
+    finally:
+        _scope.memo = outer
+
+
+def _reroot(where: Loc, root: Loc, issues: list[Issue]) -> list[Issue]:
+    """``issues`` found in the item at ``root``, moved to the same item at ``where``."""
+    depth = len(root)
+    return [Issue(code, (*where, *loc[depth:]), template, args, sev) for code, loc, template, args, sev in issues]
+
+
+def _compile_items(check: Items, _label: str, memo: dict[int, Validator]) -> Validator:
+    """
+    Validate each object of the list ``check.key`` against ``check.level``; within
+    `memoized_subtrees` an object already seen at this level gets the issues of its first occurrence.
+    """
+    key, level = check.key, check.level
+    inner = compile_level(level, memo)
+    not_object = level.not_object
+
+    def items(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        seq = obj.get(key)
+        if not isinstance(seq, list):
+            return
+        subtrees = getattr(_scope, "memo", None)
+        seen = None if subtrees is None else subtrees.for_level(level)
+        for i, item in enumerate(seq):
+            where = (*loc, key, i)
+            if not isinstance(item, dict):
+                if not_object is not None:
+                    f.append(_finding(not_object[0], where, not_object[1]))
+                continue
+            hit = None if seen is None else seen.get(id(item))
+            if hit is not None and hit[0] is item:
+                if hit[2]:
+                    f.extend(_reroot(where, hit[1], hit[2]))
+                continue
+            start = len(f)
+            inner(item, where, f)
+            if seen is not None:
+                seen[id(item)] = (item, where, f[start:])
+
+    return items
+
+
+def _compile_typed(check: Typed, label: str, _memo: dict[int, Validator]) -> Validator:
+    key, code, nullable = check.key, check.code, check.nullable
+    phrase, ok = _NESTED_TYPES[check.type]
+    message = f"{label}{key} must be {phrase}"
+
+    def typed(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        if key in obj:
+            v = obj[key]
+            if not ok(v) and not (nullable and v is None):
+                f.append(_finding(code, (*loc, key), message))
+
+    return typed
+
+
+def _compile_one_of(check: OneOf, label: str, _memo: dict[int, Validator]) -> Validator:
+    key, code, values = check.key, check.code, check.values
+    message = f"{label}{key} must be one of {sorted(values)}"
+
+    def one_of(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        v = obj.get(key)
+        if isinstance(v, str) and v not in values:
+            f.append(_finding(code, (*loc, key), message))
+
+    return one_of
+
+
+def _compile_pattern(check: Pattern, label: str, _memo: dict[int, Validator]) -> Validator:
+    key, code, match = check.key, check.code, check.regex.match
+    message = f"{label}{key} must be {check.hint}"
+
+    def pattern(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        v = obj.get(key)
+        if isinstance(v, str) and not match(v):
+            f.append(_finding(code, (*loc, key), message))
+
+    return pattern
+
+
+def _compile_minimum(check: Minimum, label: str, _memo: dict[int, Validator]) -> Validator:
+    key, code, minimum = check.key, check.code, check.minimum
+    message = f"{label}{key} must be >= {minimum}"
+
+    def at_least(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        v = obj.get(key)
+        if isinstance(v, int) and v < minimum:
+            f.append(_finding(code, (*loc, key), message))
+
+    return at_least
+
+
+def _compile_recommended(check: Recommended, _label: str, _memo: dict[int, Validator]) -> Validator:
+    key, code = check.key, check.code
+    message = f"Missing recommended field '{key}'"
+
+    def recommended(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        if key not in obj:
+            f.append(_finding(code, loc, message))
+
+    return recommended
+
+
+def _compile_forbidden(check: Forbidden, _label: str, _memo: dict[int, Validator]) -> Validator:
+    code, keys, template = check.code, check.keys, check.message + "{}"
+
+    def forbidden(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        found = keys.intersection(obj.keys())
+        if found:
+            f.append(_finding(code, loc, template, ", ".join(sorted(found))))
+
+    return forbidden
+
+
+def _compile_nested(check: Nested, _label: str, memo: dict[int, Validator]) -> Validator:
+    key, level = check.key, check.level
+    inner = compile_level(level, memo)
+    not_object, nullable = level.not_object, level.nullable
+
+    def nested(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        if key not in obj:
+            return
+        v = obj[key]
+        if isinstance(v, dict):
+            inner(v, (*loc, key), f)
+        elif not_object is not None and not (nullable and v is None):
+            f.append(_finding(not_object[0], (*loc, key), not_object[1]))
+
+    return nested
+
+
+def _compile_rule(check: Rule, _label: str, _memo: dict[int, Validator]) -> Validator:
+    return check.func
+
+
+def _compile_kinds(check: Kinds, _label: str, memo: dict[int, Validator]) -> Validator:
+    names = tuple(check.kinds)
+    missing = check.missing_message.format(kinds="|".join(names))
+    kind_validators = {name: _compile_kind(name, level, memo) for name, level in check.kinds.items()}
+
+    def kinds(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        present = [k for k in names if k in obj]
+        if not present:
+            f.append(_finding(check.missing_code, loc, missing))
+            return
+        if len(present) > 1:
+            f.append(_finding(check.multiple_code, loc, check.multiple_message, present))
+        kind_validators[present[0]](obj[present[0]], loc, f)
+
+    return kinds
+
+
+def _compile_kind(name: str, level: Level, memo: dict[int, Validator]) -> Callable[[Any, Loc, list[Issue]], None]:
+    inner = compile_level(level, memo)
+    required, allow_string = level.required, level.allow_string
+    code, message = level.invalid or ("DLT422", f"{name} is invalid")
+
+    def kind(v: Any, loc: Loc, f: list[Issue]) -> None:  # noqa ANN401
+        if allow_string and isinstance(v, str):
+            return
+        if not (isinstance(v, dict) and (required is None or isinstance(v.get(required), str))):
+            f.append(_finding(code, loc, message))
+            return
+        inner(v, (*loc, name), f)
+
+    return kind
+
+
+# check type -> compiler, called as compiler(check, level label, memo)
+_COMPILERS: dict[type, Callable[[Any, str, dict[int, Validator]], Validator]] = {
+    Typed: _compile_typed,
+    OneOf: _compile_one_of,
+    Pattern: _compile_pattern,
+    Minimum: _compile_minimum,
+    Recommended: _compile_recommended,
+    Forbidden: _compile_forbidden,
+    Nested: _compile_nested,
+    Items: _compile_items,
+    Kinds: _compile_kinds,
+    Rule: _compile_rule,
+}
+
+
+def _compile_check(check: Check, label: str, memo: dict[int, Validator]) -> Validator:
+    return _COMPILERS[type(check)](check, label, memo)
+
+
+def compile_level(level: Level, memo: dict[int, Validator] | None = None) -> Validator:
+    """
+    Compile ``level`` into ``validate(obj, loc, issues)`` for a mapping ``obj`` found at ``loc``.
+    Levels shared between parents (e.g. clusters) are compiled once per ``memo``.
+    """
+    memo = {} if memo is None else memo
+    if id(level) in memo:
+        return memo[id(level)]
+    checks = tuple(_compile_check(c, level.label, memo) for c in level.checks)
+    fields = _compile_fields(level)
+
+    if fields is None:
+
+        def validate(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+            for check in checks:
+                check(obj, loc, f)
+
+    else:
+
+        def validate(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+            fields(obj, loc, f)
+            for check in checks:
+                check(obj, loc, f)
+
+    memo[id(level)] = validate
+    return validate
+
+
+def _compile_fields(level: Level) -> Validator | None:
+    """Unknown-key and type checks of a closed level (``fields``); None for open levels."""
+    if level.fields is None:
+        return None
+    table = {k: field_checker(t) for k, t in level.fields.items()}
+    unknown_code = level.unknown_code
+
+    def fields(obj: dict[str, Any], loc: Loc, f: list[Issue]) -> None:
+        for k, v in obj.items():
+            check_type = table.get(k)
+            if check_type is None:
+                key = k if isinstance(k, str) else str(k)
+                f.append(Issue(unknown_code, (*loc, key), "Unknown top-level field '{}'", (k,)))
+            else:
+                check_type(v, loc, k, f)
+
+    return fields
+
+
+_MEMO: dict[int, Validator] = {}
+VALIDATE_STANDALONE = compile_level(STANDALONE, _MEMO)
+VALIDATE_PIPELINE_OBJ = compile_level(PIPELINE_OBJ, _MEMO)
+
+
+# ---- JSON Schema export ------------------------------------------------------
+
+_JSON_TYPES: dict[Any, dict[str, Any]] = {
+    str: {"type": "string"},
+    bool: {"type": "boolean"},
+    int: {"type": "integer"},
+    list: {"type": "array"},
+    dict: {"type": "object"},
+    StrList: {"type": "array", "items": {"type": "string"}},
+    StrMap: {"type": "object", "additionalProperties": {"type": "string"}},
+}
+
+
+def _level_schema(level: Level, defs: dict[str, Any]) -> dict[str, Any]:
+    if level.name in defs:
+        return {"$ref": f"#/$defs/{level.name}"}
+    defs[level.name] = {}  # reserve the name before recursing
+    props: dict[str, Any] = {k: dict(_JSON_TYPES[t]) for k, t in (level.fields or {}).items()}
+    out: dict[str, Any] = {"type": "object"}
+    if level.description:
+        out["description"] = level.description
+    if level.required:
+        out["required"] = [level.required]
+        props[level.required] = {"type": "string"}
+    for check in level.checks:
+        if isinstance(check, Typed):
+            props.setdefault(check.key, {}).update(_JSON_TYPES[check.type])
+        elif isinstance(check, OneOf):
+            props.setdefault(check.key, {"type": "string"})["enum"] = sorted(check.values)
+        elif isinstance(check, Pattern):
+            props.setdefault(check.key, {"type": "string"})["pattern"] = check.regex.pattern
+        elif isinstance(check, Minimum):
+            props.setdefault(check.key, {"type": "integer"})["minimum"] = check.minimum
+        elif isinstance(check, Nested):
+            props[check.key] = _level_schema(check.level, defs)
+        elif isinstance(check, Items):
+            props[check.key] = {"type": "array", "items": _level_schema(check.level, defs)}
+        elif isinstance(check, Forbidden):
+            out["not"] = {"anyOf": [{"required": [k]} for k in sorted(check.keys)]}
+        elif isinstance(check, Kinds):
+            out["oneOf"] = [
+                {"required": [name], "properties": {name: _level_schema(level, defs)}}
+                for name, level in check.kinds.items()
+            ]
+    if props:
+        out["properties"] = props
+    if level.allow_string:
+        out = {"anyOf": [{"type": "string"}, out]}
+    defs[level.name] = out
+    return {"$ref": f"#/$defs/{level.name}"}
+
+
+def json_schema() -> dict[str, Any]:
+    """JSON Schema (2020-12) for a pipeline file: standalone settings or a bundle with resources.pipelines."""
+    defs: dict[str, Any] = {}
+    standalone = _level_schema(STANDALONE, defs)
+    pipeline = _level_schema(PIPELINE_OBJ, defs)
+    bundle = {
+        "type": "object",
+        "required": ["resources"],
+        "properties": {
+            "resources": {
+                "type": "object",
+                "properties": {"pipelines": {"type": "object", "additionalProperties": pipeline}},
+            }
+        },
+    }
+    return {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "title": "Lakeflow (DLT) pipeline",
+        "anyOf": [bundle, standalone],
+        "$defs": defs,
+    }
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+from .baseline import normalize_path
+
+# Deterministic sharding of a file list across CI nodes (`--shard INDEX/COUNT`). A file's shard
+# depends only on a hash of its path relative to the working directory, never on its position in
+# the list, so adding or removing files moves only those files and every node agrees on the split
+# without coordinating.
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """``"INDEX/COUNT"`` with ``1 <= INDEX <= COUNT`` -> ``(INDEX, COUNT)``."""
+    index, sep, count = spec.partition("/")
+    try:
+        i, n = int(index), int(count)
+    except ValueError:
+        i = n = 0
+    if not sep or n < 1 or not 1 <= i <= n:
+        raise ValueError(f"expected INDEX/COUNT with 1 <= INDEX <= COUNT, got {spec!r}")
+    return i, n
+
+
+def shard_key(path: Path, base: str) -> int:
+    """Stable 64-bit hash of ``path`` relative to ``base`` (same on every OS and checkout location)."""
+    rel = normalize_path(str(path), base)
+    return int.from_bytes(hashlib.blake2b(rel.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def select_shard(files: list[Path], index: int, count: int, *, by_size: bool = False) -> list[Path]:
+    """
+    The files of shard ``index`` (1-based) of ``count``, in their original order.
+
+    By default each file goes to ``hash % count``. With ``by_size`` the files are laid out in hash
+    order and cut into ``count`` runs of roughly equal total size (a file belongs to the run its
+    midpoint falls in), so shards balance bytes rather than file counts while staying stable.
+    """
+    if count == 1:
+        return list(files)
+    base = os.getcwd()
+    keys = {f: shard_key(f, base) for f in files}
+    if not by_size:
+        chosen = {f for f, k in keys.items() if k % count == index - 1}
+    else:
+        ordered = sorted(keys, key=lambda f: (keys[f], str(f)))
+        sizes = [max(_size(f), 1) for f in ordered]
+        total = sum(sizes)
+        chosen = set()
+        offset = 0
+        for f, size in zip(ordered, sizes, strict=True):
+            if (2 * offset + size) * count // (2 * total) == index - 1:
+                chosen.add(f)
+            offset += size
+    return [f for f in files if f in chosen]
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
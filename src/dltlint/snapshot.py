@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterator
+from typing import IO, Any
+
+# Incremental reader for `databricks bundle validate -o json` snapshots. Only the pipeline objects
+# under resources.pipelines are decoded, one at a time; every other value is skipped by scanning
+# for brackets and string ends, so memory stays bounded by the largest single pipeline.
+# The same scanner streams the records of JSON arrays and JSON-lines files (`iter_json_records`).
+
+_WS = re.compile(rb"[ \t\r\n]*")
+_STRUCT = re.compile(rb'["{}\[\]]')
+_STRING_END = re.compile(rb'["\\]')
+_SCALAR = re.compile(rb"[^,}\]\s]*")
+
+_OPEN = frozenset(b"{[")
+_QUOTE, _COMMA, _COLON, _LBRACE, _RBRACE = b'"', b",", b":", b"{", b"}"
+_LBRACKET, _RBRACKET = b"[", b"]"
+
+
+class _Scanner:
+    def __init__(self: _Scanner, fh: IO[bytes], chunk_size: int, kind: str = "JSON snapshot") -> None:
+        self.fh = fh
+        self.chunk_size = chunk_size
+        self.kind = kind  # for error messages
+        self.buf = bytearray()
+        self.pos = 0
+        self.dropped = 0  # bytes released from the front of ``buf``
+        self.eof = False
+
+    def fill(self: _Scanner) -> bool:
+        if self.eof:
+            return False
+        data = self.fh.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def release(self: _Scanner) -> None:
+        """Forget everything before the current position."""
+        del self.buf[: self.pos]
+        self.dropped += self.pos
+        self.pos = 0
+
+    def error(self: _Scanner, what: str) -> ValueError:
+        return ValueError(f"invalid {self.kind}: {what} at byte {self.dropped + self.pos}")
+
+    def ws(self: _Scanner) -> int | None:
+        """Skip whitespace; the next byte, or None at end of input."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self: _Scanner, token: bytes) -> None:
+        if self.ws() != token[0]:
+            raise self.error(f"expected {token.decode()!r}")
+        self.pos += 1
+
+    def skip_string(self: _Scanner) -> None:
+        self.pos += 1  # opening quote
+        while True:
+            m = _STRING_END.search(self.buf, self.pos)
+            if m is None or (m.group() == b"\\" and m.end() >= len(self.buf)):
+                if not self.fill():
+                    raise self.error("unterminated string")
+                continue
+            if m.group() == b"\\":
+                self.pos = m.end() + 1
+                continue
+            self.pos = m.end()
+            return
+
+    def string(self: _Scanner) -> str:
+        if self.ws() != _QUOTE[0]:
+            raise self.error("expected a string")
+        start = self.pos
+        self.skip_string()
+        return json.loads(self.buf[start : self.pos])
+
+    def skip_value(self: _Scanner, *, keep: bool = False) -> None:
+        """Move past one value; unless ``keep``, bytes are released as they are scanned."""
+        c = self.ws()
+        if c is None:
+            raise self.error("unexpected end of input")
+        if c == _QUOTE[0]:
+            self.skip_string()
+            return
+        if c not in _OPEN:
+            while True:
+                self.pos = _SCALAR.match(self.buf, self.pos).end()  # type: ignore[union-attr]
+                if self.pos < len(self.buf) or not self.fill():
+                    return
+        depth = 0
+        while True:
+            m = _STRUCT.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+                if not keep:
+                    self.release()
+                if not self.fill():
+                    raise self.error("unexpected end of input")
+                continue
+            if m.group() == _QUOTE:
+                self.pos = m.start()
+                self.skip_string()
+                continue
+            self.pos = m.end()
+            depth += 1 if m.group()[0] in _OPEN else -1
+            if depth == 0:
+                return
+
+    def value(self: _Scanner) -> Any:  # noqa ANN401
+        self.ws()
+        start = self.pos
+        self.skip_value(keep=True)
+        return json.loads(self.buf[start : self.pos])
+
+    def members(self: _Scanner) -> Iterator[str]:
+        """Keys of the object at the current position; the caller consumes each value before resuming."""
+        self.expect(_LBRACE)
+        if self.ws() == _RBRACE[0]:
+            self.pos += 1
+            return
+        while True:
+            key = self.string()
+            self.expect(_COLON)
+            yield key
+            c = self.ws()
+            self.pos += 1
+            if c == _COMMA[0]:
+                continue
+            if c == _RBRACE[0]:
+                return
+            self.pos -= 1
+            raise self.error("expected ',' or '}'")
+
+    def elements(self: _Scanner) -> Iterator[None]:
+        """Step through the array at the current position; the caller consumes each element before resuming."""
+        self.expect(_LBRACKET)
+        if self.ws() == _RBRACKET[0]:
+            self.pos += 1
+            return
+        while True:
+            yield
+            c = self.ws()
+            self.pos += 1
+            if c == _COMMA[0]:
+                continue
+            if c == _RBRACKET[0]:
+                return
+            self.pos -= 1
+            raise self.error("expected ',' or ']'")
+
+
+def iter_snapshot_pipelines(fh: IO[bytes], chunk_size: int = 64 * 1024) -> Iterator[tuple[str, Any]]:
+    """
+    Yield ``(pipeline id, decoded pipeline object)`` for each entry of ``resources.pipelines`` in a
+    JSON snapshot read from the binary stream ``fh``, as soon as that entry has been read.
+    """
+    sc = _Scanner(fh, chunk_size)
+    if sc.ws() != _LBRACE[0]:
+        raise sc.error("expected a JSON object")
+    for key in sc.members():
+        if key != "resources" or sc.ws() != _LBRACE[0]:
+            sc.skip_value()
+            continue
+        for section in sc.members():
+            if section != "pipelines" or sc.ws() != _LBRACE[0]:
+                sc.skip_value()
+                continue
+            for pid in sc.members():
+                obj = sc.value()
+                sc.release()
+                yield pid, obj
+    if sc.ws() is not None:
+        raise sc.error("trailing data")
+
+
+def iter_json_records(fh: IO[bytes], chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """
+    Yield the records of a JSON stream one at a time: the elements of a top-level array, or each
+    value of a JSON-lines (or concatenated JSON) stream. Memory is bounded by the largest record.
+    """
+    sc = _Scanner(fh, chunk_size, "JSON results")
+    if sc.ws() == _LBRACKET[0]:
+        for _ in sc.elements():
+            yield sc.value()
+            sc.release()
+        if sc.ws() is not None:
+            raise sc.error("trailing data")
+        return
+    while sc.ws() is not None:
+        yield sc.value()
+        sc.release()
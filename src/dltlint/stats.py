@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from .core import severity_rank
+from .models import Finding, Severity
+from .registry import RULES
+
+
+class Statistics:
+    """
+    Finding counts per (code, severity), per severity and per file, aggregated as findings are
+    produced. Memory grows with the number of distinct codes and files, never with the number of findings.
+    """
+
+    def __init__(self: Statistics) -> None:
+        self.files = 0
+        self.total = 0
+        self.by_code: Counter[tuple[str, Severity]] = Counter()
+        self.by_severity: Counter[Severity] = Counter()
+        self.by_file: Counter[str] = Counter()
+
+    def add(self: Statistics, path: Path | str, findings: list[Finding], *, linted: bool = True) -> None:
+        """Count ``findings`` for ``path``; ``linted=False`` adds findings for a file already counted."""
+        self.files += linted
+        for f in findings:
+            sev = Severity(f.severity)
+            self.by_code[f.code, sev] += 1
+            self.by_severity[sev] += 1
+            self.by_file[str(path)] += 1
+        self.total += len(findings)
+
+    def worst(self: Statistics) -> int:
+        """Rank of the most severe finding seen, -1 when there were none."""
+        return max((severity_rank(s) for s, n in self.by_severity.items() if n), default=-1)
+
+    def _codes(self: Statistics) -> list[tuple[tuple[str, Severity], int]]:
+        return sorted(self.by_code.items(), key=lambda kv: (-kv[1], kv[0][0], kv[0][1].value))
+
+    def _files(self: Statistics) -> list[tuple[str, int]]:
+        return sorted(self.by_file.items(), key=lambda kv: (-kv[1], kv[0]))
+
+    def to_dict(self: Statistics) -> dict[str, Any]:
+        return {
+            "files": self.files,
+            "findings": self.total,
+            "by_code": [{"code": c, "severity": s.value, "count": n} for (c, s), n in self._codes()],
+            "by_severity": {s.value: self.by_severity[s] for s in Severity},
+            "by_file": [{"file": p, "count": n} for p, n in self._files()],
+        }
+
+    def table(self: Statistics) -> str:
+        width = len(str(max(self.by_code.values(), default=0)))
+        lines = [f"{self.total} finding(s) in {self.files} pipeline file(s)"]
+        if self.by_code:
+            lines.append("")
+            for (code, sev), n in self._codes():
+                title = RULES[code].title if code in RULES else ""
+                lines.append(f"{n:>{width}}  {code}  {sev.value:<7}  {title}".rstrip())
+        if self.by_file:
+            lines.append("")
+            for p, n in self._files():
+                lines.append(f"{n:>{width}}  {p}")
+        return "\n".join(lines)
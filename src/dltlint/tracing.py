@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+# Optional timeline of a run (`--trace-file`). The lint phases call `span`, which is a shared no-op
+# context unless a `Tracer` was installed, so untraced runs pay one global lookup per phase.
+# Traces are written in the Chrome trace event format (chrome://tracing, Perfetto, speedscope);
+# each thread is its own track, named after the thread, so read-ahead workers show up separately.
+
+_NULL: AbstractContextManager[None] = nullcontext()
+_tracer: Tracer | None = None
+
+
+def span(name: str, **args: Any) -> AbstractContextManager[None]:  # noqa ANN401
+    """Time the enclosed block as ``name`` (with ``args`` shown in the viewer) when tracing is on."""
+    tracer = _tracer
+    return _NULL if tracer is None else tracer.span(name, args)
+
+
+def install(tracer: Tracer | None) -> None:
+    """Record spans into ``tracer`` from now on; ``None`` turns tracing off."""
+    global _tracer  # noqa PLW0603
+    _tracer = tracer
+
+
+class Tracer:
+    """Collects complete ("X") trace events in memory; `write` saves them as a Chrome trace."""
+
+    def __init__(self: Tracer) -> None:
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.events: list[dict[str, Any]] = []
+        self._tids: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def _tid(self: Tracer) -> int:
+        ident = threading.get_ident()
+        tid = self._tids.get(ident)
+        if tid is None:
+            with self._lock:
+                tid = self._tids[ident] = len(self._tids) + 1
+            name = threading.current_thread().name
+            self.events.append({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}})
+        return tid
+
+    @contextmanager
+    def span(self: Tracer, name: str, args: dict[str, Any]) -> Iterator[None]:
+        tid = self._tid()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            # list.append is atomic, so worker threads can record without taking the lock
+            self.events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (start - self.origin) / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": self.pid,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+
+    def write(self: Tracer, path: Path) -> None:
+        with path.open("w", encoding="utf-8") as fh:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, fh)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import os
+import sys
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from .config import ConfigResolver, ToolConfig, load_config
+from .core import find_pipeline_files, lint_paths
+from .models import Finding
+
+CONFIG_FILES = ("pyproject.toml", "dltlint.toml")
+
+# (st_mtime_ns, st_size); (0, -1) marks a path that does not exist
+Stamp = tuple[int, int]
+_MISSING: Stamp = (0, -1)
+
+
+def _stamp(path: str) -> Stamp:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return _MISSING
+    return st.st_mtime_ns, st.st_size
+
+
+def _finding_key(f: Finding) -> tuple[Any, ...]:
+    return f.code, f.path, f.message, f.severity, f.document
+
+
+def _diff(old: list[Finding], new: list[Finding]) -> tuple[list[Finding], list[Finding]]:
+    """Findings only in ``new`` and only in ``old`` (multiset semantics, order kept)."""
+    before = Counter(_finding_key(f) for f in old)
+    after = Counter(_finding_key(f) for f in new)
+    added_left = after - before
+    removed_left = before - after
+    added: list[Finding] = []
+    removed: list[Finding] = []
+    for f in new:
+        k = _finding_key(f)
+        if added_left[k] > 0:
+            added_left[k] -= 1
+            added.append(f)
+    for f in old:
+        k = _finding_key(f)
+        if removed_left[k] > 0:
+            removed_left[k] -= 1
+            removed.append(f)
+    return added, removed
+
+
+class Watcher:
+    """
+    Incremental re-linting for ``dltlint --watch``.
+
+    Keeps ``(mtime, size)`` stamps of the discovered pipeline files, of every directory under the
+    input paths and of every config file that can apply to them. Each `poll` only stats those
+    paths: changed files are re-linted, a changed directory re-runs discovery, and a changed config
+    re-resolves config and re-lints everything. It returns the findings that appeared and vanished.
+    """
+
+    def __init__(
+        self: Watcher, paths: Iterable[str], *, cfg: ToolConfig, overrides: dict[str, Any] | None = None
+    ) -> None:
+        self.paths = list(paths)
+        self.cfg = cfg
+        self.overrides = overrides or {}
+        self.resolver = ConfigResolver(fallback=cfg, overrides=self.overrides)
+        self.findings: dict[str, list[Finding]] = {}
+        self.errors: dict[str, str] = {}
+        self._files: dict[str, Stamp] = {}
+        self._dirs: dict[str, Stamp] = {}
+        self._configs: dict[str, Stamp] = {}
+
+    # -- snapshots -----------------------------------------------------------
+
+    def _scan_dirs(self: Watcher) -> dict[str, Stamp]:
+        dirs: dict[str, Stamp] = {}
+        for p in self.paths:
+            if os.path.isdir(p):
+                for d, _, _ in os.walk(p):
+                    dirs[d] = _stamp(d)
+        return dirs
+
+    def _scan_configs(self: Watcher) -> dict[str, Stamp]:
+        chains = {os.path.abspath(d) for d in self._dirs}
+        chains.update(os.path.dirname(os.path.abspath(f)) for f in self._files)
+        chains.add(os.path.abspath(os.getcwd()))
+        seen: set[str] = set()
+        for start in chains:
+            cur = start
+            while cur not in seen:
+                seen.add(cur)
+                parent = os.path.dirname(cur)
+                if parent == cur:
+                    break
+                cur = parent
+        return {os.path.join(d, name): _stamp(os.path.join(d, name)) for d in seen for name in CONFIG_FILES}
+
+    def _discover(self: Watcher) -> None:
+        self._dirs = self._scan_dirs()
+        self._files = {str(p): _stamp(str(p)) for p in find_pipeline_files(self.paths)}
+        self._configs = self._scan_configs()
+
+    # -- linting -------------------------------------------------------------
+
+    def _lint_file(self: Watcher, path: str) -> list[Finding]:
+        try:
+            findings = lint_paths([path], cfg=self.cfg, resolver=self.resolver)
+        except Exception as e:
+            self.errors[path] = str(e)
+            print(f"dltlint: {path}: {e}", file=sys.stderr)
+            return []
+        self.errors.pop(path, None)
+        return findings
+
+    def start(self: Watcher) -> list[Finding]:
+        """Discover and lint everything; returns all findings in discovery order."""
+        self._discover()
+        self.findings = {p: self._lint_file(p) for p in self._files}
+        return [f for fs in self.findings.values() for f in fs]
+
+    def poll(self: Watcher) -> tuple[list[Finding], list[Finding]]:
+        """Re-lint what changed since the last call; returns ``(added, removed)`` findings."""
+        relint_all = any(_stamp(p) != s for p, s in self._configs.items())
+        if relint_all:
+            self.cfg = replace(load_config(Path.cwd()), **self.overrides)
+            self.resolver = ConfigResolver(fallback=self.cfg, overrides=self.overrides)
+
+        old_files = self._files
+        if relint_all or any(_stamp(d) != s for d, s in self._dirs.items()):
+            self._discover()
+        else:
+            self._files = {p: _stamp(p) for p in old_files}
+
+        added: list[Finding] = []
+        removed: list[Finding] = []
+        for p in [p for p in self.findings if p not in self._files]:
+            removed.extend(self.findings.pop(p))
+            self.errors.pop(p, None)
+        for p, stamp in self._files.items():
+            if not relint_all and old_files.get(p) == stamp and p in self.findings:
+                continue
+            new = self._lint_file(p)
+            a, r = _diff(self.findings.get(p, []), new)
+            added.extend(a)
+            removed.extend(r)
+            self.findings[p] = new
+        return added, removed
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+from dltlint.config import ToolConfig
+from dltlint.core import find_pipeline_files, lint_paths
+
+BAD = b"catalog: c\nschema: s\nbogus: 1\n"
+OK = b"name: n\ncatalog: c\nschema: s\n"
+
+
+def make_tar(path: Path, members: dict[str, bytes]) -> Path:
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return path
+
+
+def make_zip(path: Path, members: dict[str, bytes]) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+def test_tar_members_are_linted_in_place(tmp_path: Path):
+    tar = make_tar(
+        tmp_path / "release.tar.gz",
+        {"./src/a.pipeline.yml": BAD, "src/readme.md": b"# not a pipeline", "src/b.pipeline.yml": OK},
+    )
+    findings = lint_paths([str(tar)], cfg=ToolConfig())
+    assert {(f.code, f.file) for f in findings} == {
+        ("DLT010", f"{tar}!src/a.pipeline.yml"),
+        ("DLT400", f"{tar}!src/a.pipeline.yml"),
+    }
+    assert findings[0].path.startswith(f"{tar}!src/a.pipeline.yml.")
+
+
+def test_zip_members_inline_suppressions_and_order(tmp_path: Path):
+    z = make_zip(
+        tmp_path / "release.zip",
+        {"z.pipeline.yml": BAD, "a.pipeline.yaml": b"# dltlint: disable=DLT4\n" + BAD, "dir/": b""},
+    )
+    plain = tmp_path / "plain.pipeline.yml"
+    plain.write_bytes(BAD)
+    findings = lint_paths([str(plain), str(z)], cfg=ToolConfig(read_ahead=2))
+    assert [(Path(f.file).name, f.code) for f in findings] == [
+        ("plain.pipeline.yml", "DLT010"),
+        ("plain.pipeline.yml", "DLT400"),
+        ("release.zip!a.pipeline.yaml", "DLT010"),
+        ("release.zip!z.pipeline.yml", "DLT010"),
+        ("release.zip!z.pipeline.yml", "DLT400"),
+    ]
+
+
+def test_archives_are_only_picked_up_when_named(tmp_path: Path):
+    make_zip(tmp_path / "r.zip", {"x.pipeline.yml": BAD})
+    assert find_pipeline_files([str(tmp_path)]) == []
+    assert find_pipeline_files([str(tmp_path / "r.zip")]) == [tmp_path / "r.zip"]
+
+
+def test_cli_corrupt_archive_exits_2(tmp_path: Path):
+    (tmp_path / "broken.zip").write_bytes(b"not a zip")
+    r = subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", "broken.zip"], cwd=tmp_path, capture_output=True, text=True, check=False
+    )
+    assert r.returncode == 2
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from dltlint.baseline import Baseline, fingerprint, normalize_path
+from dltlint.models import Finding, Severity
+
+
+def run_cli(tmp_path: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", *args],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_normalize_path_strips_base_and_dot_prefix():
+    assert normalize_path("/repo/a/x.pipeline.yml.name", "/repo") == "a/x.pipeline.yml.name"
+    assert normalize_path("./a/x.pipeline.yml", "/repo") == "a/x.pipeline.yml"
+    assert normalize_path("/elsewhere/x.pipeline.yml", "/repo") == "/elsewhere/x.pipeline.yml"
+
+
+def test_fingerprint_ignores_severity_and_invocation_path():
+    a = Finding(code="DLT010", message="Unknown top-level field 'x'", path="/repo/p.pipeline.yml.x")
+    b = Finding(code="DLT010", message="Unknown top-level field 'x'", path="p.pipeline.yml.x", severity=Severity.INFO)
+    c = Finding(code="DLT010", message="Unknown top-level field 'y'", path="p.pipeline.yml.x")
+    assert fingerprint(a, "/repo") == fingerprint(b, "/repo")
+    assert fingerprint(a, "/repo") != fingerprint(c, "/repo")
+    assert len(fingerprint(a, "/repo")) == 16
+
+
+def test_baseline_roundtrip_and_filter(tmp_path: Path):
+    old = Finding(code="DLT400", message="Missing recommended field 'name'", path="/repo/a.pipeline.yml")
+    new = Finding(code="DLT400", message="Missing recommended field 'name'", path="/repo/b.pipeline.yml")
+    out = tmp_path / "baseline.json"
+    Baseline.from_findings([old, old], base="/repo").write(out)
+
+    loaded = Baseline.load(out, base="/repo")
+    assert len(loaded) == 1
+    assert loaded.filter([old, new]) == [new]
+
+
+def test_baseline_load_rejects_foreign_files(tmp_path: Path):
+    bad = tmp_path / "b.json"
+    bad.write_text('{"version": 99}', encoding="utf-8")
+    with pytest.raises(ValueError, match="not a dltlint baseline"):
+        Baseline.load(bad)
+
+
+def test_cli_baseline_reports_only_new_findings(tmp_path: Path):
+    (tmp_path / "legacy.pipeline.yml").write_text("catalog: c\nschema: s\nbogus: 1\n", encoding="utf-8")
+    cp = run_cli(tmp_path, "--baseline", "baseline.json", "--write-baseline", ".")
+    assert cp.returncode == 0, cp.stderr
+    assert "2 finding(s)" in cp.stdout
+
+    cp = run_cli(tmp_path, "--baseline", "baseline.json", "--fail-on", "warning", ".")
+    assert cp.returncode == 0, cp.stdout + cp.stderr
+    assert cp.stdout == ""
+
+    (tmp_path / "fresh.pipeline.yml").write_text("name: f\ncatalog: c\ntarget: t\n", encoding="utf-8")
+    cp = run_cli(tmp_path, "--baseline", "baseline.json", str(tmp_path))
+    assert cp.returncode == 1
+    assert "DLT300" in cp.stdout
+    assert "DLT010" not in cp.stdout
+
+
+def test_cli_write_baseline_requires_file(tmp_path: Path):
+    cp = run_cli(tmp_path, "--write-baseline")
+    assert cp.returncode == 2
+    assert "--baseline" in cp.stderr
+
+
+def test_cli_write_baseline_rejects_statistics(tmp_path: Path):
+    cp = run_cli(tmp_path, "--statistics", "--write-baseline", "--baseline", "b.json")
+    assert cp.returncode == 2
+    assert "--statistics" in cp.stderr
+    assert not (tmp_path / "b.json").exists()
@@ -4,6 +4,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 from dltlint.core import find_pipeline_files
 
 
@@ -55,3 +57,30 @@ target: legacy_db  # conflict with modern form -> expect DLT300
     cp = run_cli(tmp_path, str(tmp_path))
     assert cp.returncode == 1  # findings triggered failure
     assert "DLT300" in (cp.stdout + cp.stderr)
+
+
+@pytest.mark.parametrize(
+    "flag",
+    [
+        ["--baseline", "b.json"],
+        ["--fail-fast"],
+        ["--max-findings", "5"],
+        ["--statistics"],
+        ["--shard", "1/2"],
+        ["--cross-file"],
+    ],
+)
+def test_cli_watch_rejects_flags_it_cannot_honor(tmp_path: Path, flag: list[str]):
+    cp = run_cli(tmp_path, "--watch", *flag)
+    assert cp.returncode == 2
+    assert flag[0] in cp.stderr
+
+
+@pytest.mark.parametrize(
+    "flag", [["--baseline", "b.json"], ["--fail-fast"], ["--max-findings", "5"], ["--statistics"], ["--cross-file"]]
+)
+def test_cli_streaming_modes_reject_flags_they_cannot_honor(tmp_path: Path, flag: list[str]):
+    for mode in (["--snapshot", "snapshot.json"], ["--stdin-ndjson"]):
+        cp = run_cli(tmp_path, *mode, *flag)
+        assert cp.returncode == 2
+        assert flag[0] in cp.stderr
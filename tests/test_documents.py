@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from dltlint.config import ToolConfig
+from dltlint.core import iter_lint_documents, lint_documents
+
+
+def test_lint_documents_accepts_text_bytes_and_parsed():
+    docs = [
+        ("a.pipeline.yml", "catalog: c\nschema: s\nbogus: 1\n"),
+        ("b.pipeline.json", b'{"name": "b", "edition": "X"}'),
+        ("c", {"name": "c", "catalog": "c", "target": "t"}),
+    ]
+    by_name = {name: {f.code for f in findings} for name, findings in iter_lint_documents(docs)}
+    assert by_name == {
+        "a.pipeline.yml": {"DLT010", "DLT400"},
+        "b.pipeline.json": {"DLT201"},
+        "c": {"DLT300"},
+    }
+
+
+def test_lint_documents_applies_config_and_inline_suppressions():
+    cfg = ToolConfig(ignore=["DLT201"], require=["catalog"], severity_overrides={"DLT400": "info"})
+    findings = lint_documents(
+        [
+            ("x", "# dltlint: disable=DLT010\nname: x\nschema: s\nedition: X\nbogus: 1\n"),
+            ("y", {"resources": {"pipelines": {"p": {"name": "p", "catalog": "c"}}}}),
+        ],
+        cfg=cfg,
+    )
+    assert [(f.code, f.path, f.severity) for f in findings] == [("DLT400", "x", "info")]
+    assert findings[0].message == "Missing required field 'catalog'"
+
+
+def test_cli_stdin_ndjson_streams_records(tmp_path: Path):
+    records = [
+        {"name": "ok", "spec": {"name": "ok", "catalog": "c", "schema": "s"}},
+        {"name": "bad", "spec": "name: bad\ncatalog: c\ntarget: t\n"},
+    ]
+    cp = subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", "--stdin-ndjson", "--format", "json"],
+        cwd=tmp_path,
+        input="\n".join(json.dumps(r) for r in records) + "\n",
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert cp.returncode == 1, cp.stderr
+    out = [json.loads(line) for line in cp.stdout.splitlines()]
+    assert [r["name"] for r in out] == ["ok", "bad"]
+    assert out[0]["findings"] == []
+    assert [f["code"] for f in out[1]["findings"]] == ["DLT300"]
+
+
+def test_cli_stdin_ndjson_rejects_malformed_record(tmp_path: Path):
+    cp = subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", "--stdin-ndjson"],
+        cwd=tmp_path,
+        input='{"name": "missing spec"}\n',
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert cp.returncode == 2
+    assert "spec" in cp.stderr
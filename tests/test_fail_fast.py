@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+from dltlint.config import ToolConfig
+from dltlint.core import iter_lint_files
+
+
+def run_cli(tmp_path: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", *args],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def write_files(tmp_path: Path) -> None:
+    # a: two warnings; b: a warning then an error; c: another error
+    (tmp_path / "a.pipeline.yml").write_text("name: n\ncatalog: c\nschema: s\nx: 1\ny: 2\n", encoding="utf-8")
+    (tmp_path / "b.pipeline.yml").write_text("name: n\ncatalog: c\nschema: s\nz: 1\ncontinuous: 3\n", encoding="utf-8")
+    (tmp_path / "c.pipeline.yml").write_text("name: n\ncatalog: c\nschema: s\ndevelopment: 3\n", encoding="utf-8")
+
+
+def test_fail_fast_stops_at_first_blocking_finding(tmp_path: Path):
+    write_files(tmp_path)
+    r = run_cli(tmp_path, "--fail-fast", "--format", "json")
+    assert r.returncode == 1, r.stderr
+    got = json.loads(r.stdout)
+    assert [(x["code"], Path(x["path"]).name.split(".")[0]) for x in got] == [
+        ("DLT010", "a"),
+        ("DLT010", "a"),
+        ("DLT010", "b"),
+        ("DLT101", "b"),
+    ]
+
+    r = run_cli(tmp_path, "--fail-fast", "--fail-on", "warning", "--format", "json", "--read-ahead", "2")
+    assert r.returncode == 1
+    assert len(json.loads(r.stdout)) == 1
+
+
+def test_max_findings_truncates_and_keeps_exit_code(tmp_path: Path):
+    write_files(tmp_path)
+    r = run_cli(tmp_path, "--max-findings", "3", "--format", "json")
+    assert [x["severity"] for x in json.loads(r.stdout)] == ["warning"] * 3
+    assert r.returncode == 1  # b's error was produced before stopping, only cut from the report
+
+    r = run_cli(tmp_path, "--max-findings", "2", "--format", "json")
+    assert len(json.loads(r.stdout)) == 2
+    assert r.returncode == 1  # the cap is reached in a, but b is still linted for the exit code
+
+    r = run_cli(tmp_path, "--max-findings", "4", "--format", "json")
+    assert len(json.loads(r.stdout)) == 4
+    assert r.returncode == 1
+
+    assert run_cli(tmp_path, "--max-findings", "0").returncode == 2
+
+
+def test_closing_iter_lint_files_stops_pulling_files(tmp_path: Path):
+    paths = []
+    for i in range(100):
+        p = tmp_path / f"p{i:03}.pipeline.yml"
+        p.write_text("name: n\n", encoding="utf-8")
+        paths.append(p)
+    pulled = []
+
+    def source() -> Iterator[Path]:
+        for p in paths:
+            pulled.append(p)
+            yield p
+
+    it = iter_lint_files(source(), cfg=ToolConfig(read_ahead=2))
+    first, _ = next(it)
+    it.close()
+    assert first == paths[0]
+    assert len(pulled) <= 2 * 4 + 1
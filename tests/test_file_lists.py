@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from dltlint.core import find_pipeline_files
+
+
+def write(p: Path, name: str, text: str = "name: x\n") -> Path:
+    f = p / name
+    f.parent.mkdir(parents=True, exist_ok=True)
+    f.write_text(text, encoding="utf-8")
+    return f
+
+
+def run_cli(tmp_path: Path, *args: str, stdin: str | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", *args],
+        cwd=tmp_path,
+        input=stdin,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_explicit_files_are_checked_in_bulk(tmp_path: Path):
+    a = write(tmp_path, "a.pipeline.yml")
+    b = write(tmp_path, "sub/b.pipeline.yaml")
+    write(tmp_path, "sub/notes.yml")
+    nested = write(tmp_path, "odd.pipeline.yml/c.pipeline.yml")  # a directory with a pipeline suffix
+    paths = [
+        str(b),
+        str(a),
+        str(tmp_path / "missing.pipeline.yml"),
+        str(tmp_path / "sub" / "notes.yml"),
+        str(tmp_path / "odd.pipeline.yml"),
+        str(tmp_path / "sub" / "." / "b.pipeline.yaml"),
+    ]
+    assert find_pipeline_files(paths) == [a, nested, b]
+
+
+def test_relative_names_in_the_working_directory(tmp_path: Path, monkeypatch):
+    write(tmp_path, "a.pipeline.yml")
+    monkeypatch.chdir(tmp_path)
+    assert find_pipeline_files(["a.pipeline.yml", "b.pipeline.yml"]) == [Path("a.pipeline.yml")]
+
+
+def test_argfile_one_path_per_line(tmp_path: Path):
+    write(tmp_path, "a.pipeline.yml", "name: a\nbogus: 1\n")
+    write(tmp_path, "b.pipeline.yml", "name: b\nbogus: 1\n")
+    (tmp_path / "args.txt").write_text("--fail-on\nwarning\n\na.pipeline.yml\n", encoding="utf-8")
+    r = run_cli(tmp_path, "@args.txt")
+    assert r.returncode == 1
+    assert "a.pipeline.yml" in r.stdout
+    assert "b.pipeline.yml" not in r.stdout
+
+
+def test_files_from_file_and_stdin(tmp_path: Path):
+    write(tmp_path, "a.pipeline.yml", "name: a\nbogus: 1\n")
+    write(tmp_path, "b.pipeline.yml", "name: b\nbogus: 1\n")
+    (tmp_path / "list.txt").write_text("b.pipeline.yml\n", encoding="utf-8")
+    r = run_cli(tmp_path, "--files-from", "list.txt")
+    assert "b.pipeline.yml" in r.stdout
+    assert "a.pipeline.yml" not in r.stdout
+
+    r = run_cli(tmp_path, "--files-from", "-", stdin="a.pipeline.yml\0b.pipeline.yml\0")
+    assert "a.pipeline.yml" in r.stdout
+    assert "b.pipeline.yml" in r.stdout
+
+
+def test_empty_files_from_lints_nothing(tmp_path: Path):
+    write(tmp_path, "a.pipeline.yml", "name: a\nbogus: 1\n")
+    r = run_cli(tmp_path, "--files-from", "-", stdin="")
+    assert r.returncode == 0
+    assert "no matching" in r.stdout
+
+
+def test_unreadable_files_from(tmp_path: Path):
+    r = run_cli(tmp_path, "--files-from", "nope.txt")
+    assert r.returncode == 2
+    assert "cannot read --files-from" in r.stderr
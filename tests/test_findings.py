@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from dltlint.config import ToolConfig
+from dltlint.core import lint_documents, lint_pipeline
+from dltlint.models import Finding, Issue, Severity
+
+
+def test_path_and_message_render_from_file_loc_and_template():
+    f = Finding(code="DLT010", file="a.pipeline.yml", loc=("clusters", 0, "x"), template="Unknown '{}'", args=("x",))
+    assert f.path == "a.pipeline.yml.clusters[0].x"
+    assert f.message == "Unknown 'x'"
+    dumped = f.model_dump()
+    assert dumped["path"] == f.path
+    assert dumped["message"] == f.message
+    assert dumped["loc"] == ("clusters", 0, "x")
+    assert "template" not in dumped
+    assert "args" not in dumped
+
+
+def test_findings_from_issues_match_validated_ones():
+    issue = Issue("DLT010", ("clusters", 0, "x"), "Unknown '{}'", ("x",))
+    fast = Finding.from_issue(issue, "a.pipeline.yml", Severity.WARNING, 2)
+    slow = Finding(
+        code="DLT010",
+        severity="warning",
+        document=2,
+        file="a.pipeline.yml",
+        loc=issue.loc,
+        template=issue.template,
+        args=("x",),
+    )
+    assert fast == slow
+    assert fast.message == "Unknown 'x'"  # rendered once and kept
+    assert fast == slow
+    assert fast.model_dump() == slow.model_dump()
+    assert fast.model_dump_json() == slow.model_dump_json()
+
+
+def test_literal_message_and_path_are_kept_verbatim():
+    f = Finding(code="DLT400", message="Missing {braces}", path="x.pipeline.yml", severity=Severity.INFO)
+    assert f.message == "Missing {braces}"
+    assert f.path == "x.pipeline.yml"
+    assert f.loc == ()
+
+
+def test_lint_pipeline_locations_are_structured():
+    doc = {"resources": {"pipelines": {1: {"name": "n", "libraries": [{"notebook": {"path": 3}}], 2: "x"}}}}
+    got = {(f.code, f.loc) for f in lint_pipeline(doc, root="f.yml")}
+    assert ("DLT422", ("resources", "pipelines", "1", "libraries", 0)) in got
+    assert ("DLT010", ("resources", "pipelines", "1", "2")) in got
+    assert {f.path for f in lint_pipeline(doc, root="f.yml") if f.code == "DLT010"} == {"f.yml.resources.pipelines.1.2"}
+
+
+def test_ignored_codes_never_become_findings():
+    cfg = ToolConfig(ignore=["DLT010"], severity_overrides={"DLT400": Severity.INFO})
+    findings = lint_documents([("d", {"bogus": 1})], cfg=cfg)
+    assert [(f.code, f.severity, f.file) for f in findings] == [("DLT400", Severity.INFO, "d")]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from dltlint.config import ToolConfig
+from dltlint.core import cross_file_findings, lint_paths
+from dltlint.index import PipelineIndex
+
+
+def w(p: Path, name: str, text: str) -> Path:
+    f = p / name
+    f.write_text(text, encoding="utf-8")
+    return f
+
+
+BUNDLE_A = """
+resources:
+  pipelines:
+    ingest:
+      name: ingest
+      catalog: main
+      schema: raw
+    other:
+      name: "${var.name}"
+      catalog: main
+      schema: "${var.schema}"
+"""
+
+BUNDLE_B = """
+resources:
+  pipelines:
+    ingest:
+      name: ingest-b
+      catalog: main
+      schema: raw
+"""
+
+STANDALONE = "id: x\nname: ingest\ncatalog: c\nschema: s\n"
+
+
+def test_cross_file_duplicates_are_reported_after_the_first_definition(tmp_path: Path):
+    a = w(tmp_path, "a.pipeline.yml", BUNDLE_A)
+    b = w(tmp_path, "b.pipeline.yml", BUNDLE_B)
+    s = w(tmp_path, "s.pipeline.yml", STANDALONE)
+    findings = [f for f in lint_paths([str(tmp_path)], cross_file=True) if f.code.startswith("DLT5")]
+    assert [(f.code, f.path, f.message) for f in findings] == [
+        (
+            "DLT500",
+            f"{b}.resources.pipelines.ingest",
+            f"Pipeline id 'ingest' is also defined at {a}.resources.pipelines.ingest",
+        ),
+        (
+            "DLT502",
+            f"{b}.resources.pipelines.ingest",
+            f"Pipeline publishes to 'main.raw', as does {a}.resources.pipelines.ingest",
+        ),
+        ("DLT501", str(s), f"Pipeline name 'ingest' is also used at {a}.resources.pipelines.ingest"),
+    ]
+    assert not [f for f in lint_paths([str(tmp_path)]) if f.code.startswith("DLT5")]
+
+
+def test_merge_is_order_independent(tmp_path: Path):
+    docs = [
+        ("a.yml", {"resources": {"pipelines": {"p": {"name": "n"}}}}),
+        ("b.yml", {"resources": {"pipelines": {"p": {"name": "n"}}}}),
+        ("c.yml", {"name": "n", "target": "t"}),
+        ("d.yml", {"name": "m", "target": "t"}),
+    ]
+    whole = PipelineIndex()
+    for file, doc in docs:
+        whole.add(doc, file)
+    left, right = PipelineIndex(), PipelineIndex()
+    for file, doc in reversed(docs[:2]):
+        right.add(doc, file)
+    for file, doc in docs[2:]:
+        left.add(doc, file)
+    merged = left.merge(right)
+
+    def dump(index: PipelineIndex) -> list[dict]:
+        return [f.model_dump() for _, fs in cross_file_findings(index, cfg=ToolConfig()) for f in fs]
+
+    assert dump(merged) == dump(whole)
+    assert [f["code"] for f in dump(whole)] == ["DLT500", "DLT501", "DLT501", "DLT502"]
+
+    parts = whole.by_file()
+    assert sorted(parts) == ["a.yml", "b.yml", "c.yml", "d.yml"]
+    rejoined = PipelineIndex()
+    for part in parts.values():
+        rejoined.merge(part)
+    assert dump(rejoined) == dump(whole)
+
+
+def test_cli_cross_file_honours_policy_and_inline_suppressions(tmp_path: Path):
+    w(tmp_path, "a.pipeline.yml", BUNDLE_A)
+    w(tmp_path, "b.pipeline.yml", "# dltlint: disable=DLT500\n" + BUNDLE_B)
+    w(tmp_path, "pyproject.toml", "[tool.dltlint]\ncross_file = true\nignore = ['DLT502']\n")
+    r = subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", "--format", "json", "."],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert r.returncode == 0, r.stderr
+    assert r.stdout == ""
+
+    w(tmp_path, "pyproject.toml", "[tool.dltlint]\ncross_file = true\n")
+    r = subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", "--statistics", "--format", "json", "."],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    stats = json.loads(r.stdout)
+    assert stats["files"] == 2
+    assert stats["by_code"] == [{"code": "DLT502", "severity": "warning", "count": 1}]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from dltlint.junit import JUnitWriter
+from dltlint.models import Finding, Severity
+
+
+def run_cli(tmp_path: Path, *args: str, stdin: str | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", *args],
+        cwd=tmp_path,
+        input=stdin,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def cases(xml: str) -> dict[str, ET.Element]:
+    root = ET.fromstring(xml)
+    assert root.tag == "testsuites"
+    return {c.get("name"): c for c in root.iter("testcase")}
+
+
+def test_one_case_per_file_failing_at_threshold(tmp_path: Path):
+    (tmp_path / "a.pipeline.yml").write_text("name: a\nchannel: beta\nbogus: 1\n", encoding="utf-8")
+    (tmp_path / "b.pipeline.yml").write_text("name: b\ncatalog: main\nschema: s\n", encoding="utf-8")
+
+    cp = run_cli(tmp_path, "--format", "junit", ".")
+    assert cp.returncode == 1, cp.stderr
+    by_name = cases(cp.stdout)
+    assert set(by_name) == {"a.pipeline.yml", "b.pipeline.yml"}
+    a, b = by_name["a.pipeline.yml"], by_name["b.pipeline.yml"]
+    assert [f.get("type") for f in a.findall("failure")] == ["DLT200"]
+    assert "DLT010" in a.findtext("system-out")  # warning, below --fail-on error
+    assert list(b) == []
+
+    cp = run_cli(tmp_path, "--format", "junit", "--fail-on", "warning", ".")
+    assert cp.returncode == 1
+    assert [f.get("type") for f in cases(cp.stdout)["a.pipeline.yml"].findall("failure")] == ["DLT010", "DLT200"]
+
+
+def test_clean_and_empty_runs_are_valid_reports(tmp_path: Path):
+    cp = run_cli(tmp_path, "--format", "junit", ".")
+    assert cp.returncode == 0
+    assert cases(cp.stdout) == {}
+
+    (tmp_path / "b.pipeline.yml").write_text("name: b\ncatalog: main\nschema: s\n", encoding="utf-8")
+    cp = run_cli(tmp_path, "--format", "junit", ".")
+    assert cp.returncode == 0
+    assert list(cases(cp.stdout)) == ["b.pipeline.yml"]
+
+
+def test_stdin_records_are_cases(tmp_path: Path):
+    lines = [json.dumps({"name": "ok", "spec": {"name": "x", "catalog": "c", "schema": "s"}}), '{"spec": "[1]"}']
+    cp = run_cli(tmp_path, "--stdin-ndjson", "--format", "junit", stdin="\n".join(lines))
+    assert cp.returncode == 1
+    by_name = cases(cp.stdout)
+    assert list(by_name) == ["ok", "<stdin:2>"]
+    assert [f.get("type") for f in by_name["<stdin:2>"].findall("failure")] == ["DLT001"]
+
+
+def test_junit_rejects_statistics(tmp_path: Path):
+    cp = run_cli(tmp_path, "--format", "junit", "--statistics")
+    assert cp.returncode == 2
+    assert "--format junit" in cp.stderr
+
+
+def test_text_is_escaped_and_made_xml_safe():
+    finding = Finding(code="DLT010", severity=Severity.ERROR, file="a&<b>.yml", loc=("k\x01",), template="bad")
+    out = io.StringIO()
+    with JUnitWriter(out, Severity.ERROR) as junit:
+        junit.testcase("a&<b>.yml", [finding])
+    assert junit.failed == 1
+    case = cases(out.getvalue())["a&<b>.yml"]
+    assert "k\ufffd" in case.find("failure").text
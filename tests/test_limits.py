@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import tarfile
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from dltlint.config import ConfigResolver, ToolConfig
+from dltlint.core import lint_paths
+from dltlint.limits import LimitExceeded, Limits, load, load_all
+from dltlint.reader import read_source
+
+
+def w(p: Path, name: str, text: str) -> Path:
+    f = p / name
+    f.write_text(text, encoding="utf-8")
+    return f
+
+
+LAUGHS = """
+a: &a ["lol", "lol", "lol", "lol", "lol", "lol", "lol", "lol", "lol"]
+b: &b [*a, *a, *a, *a, *a, *a, *a, *a, *a]
+c: &c [*b, *b, *b, *b, *b, *b, *b, *b, *b]
+d: &d [*c, *c, *c, *c, *c, *c, *c, *c, *c]
+e: &e [*d, *d, *d, *d, *d, *d, *d, *d, *d]
+f: &f [*e, *e, *e, *e, *e, *e, *e, *e, *e]
+g: &g [*f, *f, *f, *f, *f, *f, *f, *f, *f]
+h: [*g, *g, *g, *g, *g, *g, *g, *g, *g]
+"""
+
+
+def codes(findings: list) -> list[str]:
+    return [f.code for f in findings]
+
+
+def test_alias_expansion_is_reported(tmp_path: Path) -> None:
+    f = w(tmp_path, "laughs.pipeline.yml", LAUGHS)
+    out = lint_paths([f], cfg=ToolConfig())
+    assert codes(out) == ["DLT003"]
+    assert out[0].severity.value == "error"
+    assert "aliases are expanded" in out[0].message
+
+
+def test_limits_are_enforced_while_loading() -> None:
+    with pytest.raises(LimitExceeded, match="YAML aliases"):
+        load("a: &a 1\nb: [*a, *a, *a]\n", Limits(max_aliases=2))
+    with pytest.raises(LimitExceeded, match="nesting"):
+        load("a: " + "[" * 20 + "]" * 20, Limits(max_depth=10))
+    assert load("a: &a [1, 2]\nb: *a\n", Limits(max_aliases=1, max_depth=3, max_nodes=10)) == {
+        "a": [1, 2],
+        "b": [1, 2],
+    }
+
+
+def test_time_budget_counts_only_loading() -> None:
+    # past the clock-read interval, but far quicker to load than the budget
+    stream = "---\n".join("[" + ", ".join(["1"] * 1100) + "]\n" for _ in range(4))
+    docs = 0
+    for _ in load_all(stream, Limits(time_budget=1.0)):
+        docs += 1
+        time.sleep(0.4)  # the consumer linting the document
+    assert docs == 4
+
+
+def test_node_limit_is_per_document() -> None:
+    stream = "---\n".join("[" + ", ".join(["1"] * 600) + "]\n" for _ in range(3))
+    assert len(list(load_all(stream, Limits(max_nodes=1000)))) == 3
+    with pytest.raises(LimitExceeded, match="nodes"):
+        load("a: &a [" + ", ".join(["1"] * 600) + "]\nb: *a\n", Limits(max_nodes=1000))
+
+
+def test_oversized_file_is_not_parsed(tmp_path: Path) -> None:
+    f = w(tmp_path, "big.pipeline.yml", "name: x\n" + "# padding\n" * 100)
+    out = lint_paths([f], cfg=ToolConfig(max_file_bytes=100))
+    assert codes(out) == ["DLT003"]
+    assert "bytes" in out[0].message
+    assert "DLT003" not in codes(lint_paths([f], cfg=ToolConfig(max_file_bytes=0)))
+
+
+def test_limit_reported_on_the_offending_document(tmp_path: Path) -> None:
+    f = w(tmp_path, "multi.pipeline.yml", "name: ok\n---\n" + LAUGHS)
+    out = lint_paths([f], cfg=ToolConfig(multi_document=True))
+    assert [(x.code, x.document) for x in out if x.code == "DLT003"] == [("DLT003", 1)]
+
+
+def test_limit_finding_can_be_ignored(tmp_path: Path) -> None:
+    f = w(tmp_path, "laughs.pipeline.yml", LAUGHS)
+    assert lint_paths([f], cfg=ToolConfig(ignore=["DLT003"])) == []
+
+
+def test_regular_files_unaffected(tmp_path: Path) -> None:
+    f = w(tmp_path, "p.pipeline.yml", "base: &base\n  channel: CURRENT\nname: x\n<<: *base\n")
+    strict = ToolConfig(max_aliases=5, max_depth=10, max_nodes=100)
+    assert lint_paths([f], cfg=strict) == lint_paths([f], cfg=ToolConfig(max_aliases=0, max_depth=0, max_nodes=0))
+
+
+@pytest.mark.parametrize("suffix", [".zip", ".tar.gz"])
+def test_oversized_archive_member_is_not_decompressed(tmp_path: Path, suffix: str) -> None:
+    bomb = b"name: x\n" + b" " * (96 * 1024 * 1024)
+    archive = tmp_path / f"bomb{suffix}"
+    if suffix == ".zip":
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("big.pipeline.yml", bomb)
+    else:
+        src = w(tmp_path, "big.pipeline.yml", "")
+        src.write_bytes(bomb)
+        with tarfile.open(archive, "w:gz") as tf:
+            tf.add(src, arcname="big.pipeline.yml")
+        src.unlink()
+    del bomb
+
+    tracemalloc.start()
+    try:
+        out = lint_paths([str(archive)], cfg=ToolConfig(max_file_bytes=1024 * 1024))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert codes(out) == ["DLT003"]
+    # Skipping the rest of a gzip-streamed tar member inflates one read buffer at a time, which
+    # costs tens of MiB for all-space data; the member is never held whole
+    assert peak < (16 if suffix == ".zip" else 40) * 1024 * 1024
+
+
+def test_plain_reads_stop_past_the_limit(tmp_path: Path) -> None:
+    f = w(tmp_path, "big.pipeline.yml", "x" * 1000)
+    assert len(read_source(f, size_limit=100)) == 101
+    assert len(read_source(f)) == 1000
+
+
+def test_read_limit_applies_when_directory_config_allows_more(tmp_path: Path) -> None:
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "dltlint.toml").write_text("max_file_bytes = 0\n", encoding="utf-8")
+    f = w(sub, "big.pipeline.yml", "name: x\n" + "# padding\n" * 100)
+    cfg = ToolConfig(max_file_bytes=100)
+    assert codes(lint_paths([f], cfg=cfg, resolver=ConfigResolver(fallback=cfg))) == ["DLT003"]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from dltlint.config import ToolConfig
+from dltlint.core import lint_documents, lint_paths
+from dltlint.linter import Linter
+
+BAD = "name: a\nchannel: beta\nbogus: 1\n"
+GOOD = "name: b\ncatalog: main\nschema: s\n"
+
+
+def test_unchanged_files_are_served_from_cache(tmp_path: Path):
+    a = tmp_path / "a.pipeline.yml"
+    a.write_text(BAD, encoding="utf-8")
+    (tmp_path / "b.pipeline.yml").write_text(GOOD, encoding="utf-8")
+    linter = Linter(ToolConfig(ignore=["DLT010"]))
+
+    first = linter.lint_files([tmp_path])
+    assert first == lint_paths([str(tmp_path)], cfg=ToolConfig(ignore=["DLT010"]))
+    assert [f.code for f in first] == ["DLT200"]
+    assert linter.lint_files([str(tmp_path)]) == first
+    assert (linter.hits, linter.misses) == (2, 2)
+
+    a.write_text(GOOD + "edition: pro\n", encoding="utf-8")
+    os.utime(a, ns=(1, 1))  # a different mtime even on coarse-grained filesystems
+    assert [f.code for f in linter.lint_files([tmp_path])] == ["DLT201"]
+    assert (linter.hits, linter.misses) == (3, 3)
+
+
+def test_cache_is_bounded(tmp_path: Path):
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.pipeline.yml").write_text(BAD, encoding="utf-8")
+    linter = Linter(cache_size=2)
+    linter.lint_files([tmp_path])
+    linter.lint_files([tmp_path / "a.pipeline.yml"])
+    assert (linter.hits, linter.misses) == (0, 4)
+
+    assert Linter(cache_size=0).lint_files([tmp_path]) == lint_paths([str(tmp_path)])
+
+
+def test_archive_members_are_attributed_to_the_archive(tmp_path: Path):
+    member = tmp_path / "m.pipeline.yml"
+    member.write_text(BAD, encoding="utf-8")
+    archive = tmp_path / "release.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(member, arcname="src/m.pipeline.yml")
+    member.unlink()
+    linter = Linter()
+    first = linter.lint_files([archive])
+    assert {f.file for f in first} == {f"{archive}!src/m.pipeline.yml"}
+    assert linter.lint_files([archive]) == first
+    assert linter.hits == 1
+    (tmp_path / "n.pipeline.yml").write_text(BAD, encoding="utf-8")  # same name as the member
+    cross = Linter(ToolConfig(cross_file=True)).lint_files([archive, tmp_path])
+    assert cross == lint_paths([str(archive), str(tmp_path)], cross_file=True)
+    assert "DLT501" in {f.code for f in cross}
+
+
+def test_cross_file_checks_span_cached_files(tmp_path: Path):
+    a = tmp_path / "a.pipeline.yml"
+    a.write_text(GOOD, encoding="utf-8")
+    (tmp_path / "b.pipeline.yml").write_text(GOOD, encoding="utf-8")
+    linter = Linter(ToolConfig(cross_file=True))
+
+    first = linter.lint_files([tmp_path])
+    assert first == lint_paths([str(tmp_path)], cross_file=True)
+    assert [f.code for f in first] == ["DLT501", "DLT502"]
+    assert linter.lint_files([tmp_path]) == first
+
+    a.write_text(GOOD.replace("name: b", "name: a").replace("schema: s", "schema: t"), encoding="utf-8")
+    os.utime(a, ns=(1, 1))
+    assert linter.lint_files([tmp_path]) == []
+    assert (linter.hits, linter.misses) == (3, 3)
+
+
+def test_text_and_documents(tmp_path: Path):
+    linter = Linter()
+    assert linter.lint_text(BAD, "a.pipeline.yml") == lint_documents([("a.pipeline.yml", BAD)])
+    assert linter.lint_text("# dltlint: disable DLT200\n" + BAD) == [
+        f for f in linter.lint_text(BAD) if f.code != "DLT200"
+    ]
+    assert [f.code for f in linter.lint_doc({"name": 1})] == ["DLT100"]
+    assert [f.code for f in linter.lint_doc([])] == ["DLT001"]
+
+
+def test_shared_between_threads(tmp_path: Path):
+    for i in range(20):
+        (tmp_path / f"p{i}.pipeline.yml").write_text(BAD if i % 2 else GOOD, encoding="utf-8")
+    expected = lint_paths([str(tmp_path)])
+    linter = Linter(cache_size=8)
+
+    def run(i: int) -> bool:
+        if i % 3 == 0:
+            return linter.lint_text(BAD, "x.pipeline.yml") == lint_documents([("x.pipeline.yml", BAD)])
+        return linter.lint_files([tmp_path]) == expected
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(run, range(64)))
+    assert len(linter._cache) <= 8
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from dltlint import merge
+from dltlint.config import ConfigResolver, ToolConfig
+from dltlint.merge import iter_result_findings, merge_results
+from dltlint.models import Finding, Severity
+
+
+def run_cli(tmp_path: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", *args],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def dump(findings: list[Finding]) -> list[dict]:
+    return [f.model_dump(mode="json") for f in findings]
+
+
+A1 = Finding(code="DLT010", message="Unknown top-level field 'x'", path="a.pipeline.yml", loc=("x",))
+A2 = Finding(code="DLT400", message="Missing required field 'catalog'", path="a.pipeline.yml")
+B1 = Finding(code="DLT010", message="Unknown top-level field 'y'", path="b.pipeline.yml", loc=("y",))
+
+
+def test_reads_arrays_and_json_lines():
+    array = io.BytesIO(json.dumps(dump([A1, B1]), indent=2).encode())
+    assert list(iter_result_findings(array)) == [A1, B1]
+    lines = "\n".join(
+        [
+            json.dumps(A1.model_dump(mode="json")),
+            json.dumps({"file": "snap.json", "pipeline": "p", "findings": dump([B1])}),
+        ]
+    )
+    assert list(iter_result_findings(io.BytesIO(lines.encode()))) == [A1, B1]
+    with pytest.raises(ValueError, match="record 1"):
+        list(iter_result_findings(io.BytesIO(b'{"files": 1}'), "x.json"))
+
+
+def write_results(tmp_path: Path, name: str, findings: list[Finding]) -> str:
+    f = tmp_path / name
+    f.write_text(json.dumps(dump(findings), indent=2), encoding="utf-8")
+    return str(f)
+
+
+@pytest.mark.parametrize("chunk", [50_000, 1])
+def test_merge_dedups_and_sorts(tmp_path: Path, monkeypatch, chunk: int):
+    monkeypatch.setattr(merge, "CHUNK_FINDINGS", chunk)
+    one = write_results(tmp_path, "one.json", [B1, A2])
+    two = write_results(tmp_path, "two.json", [A1, B1, A2])
+    resolver = ConfigResolver(fallback=ToolConfig())
+    assert list(merge_results([one, two], resolver)) == [A2, A1, B1]
+
+
+def test_merge_reapplies_policy(tmp_path: Path):
+    one = write_results(tmp_path, "one.json", [A1, A2, B1])
+    cfg = ToolConfig(ignore=["DLT400"], severity_overrides={"DLT010": Severity.INFO})
+    merged = list(merge_results([one], ConfigResolver(fallback=cfg)))
+    assert [(f.code, f.severity) for f in merged] == [("DLT010", Severity.INFO), ("DLT010", Severity.INFO)]
+
+
+def test_cli_merge_matches_a_single_run(tmp_path: Path):
+    for i in range(6):
+        (tmp_path / f"p{i}.pipeline.yml").write_text(f"name: p{i}\nbogus: 1\nchannel: nope\n", encoding="utf-8")
+    full = run_cli(tmp_path, "--format", "json", "--fail-on", "warning", ".")
+    for i in (1, 2):
+        shard = run_cli(tmp_path, "--format", "json", "--shard", f"{i}/2", ".")
+        (tmp_path / f"s{i}.json").write_text(shard.stdout, encoding="utf-8")
+    merged = run_cli(tmp_path, "merge", "--format", "json", "--fail-on", "warning", "s2.json", "s1.json", "s2.json")
+    assert merged.returncode == full.returncode == 1
+    # Same findings; merge orders them by file, document, location, code and message
+    assert sorted(map(json.dumps, json.loads(merged.stdout))) == sorted(map(json.dumps, json.loads(full.stdout)))
+
+    pretty = run_cli(tmp_path, "merge", "s1.json", "s2.json")
+    assert pretty.returncode == 1
+    assert pretty.stdout.count("DLT010") == 6
+
+
+def test_cli_merge_junit_has_one_case_per_file(tmp_path: Path):
+    (tmp_path / "s1.json").write_text(json.dumps(dump([A1, B1])), encoding="utf-8")
+    (tmp_path / "s2.json").write_text(json.dumps(dump([A2, A1])), encoding="utf-8")
+    r = run_cli(tmp_path, "merge", "--format", "junit", "--fail-on", "warning", "s1.json", "s2.json")
+    assert r.returncode == 1, r.stderr
+    cases = {c.get("name"): c for c in ET.fromstring(r.stdout).iter("testcase")}
+    assert list(cases) == ["a.pipeline.yml", "b.pipeline.yml"]
+    assert [f.get("type") for f in cases["a.pipeline.yml"].findall("failure")] == ["DLT400", "DLT010"]
+    assert [f.get("type") for f in cases["b.pipeline.yml"].findall("failure")] == ["DLT010"]
+
+    warning = A1.model_copy(update={"severity": Severity.WARNING})
+    (tmp_path / "s3.json").write_text(json.dumps(dump([warning])), encoding="utf-8")
+    r = run_cli(tmp_path, "merge", "--format", "junit", "s3.json")
+    assert r.returncode == 0  # below the default fail_on
+    assert [c.findtext("system-out") for c in ET.fromstring(r.stdout).iter("testcase")] == [
+        "warning DLT010 a.pipeline.yml.x: Unknown top-level field 'x'"
+    ]
+
+
+def test_cli_merge_errors(tmp_path: Path):
+    (tmp_path / "bad.json").write_text("[1]", encoding="utf-8")
+    r = run_cli(tmp_path, "merge", "bad.json")
+    assert r.returncode == 2
+    assert "not a dltlint finding" in r.stderr
+    r = run_cli(tmp_path, "merge", "missing.json")
+    assert r.returncode == 2
+
+
+def test_a_path_called_merge_is_linted(tmp_path: Path):
+    (tmp_path / "merge").mkdir()
+    (tmp_path / "merge" / "m.pipeline.yml").write_text("name: m\nbogus: 1\n", encoding="utf-8")
+    r = run_cli(tmp_path, "merge", "--format", "json")
+    assert [x["code"] for x in json.loads(r.stdout)] == ["DLT010"]
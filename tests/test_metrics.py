@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from dltlint.config import ToolConfig
+from dltlint.core import iter_lint_files
+from dltlint.metrics import Histogram, Metrics
+from dltlint.models import Finding, Severity
+
+
+def run_cli(tmp_path: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", *args],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def samples(text: str) -> dict[str, str]:
+    out = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            out[name] = value
+    return out
+
+
+def test_histogram_buckets_are_cumulative():
+    h = Histogram((0.1, 1.0))
+    for v in (0.05, 0.1, 0.5, 3.0):
+        h.observe(v)
+    assert h.samples("x") == [
+        'x_bucket{le="0.1"} 2',
+        'x_bucket{le="1.0"} 3',
+        'x_bucket{le="+Inf"} 4',
+        "x_count 4",
+        "x_sum 3.65",
+    ]
+
+
+def test_render_is_openmetrics():
+    m = Metrics()
+    m.files_discovered = 2
+    m.observe_file(100, 0.002, 0.001)
+    m.add_findings([Finding(code="DLT400", message="x", path="a", severity=Severity.WARNING)])
+    text = m.render()
+    assert text.endswith("# EOF\n")
+    s = samples(text)
+    assert s["dltlint_files_discovered"] == "2"
+    assert s["dltlint_files_linted_total"] == "1"
+    assert s["dltlint_read_bytes_total"] == "100"
+    assert s['dltlint_findings_total{code="DLT400",severity="warning"}'] == "1"
+    assert s['dltlint_parse_seconds_bucket{le="+Inf"}'] == "1"
+    assert "# TYPE dltlint_parse_seconds histogram" in text
+
+
+def test_iter_lint_files_records_each_file(tmp_path: Path):
+    a = tmp_path / "a.pipeline.yml"
+    a.write_text("name: a\n", encoding="utf-8")
+    b = tmp_path / "b.pipeline.yml"
+    b.write_text("name: b\ncatalog: c\n", encoding="utf-8")
+    m = Metrics()
+    list(iter_lint_files([a, b], cfg=ToolConfig(), metrics=m))
+    assert m.files_linted == 2
+    assert m.bytes_read == a.stat().st_size + b.stat().st_size
+    assert m.parse_seconds.count == m.lint_seconds.count == 2
+
+
+def test_cli_metrics_file(tmp_path: Path):
+    (tmp_path / "p.pipeline.yml").write_text("name: x\nbogus: 1\n", encoding="utf-8")
+    r = run_cli(tmp_path, "--metrics-file", "run.prom", "--fail-on", "warning", ".")
+    assert r.returncode == 1
+    s = samples((tmp_path / "run.prom").read_text(encoding="utf-8"))
+    assert s["dltlint_files_discovered"] == "1"
+    assert s["dltlint_files_linted_total"] == "1"
+    assert s['dltlint_findings_total{code="DLT010",severity="warning"}'] == "1"
+    assert int(s["dltlint_config_cache_misses_total"]) >= 1
+    assert not list(tmp_path.glob(".run.prom.*"))
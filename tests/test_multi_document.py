@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from dltlint.config import ToolConfig
+from dltlint.core import _iter_docs, lint_paths
+
+
+def write(p: Path, name: str, text: str) -> Path:
+    f = p / name
+    f.write_text(text, encoding="utf-8")
+    return f
+
+
+MULTI = """
+name: first
+catalog: c
+schema: s
+---
+catalog: c
+schema: s
+bogus: 1
+---
+resources:
+  pipelines:
+    p1:
+      name: third
+      edition: ENTERPRISE
+"""
+
+
+def test_iter_docs_is_lazy_and_yields_every_document(tmp_path: Path):
+    f = write(tmp_path, "multi.pipeline.yml", MULTI)
+    it = _iter_docs(f)
+    assert next(it)["name"] == "first"
+    rest = list(it)
+    assert len(rest) == 2
+    assert rest[1]["resources"]["pipelines"]["p1"]["name"] == "third"
+
+
+def test_iter_docs_empty_stream_yields_none(tmp_path: Path):
+    f = write(tmp_path, "empty.pipeline.yml", "")
+    assert list(_iter_docs(f)) == [None]
+
+
+def test_multi_document_findings_are_tagged_with_index(tmp_path: Path):
+    write(tmp_path, "multi.pipeline.yml", MULTI)
+    findings = lint_paths([str(tmp_path)], cfg=ToolConfig(multi_document=True))
+    tagged = {(f.code, f.document) for f in findings}
+    assert ("DLT010", 1) in tagged
+    assert ("DLT400", 1) in tagged
+    assert ("DLT201", 2) in tagged
+    assert all(f.document != 0 for f in findings)
+
+
+def test_multi_document_applies_suppressions_and_require_per_document(tmp_path: Path):
+    write(tmp_path, "multi.pipeline.yml", "# dltlint: disable=DLT010\n" + MULTI)
+    cfg = ToolConfig(multi_document=True, require=["catalog"])
+    findings = lint_paths([str(tmp_path)], cfg=cfg)
+    assert "DLT010" not in {f.code for f in findings}
+    required = [f for f in findings if f.message == "Missing required field 'catalog'"]
+    assert [f.document for f in required] == [2]
+
+
+def test_single_document_mode_leaves_index_unset(tmp_path: Path):
+    write(tmp_path, "single.pipeline.yml", "catalog: c\nschema: s\n")
+    findings = lint_paths([str(tmp_path)])
+    assert findings
+    assert all(f.document is None for f in findings)
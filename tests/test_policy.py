@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from dltlint.config import ConfigResolver, ToolConfig, load_config
+from dltlint.core import lint_paths
+from dltlint.models import Severity
+from dltlint.policy import Policy, compile_path_glob, select_codes
+
+
+def w(p: Path, name: str, text: str) -> Path:
+    f = p / name
+    f.parent.mkdir(parents=True, exist_ok=True)
+    f.write_text(text, encoding="utf-8")
+    return f
+
+
+def test_select_codes_exact_prefix_and_glob():
+    assert select_codes(["dlt010"]) == {"DLT010"}
+    assert select_codes(["DLT46"]) >= {"DLT460", "DLT461", "DLT468"}
+    assert "DLT400" not in select_codes(["DLT46"])
+    assert select_codes(["DLT4?0"]) >= {"DLT400", "DLT410", "DLT460"}
+    assert "DLT401" not in select_codes(["DLT4?0"])
+    assert all(c.startswith("DLT4") for c in select_codes(["DLT4*"]))
+
+
+@pytest.mark.parametrize(
+    ("pattern", "path", "matches"),
+    [
+        ("legacy/**", "legacy/a/b.pipeline.yml", True),
+        ("legacy/*", "legacy/a/b.pipeline.yml", False),
+        ("*.pipeline.yml", "deep/dir/x.pipeline.yml", True),
+        ("**/sandbox/*.yml", "sandbox/x.yml", True),
+        ("teams/[ab]*/x.yml", "teams/alpha/x.yml", True),
+        ("teams/[!ab]*/x.yml", "teams/alpha/x.yml", False),
+    ],
+)
+def test_path_globs(pattern: str, path: str, matches: bool):
+    assert bool(compile_path_glob(pattern).match(path)) is matches
+
+
+def test_per_file_policy_is_memoized_and_more_specific_severity_wins():
+    policy = Policy(
+        ignore=["DLT010"],
+        severity_overrides={"DLT4": Severity.INFO, "DLT400": Severity.ERROR},
+        per_file_ignores={"legacy/**": ["DLT4*"]},
+        per_file_severity_overrides={"*.yaml": {"DLT010": Severity.INFO}},
+    )
+    plain = policy.for_file("a/x.pipeline.yml")
+    assert plain.ignored == {"DLT010"}
+    assert plain.severities["DLT400"] == Severity.ERROR
+    assert plain.severities["DLT401"] == Severity.INFO
+
+    legacy = policy.for_file("./legacy/x.pipeline.yml")
+    assert "DLT400" in legacy.ignored
+    assert policy.for_file("legacy/y/z.pipeline.yml") is legacy
+    assert policy.for_file("b/x.pipeline.yml") is plain
+
+
+def test_per_file_config_from_pyproject(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    w(
+        tmp_path,
+        "pyproject.toml",
+        """
+[tool.dltlint]
+ignore = ["DLT0*"]
+
+[tool.dltlint.per-file-ignores]
+"legacy/**" = ["DLT4"]
+
+[tool.dltlint.per_file_severity_overrides."staging/*"]
+DLT400 = "info"
+""",
+    )
+    spec = "catalog: c\nschema: s\nbogus: 1\n"
+    for d in ("legacy/old", "staging", "prod"):
+        w(tmp_path, f"{d}/p.pipeline.yml", spec)
+    cfg = load_config(tmp_path)
+    assert cfg.per_file_ignores == {"legacy/**": ["DLT4"]}
+
+    findings = lint_paths(["."], cfg=cfg)
+    got = sorted((Path(f.file).parent.name, f.code, f.severity) for f in findings)
+    assert got == [("prod", "DLT400", Severity.WARNING), ("staging", "DLT400", Severity.INFO)]
+
+
+@pytest.mark.parametrize("run_from", [".", "team"])
+def test_per_file_globs_are_relative_to_the_declaring_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, run_from: str
+):
+    w(tmp_path, "team/dltlint.toml", '[per_file_ignores]\n"legacy/**" = ["DLT2"]\n')
+    w(tmp_path, "team/legacy/a.pipeline.yml", "name: a\nchannel: beta\n")
+    w(tmp_path, "legacy/b.pipeline.yml", "name: b\nchannel: beta\n")
+    monkeypatch.chdir(tmp_path / run_from)
+
+    findings = lint_paths([str(tmp_path)], resolver=ConfigResolver())
+    assert {(Path(f.file).name, f.code) for f in findings if f.code == "DLT200"} == {("b.pipeline.yml", "DLT200")}
+
+
+def test_inline_suppression_accepts_selectors(tmp_path: Path):
+    w(tmp_path, "s.pipeline.yml", "# dltlint: disable=DLT4*,DLT01\ncatalog: c\nschema: s\nbogus: 1\n")
+    assert lint_paths([str(tmp_path)], cfg=ToolConfig()) == []
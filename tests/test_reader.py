@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import mmap
+from pathlib import Path
+
+import pytest
+
+from dltlint.config import ToolConfig, parse_inline_suppressions, scan_inline_suppressions
+from dltlint.core import lint_paths
+from dltlint.reader import close_source, read_ahead, read_source
+
+
+def write(p: Path, name: str, text: str) -> Path:
+    f = p / name
+    f.write_text(text, encoding="utf-8")
+    return f
+
+
+@pytest.mark.parametrize(("workers", "max_bytes"), [(0, 1), (1, 1), (4, 1 << 20)])
+def test_read_ahead_preserves_order(tmp_path: Path, workers: int, max_bytes: int):
+    files = [write(tmp_path, f"f{i:02d}.pipeline.yml", f"name: n{i}\n" * (i + 1)) for i in range(20)]
+    got = list(read_ahead(files, workers=workers, max_bytes=max_bytes))
+    assert [p for p, _ in got] == files
+    assert all(data == p.read_bytes() for p, data in got)
+
+
+def test_read_ahead_raises_in_order(tmp_path: Path):
+    ok = write(tmp_path, "a.pipeline.yml", "name: a\n")
+    missing = tmp_path / "b.pipeline.yml"
+    it = read_ahead([ok, missing], workers=2)
+    assert next(it)[0] == ok
+    with pytest.raises(FileNotFoundError):
+        next(it)
+
+
+def test_lint_paths_with_read_ahead_matches_serial(tmp_path: Path):
+    for i in range(10):
+        write(tmp_path, f"p{i}.pipeline.yml", f"catalog: c\nschema: s\nbogus{i}: 1\n")
+    serial = lint_paths([str(tmp_path)], cfg=ToolConfig())
+    threaded = lint_paths([str(tmp_path)], cfg=ToolConfig(read_ahead=3, read_ahead_bytes=16))
+    assert [f.model_dump() for f in threaded] == [f.model_dump() for f in serial]
+
+
+def test_read_source_maps_large_files(tmp_path: Path):
+    f = write(tmp_path, "big.pipeline.yml", "name: big\n" * 100)
+    small = read_source(f, mmap_threshold=1 << 20)
+    assert isinstance(small, bytes)
+    mapped = read_source(f, mmap_threshold=16)
+    try:
+        assert isinstance(mapped, mmap.mmap)
+        assert mapped[:] == f.read_bytes()
+    finally:
+        close_source(mapped)
+
+
+def test_scan_inline_suppressions_matches_text_parser():
+    text = "a: 1\n# dltlint: disable=DLT010, dlt400\nb: 2  # dltlint: disable DLT300\r\n# dltlint: disable=DLT201"
+    assert scan_inline_suppressions(text.encode(), "dltlint: disable") == parse_inline_suppressions(
+        text, "dltlint: disable"
+    )
+
+
+def test_lint_paths_with_mmap_matches_heap_reads(tmp_path: Path):
+    single = tmp_path / "single"
+    multi_dir = tmp_path / "multi"
+    single.mkdir()
+    multi_dir.mkdir()
+    write(single, "a.pipeline.yml", "# dltlint: disable=DLT010\ncatalog: c\nbogus: 1\n")
+    write(multi_dir, "a.pipeline.yml", "# dltlint: disable=DLT010\ncatalog: c\nbogus: 1\n---\nname: n\nedition: X\n")
+    for d, multi in ((single, False), (multi_dir, True)):
+        heap = lint_paths([str(d)], cfg=ToolConfig(multi_document=multi, mmap_threshold=0))
+        mapped = lint_paths([str(d)], cfg=ToolConfig(multi_document=multi, mmap_threshold=1))
+        assert heap
+        assert [f.model_dump() for f in mapped] == [f.model_dump() for f in heap]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dltlint.core import KNOWN_FIELDS_PIPELINE_OBJ, iter_lint_documents, lint_pipeline
+from dltlint.models import Issue
+from dltlint.registry import RULES
+from dltlint.schema import (
+    CLUSTER,
+    PIPELINE_OBJ,
+    STANDALONE,
+    Items,
+    Level,
+    Rule,
+    compile_level,
+    json_schema,
+    memoized_subtrees,
+)
+
+
+def _walk(level: Level, seen: dict[int, Level]) -> None:
+    if id(level) in seen:
+        return
+    seen[id(level)] = level
+    for check in level.checks:
+        if hasattr(check, "level"):
+            _walk(check.level, seen)
+        for sub in getattr(check, "kinds", {}).values():
+            _walk(sub, seen)
+
+
+def test_every_code_in_the_schema_is_registered():
+    seen: dict[int, Level] = {}
+    _walk(STANDALONE, seen)
+    _walk(PIPELINE_OBJ, seen)
+    codes = set()
+    for level in seen.values():
+        codes.add(level.unknown_code)
+        for pair in (level.not_object, level.invalid):
+            if pair:
+                codes.add(pair[0])
+        for check in level.checks:
+            codes.update(c for c in (getattr(check, "code", None),) if c)
+            codes.update(getattr(check, "codes", ()))
+            codes.update(c for c in (getattr(check, "missing_code", None), getattr(check, "multiple_code", None)) if c)
+    assert codes <= set(RULES), codes - set(RULES)
+
+
+def test_compile_reuses_shared_levels():
+    memo: dict = {}
+    compile_level(STANDALONE, memo)
+    before = dict(memo)
+    compile_level(PIPELINE_OBJ, memo)
+    assert memo[id(CLUSTER)] is before[id(CLUSTER)]
+    assert any(isinstance(c, Items) and c.level is CLUSTER for c in PIPELINE_OBJ.checks)
+
+
+def test_known_fields_are_derived_from_schema():
+    assert PIPELINE_OBJ.fields == KNOWN_FIELDS_PIPELINE_OBJ
+
+
+def test_environment_dependencies_and_single_trigger_type_error():
+    doc = {
+        "resources": {"pipelines": {"p": {"name": "p", "trigger": "hourly", "environment": {"dependencies": "duckdb"}}}}
+    }
+    findings = lint_pipeline(doc)
+    assert [(f.code, f.path) for f in findings] == [
+        ("DLT104", "$.resources.pipelines.p.trigger"),
+        ("DLT103", "$.resources.pipelines.p.environment.dependencies"),
+    ]
+
+
+def test_json_schema_export_covers_nested_levels():
+    schema = json_schema()
+    defs = schema["$defs"]
+    assert {"standalone", "pipeline", "cluster", "library", "notification", "trigger", "environment"} <= set(defs)
+    pipeline = defs["pipeline"]["properties"]
+    assert pipeline["channel"]["enum"] == sorted(["current", "preview", "CURRENT", "PREVIEW"])
+    assert pipeline["clusters"] == {"type": "array", "items": {"$ref": "#/$defs/cluster"}}
+    assert defs["cluster"]["properties"]["num_workers"] == {"type": "integer", "minimum": 0}
+    assert [next(iter(k["required"])) for k in defs["library"]["oneOf"]][:2] == ["notebook", "file"]
+    json.dumps(schema)
+
+
+def test_cli_writes_json_schema(tmp_path: Path):
+    out = tmp_path / "pipeline.schema.json"
+    cp = subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", "--json-schema", str(out)],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert cp.returncode == 0, cp.stderr
+    assert json.loads(out.read_text(encoding="utf-8"))["$defs"]["standalone"]["type"] == "object"
+
+
+ANCHORED = """
+shared:
+  clusters: &clusters
+    - {label: default, num_workers: -1, spark_version: "14.3"}
+    - &auto {autoscale: {min_workers: 4, max_workers: 2}}
+  libraries: &libraries [{notebook: {}}, "lib", {glob: {include: src}}]
+  notifications: &notifications [{email_recipients: [], on_update_start: "yes"}]
+resources:
+  pipelines:
+"""
+
+
+@pytest.mark.parametrize("count", [2, 16])
+def test_anchored_blocks_report_every_occurrence(count: int):
+    text = ANCHORED + "".join(
+        f"    p{i}: {{name: p{i}, clusters: *clusters, libraries: *libraries, notifications: *notifications}}\n"
+        for i in range(count)
+    )
+    text += "    extra: {name: extra, clusters: [*auto, *auto]}\n"
+    doc = yaml.safe_load(text)
+    pipelines = doc["resources"]["pipelines"]
+    assert pipelines["p0"]["clusters"] is pipelines["p1"]["clusters"]
+    shared = lint_pipeline(doc)
+    assert shared == lint_pipeline(json.loads(json.dumps(doc)))  # same document without aliases
+    paths = [f.path for f in shared]
+    for i in range(count):
+        assert f"$.resources.pipelines.p{i}.clusters[0].num_workers" in paths
+        assert f"$.resources.pipelines.p{i}.libraries[1]" in paths
+    assert "$.resources.pipelines.extra.clusters[1].autoscale" in paths
+
+
+def test_anchored_files_match_their_expanded_form():
+    text = ANCHORED + "    p0: {name: p0, clusters: *clusters}\n    p1: {name: p1, clusters: *clusters}\n"
+    expanded = json.dumps(yaml.safe_load(text))
+    got = {
+        name: [(f.code, f.loc) for f in findings]
+        for name, findings in iter_lint_documents([("a.pipeline.yml", text), ("a.json", expanded)])
+    }
+    assert got["a.pipeline.yml"] == got["a.json"]
+    assert ("DLT461", ("resources", "pipelines", "p1", "clusters", 0, "num_workers")) in got["a.pipeline.yml"]
+
+
+def test_shared_items_are_validated_once():
+    calls = []
+
+    def rule(obj: dict, loc: tuple, f: list) -> None:
+        calls.append(loc)
+        f.append(Issue("DLT999", (*loc, "x"), "bad"))
+
+    item_level = Level("item", checks=(Rule(rule),))
+    validate = compile_level(Level("root", checks=(Items("items", item_level),)))
+    item: dict = {"x": 1}
+    doc = {"items": [item, item, {"x": 1}]}
+    f: list = []
+    with memoized_subtrees():
+        validate(doc, ("a",), f)
+        validate(doc, ("b",), f)
+    assert calls == [("a", "items", 0), ("a", "items", 2)]
+    assert [i.loc for i in f] == [(root, "items", n, "x") for root in "ab" for n in range(3)]
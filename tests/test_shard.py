@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from dltlint.shard import parse_shard, select_shard, shard_key
+
+
+def run_cli(tmp_path: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", *args],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def make_files(tmp_path: Path, n: int) -> list[Path]:
+    files = []
+    for i in range(n):
+        f = tmp_path / f"p{i:03}.pipeline.yml"
+        f.write_text("name: x\n" + "# pad\n" * (i % 7) * 50, encoding="utf-8")
+        files.append(f)
+    return files
+
+
+def test_parse_shard():
+    assert parse_shard("1/1") == (1, 1)
+    assert parse_shard("3/4") == (3, 4)
+    for bad in ("0/2", "3/2", "1", "a/b", "1/0", "-1/2"):
+        with pytest.raises(ValueError, match="INDEX/COUNT"):
+            parse_shard(bad)
+
+
+def test_key_ignores_how_the_path_was_spelled(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    base = str(tmp_path)
+    assert shard_key(Path("a/b.pipeline.yml"), base) == shard_key(tmp_path / "a" / "b.pipeline.yml", base)
+    assert shard_key(Path("a/b.pipeline.yml"), base) != shard_key(Path("a/c.pipeline.yml"), base)
+
+
+@pytest.mark.parametrize("by_size", [False, True])
+def test_shards_partition_the_files(tmp_path: Path, monkeypatch, by_size: bool):
+    monkeypatch.chdir(tmp_path)
+    files = make_files(tmp_path, 60)
+    shards = [select_shard(files, i, 4, by_size=by_size) for i in range(1, 5)]
+    assert sorted(f for s in shards for f in s) == files
+    assert all(s == sorted(s) for s in shards)  # original order is kept
+    assert all(shards)
+    if by_size:
+        sizes = [sum(f.stat().st_size for f in s) for s in shards]
+        assert max(sizes) - min(sizes) <= 2 * max(f.stat().st_size for f in files)
+
+
+def test_hash_shards_are_stable_when_files_are_added(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    files = make_files(tmp_path, 40)
+    before = select_shard(files[:30], 2, 3)
+    after = select_shard(files, 2, 3)
+    assert set(before) <= set(after)
+
+
+def test_cli_shards(tmp_path: Path):
+    for i in range(10):
+        (tmp_path / f"p{i}.pipeline.yml").write_text(f"name: p{i}\nbogus: 1\n", encoding="utf-8")
+    seen = []
+    for spec in ("1/2", "2/2"):
+        r = run_cli(tmp_path, "--shard", spec, "--format", "json", ".")
+        seen.extend(line for line in r.stdout.splitlines() if '"path"' in line)
+    assert len(seen) == len(set(seen)) == 10
+
+    r = run_cli(tmp_path, "--shard", "3/2", ".")
+    assert r.returncode == 2
+    assert "INDEX/COUNT" in r.stderr
+
+    r = run_cli(tmp_path, "--shard", "1/2", "--cross-file", ".")
+    assert r.returncode == 2
+    assert "--shard" in r.stderr
+
+    (tmp_path / "pyproject.toml").write_text("[tool.dltlint]\ncross_file = true\n", encoding="utf-8")
+    r = run_cli(tmp_path, "--shard", "1/2", ".")
+    assert r.returncode == 2
+    assert "cross_file" in r.stderr
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from dltlint.config import ToolConfig
+from dltlint.core import iter_lint_snapshot, lint_pipeline
+from dltlint.snapshot import iter_snapshot_pipelines
+
+SNAPSHOT = {
+    "bundle": {"name": "b", "tags": ["a", "b \\" + '"q"'], "n": -1.5e3, "ok": True, "none": None},
+    "resources": {
+        "jobs": {"j": {"tasks": [{"k": "}]"}]}},
+        "pipelines": {
+            "ok": {"name": "n", "catalog": "c", "schema": "s"},
+            "bad": {"catalog": "c", "bogus": 1, "clusters": [{"num_workers": -1}], "libraries": ["x"]},
+            "naïve ☃": 3,
+        },
+    },
+    "variables": {},
+}
+
+
+def raw() -> bytes:
+    return json.dumps(SNAPSHOT, indent=1, ensure_ascii=False).encode("utf-8")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 16])
+def test_pipelines_are_decoded_one_at_a_time(chunk_size: int):
+    got = list(iter_snapshot_pipelines(io.BytesIO(raw()), chunk_size=chunk_size))
+    assert got == list(SNAPSHOT["resources"]["pipelines"].items())
+
+
+def test_findings_match_whole_document_linting(tmp_path: Path):
+    p = tmp_path / "snap.json"
+    p.write_bytes(raw())
+    streamed = [f.model_dump() for _, fs in iter_lint_snapshot(p, cfg=ToolConfig()) for f in fs]
+    whole = [f.model_dump() for f in lint_pipeline(SNAPSHOT, root=str(p))]
+    key = lambda d: json.dumps(d, sort_keys=True)  # noqa E731
+    assert sorted(map(key, streamed)) == sorted(map(key, whole))
+
+
+def test_first_pipeline_is_yielded_before_the_rest_is_read():
+    pipelines = {f"p{i}": {"name": "n", "catalog": "c", "schema": "s"} for i in range(2000)}
+    fh = io.BytesIO(json.dumps({"resources": {"pipelines": pipelines}}).encode())
+    it = iter_snapshot_pipelines(fh, chunk_size=1024)
+    assert next(it)[0] == "p0"
+    assert fh.tell() <= 2048
+    assert sum(1 for _ in it) == 1999
+
+
+@pytest.mark.parametrize("text", [b"[]", b'{"resources": {"pipelines": {"a": {}', b'{"a": 1} x', b'{"a" 1}'])
+def test_invalid_snapshots_raise(text: bytes):
+    with pytest.raises(ValueError, match="invalid JSON snapshot"):
+        list(iter_snapshot_pipelines(io.BytesIO(text), chunk_size=4))
+
+
+def test_cli_snapshot_mode_streams_json_lines(tmp_path: Path):
+    (tmp_path / "snap.json").write_bytes(raw())
+    r = subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", "--snapshot", "--format", "json", "snap.json"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert r.returncode == 1, r.stderr
+    records = [json.loads(line) for line in r.stdout.splitlines()]
+    assert [x["pipeline"] for x in records] == ["ok", "bad", "naïve ☃"]
+    assert records[0]["findings"] == []
+    assert {f["code"] for f in records[2]["findings"]} == {"DLT002"}
+
+
+def test_cli_snapshot_mode_needs_a_path(tmp_path: Path):
+    r = subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", "--snapshot"],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert r.returncode == 2
+    assert "--snapshot needs at least one path" in r.stderr
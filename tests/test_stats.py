@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from dltlint.models import Finding, Severity
+from dltlint.stats import Statistics
+
+
+def run_cli(tmp_path: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", *args],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_statistics_counts_and_sort_order():
+    st = Statistics()
+    st.add(
+        "a.pipeline.yml",
+        [
+            Finding(code="DLT010", message="x", path="a"),
+            Finding(code="DLT010", message="y", path="a"),
+            Finding(code="DLT400", message="z", path="a", severity=Severity.WARNING),
+        ],
+    )
+    st.add("b.pipeline.yml", [Finding(code="DLT400", message="z", path="b", severity=Severity.WARNING)])
+    st.add("c.pipeline.yml", [])
+
+    d = st.to_dict()
+    assert d["files"] == 3
+    assert d["findings"] == 4
+    assert d["by_code"] == [
+        {"code": "DLT010", "severity": "error", "count": 2},
+        {"code": "DLT400", "severity": "warning", "count": 2},
+    ]
+    assert d["by_severity"] == {"error": 2, "warning": 2, "info": 0}
+    assert d["by_file"] == [{"file": "a.pipeline.yml", "count": 3}, {"file": "b.pipeline.yml", "count": 1}]
+    assert st.worst() == 2
+    assert Statistics().worst() == -1
+
+    table = st.table().splitlines()
+    assert table[0] == "4 finding(s) in 3 pipeline file(s)"
+    assert table[2].startswith("2  DLT010  error")
+
+
+def test_cli_statistics_json_and_exit_code(tmp_path: Path):
+    (tmp_path / "a.pipeline.yml").write_text("name: n\ncatalog: c\nschema: s\nbogus: 1\nother: 2\n", encoding="utf-8")
+    (tmp_path / "b.pipeline.yml").write_text("name: n\ncatalog: c\nschema: s\n", encoding="utf-8")
+
+    r = run_cli(tmp_path, "--statistics", "--format", "json", "--fail-on", "warning")
+    assert r.returncode == 1, r.stderr
+    d = json.loads(r.stdout)
+    assert d["files"] == 2
+    assert d["by_code"] == [{"code": "DLT010", "severity": "warning", "count": 2}]
+    assert d["by_file"] == [{"file": "a.pipeline.yml", "count": 2}]
+
+    assert run_cli(tmp_path, "--statistics").returncode == 0
+
+    r = run_cli(tmp_path, "--statistics", "b.pipeline.yml")
+    assert r.returncode == 0
+    assert r.stdout.strip() == "0 finding(s) in 1 pipeline file(s)"
@@ -1,10 +1,12 @@
 import subprocess
 import sys
+import warnings
 from pathlib import Path
 
 import pytest
 
-from dltlint.config import ToolConfig, load_config
+from dltlint import config as config_mod
+from dltlint.config import ConfigResolver, ConfigWarning, ToolConfig, load_config
 from dltlint.core import lint_paths
 from dltlint.models import Severity
 
@@ -203,3 +205,100 @@ def test_cli_gen_rules(tmp_path: Path, fname: str):
     # Sanity: the markdown table header and a known rule code should be present
     assert "| Code | Title | Default Severity |" in content
     assert "`DLT010`" in content
+
+
+# ----------------------------
+# Hierarchical per-directory config
+# ----------------------------
+
+
+def test_resolver_inherits_and_overrides_per_directory(tmp_path: Path):
+    w(tmp_path, "pyproject.toml", '[tool.dltlint]\nignore = ["DLT010"]\nrequire = ["catalog"]\n')
+    team = tmp_path / "team_a"
+    (team / "pipelines").mkdir(parents=True)
+    w(team, "dltlint.toml", 'require = ["schema"]\n\n[severity_overrides]\nDLT400 = "info"\n')
+    other = tmp_path / "team_b"
+    other.mkdir()
+    w(other, "pyproject.toml", "[project]\nname = 'no-dltlint-table'\n")
+
+    resolver = ConfigResolver()
+    deep = resolver.for_path(team / "pipelines" / "x.pipeline.yml")
+    assert deep.ignore == ["DLT010"]  # inherited from the root pyproject
+    assert deep.require == ["schema"]  # replaced by the team config
+    assert deep.severity_overrides == {"DLT400": Severity.INFO}
+
+    plain = resolver.for_path(other / "y.pipeline.yml")
+    assert plain.require == ["catalog"]
+    assert plain.severity_overrides == {}
+
+
+def test_resolver_memoizes_directory_chains(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    w(tmp_path, "dltlint.toml", 'ignore = ["DLT400"]\n')
+    sub = tmp_path / "a" / "b"
+    sub.mkdir(parents=True)
+    reads: list[Path] = []
+    real = config_mod._read_dir_table
+    monkeypatch.setattr(config_mod, "_read_dir_table", lambda d: reads.append(d) or real(d))
+
+    resolver = ConfigResolver()
+    for i in range(50):
+        assert resolver.for_path(sub / f"p{i}.pipeline.yml").ignore == ["DLT400"]
+    assert resolver.for_path(tmp_path / "a" / "q.pipeline.yml").ignore == ["DLT400"]
+    assert len(reads) == len(set(reads))
+    assert resolver.hits >= 50
+
+
+def test_resolver_falls_back_without_any_config(tmp_path: Path):
+    fallback = ToolConfig(ignore=["DLT400"])
+    resolver = ConfigResolver(fallback=fallback, overrides={"multi_document": True})
+    cfg = resolver.for_path(tmp_path / "x.pipeline.yml")
+    assert cfg.ignore == ["DLT400"]
+    assert cfg.multi_document is True
+
+
+def test_resolver_warns_about_per_directory_fail_on(tmp_path: Path):
+    team = tmp_path / "team"
+    team.mkdir()
+    w(team, "dltlint.toml", 'fail_on = "warning"\n')
+    sub = team / "sub"
+    sub.mkdir()
+    resolver = ConfigResolver()
+    with pytest.warns(ConfigWarning, match="fail_on = 'warning' is ignored") as record:
+        resolver.for_path(sub / "y.pipeline.yml")
+    assert len(record) == 1
+    assert str(team) in str(record[0].message)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        resolver.for_path(team / "x.pipeline.yml")  # memoized: warned once per directory
+
+    w(team, "dltlint.toml", 'fail_on = "error"\nignore = ["DLT400"]\n')
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        ConfigResolver().for_path(team / "x.pipeline.yml")
+
+
+def test_cli_prints_config_warnings_plainly(tmp_path: Path):
+    (tmp_path / "team").mkdir()
+    w(tmp_path / "team", "dltlint.toml", 'fail_on = "warning"\n')
+    w(tmp_path / "team", "p.pipeline.yml", "name: n\ncatalog: c\nschema: s\n")
+    cp = subprocess.run(
+        [sys.executable, "-m", "dltlint.cli"], cwd=tmp_path, capture_output=True, text=True, check=False
+    )
+    assert cp.returncode == 0, cp.stderr
+    assert cp.stderr == (
+        f"dltlint: {tmp_path / 'team'}: fail_on = 'warning' is ignored; fail_on applies to the whole run "
+        "('error', set in the working directory's pyproject.toml or with --fail-on)\n"
+    )
+
+
+def test_lint_paths_uses_nearest_config(tmp_path: Path):
+    w(tmp_path, "pyproject.toml", '[tool.dltlint]\nignore = ["DLT400"]\n')
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    w(sub, "dltlint.toml", 'ignore = ["DLT010"]\n')
+    w(tmp_path, "root.pipeline.yml", "catalog: c\nbogus: 1\n")
+    w(sub, "nested.pipeline.yml", "catalog: c\nbogus: 1\n")
+
+    findings = lint_paths([str(tmp_path)], resolver=ConfigResolver())
+    by_file = {(Path(f.path).name.split(".")[0], f.code) for f in findings}
+    assert by_file == {("root", "DLT010"), ("nested", "DLT400")}
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from dltlint import tracing
+
+
+def run_cli(tmp_path: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "dltlint.cli", *args],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_span_is_a_shared_no_op_when_tracing_is_off():
+    assert tracing.span("a") is tracing.span("b", file="x")
+
+
+def test_tracer_records_nested_spans(tmp_path: Path):
+    tracer = tracing.Tracer()
+    tracing.install(tracer)
+    try:
+        with tracing.span("outer"), tracing.span("inner", file="a"):
+            pass
+    finally:
+        tracing.install(None)
+    out = tmp_path / "trace.json"
+    tracer.write(out)
+    events = json.loads(out.read_text(encoding="utf-8"))["traceEvents"]
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    assert spans["inner"]["args"] == {"file": "a"}
+    assert spans["outer"]["ts"] <= spans["inner"]["ts"]
+    assert spans["inner"]["ts"] + spans["inner"]["dur"] <= spans["outer"]["ts"] + spans["outer"]["dur"]
+    assert [e["args"]["name"] for e in events if e["ph"] == "M"] == ["MainThread"]
+
+
+def test_cli_trace_file_has_phases_and_workers(tmp_path: Path):
+    for n in range(3):
+        (tmp_path / f"p{n}.pipeline.yml").write_text(f"name: p{n}\n", encoding="utf-8")
+    r = run_cli(tmp_path, "--trace-file", "trace.json", "--read-ahead", "2", ".")
+    assert r.returncode == 0, r.stderr
+    events = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))["traceEvents"]
+    names = {e["name"] for e in events if e["ph"] == "X"}
+    assert {"load_config", "discover", "read", "parse", "lint", "file", "output"} <= names
+    threads = {e["tid"]: e["args"]["name"] for e in events if e["ph"] == "M"}
+    reads = {threads[e["tid"]] for e in events if e["name"] == "read"}
+    assert reads
+    assert all(t.startswith("dltlint-read") for t in reads)
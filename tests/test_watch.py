@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from dltlint.config import ToolConfig
+from dltlint.watch import Watcher
+
+
+def write(p: Path, name: str, text: str) -> Path:
+    f = p / name
+    f.write_text(text, encoding="utf-8")
+    # Filesystems with coarse timestamps: push mtime forward so every write is observable.
+    st = f.stat()
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+    return f
+
+
+def bump_dir(d: Path) -> None:
+    st = d.stat()
+    os.utime(d, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+
+
+def test_watch_relints_only_changed_files(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write(tmp_path, "a.pipeline.yml", "name: a\ncatalog: c\n")
+    write(tmp_path, "b.pipeline.yml", "name: b\ncatalog: c\ntarget: t\n")
+    w = Watcher([str(tmp_path)], cfg=ToolConfig())
+    assert [f.code for f in w.start()] == ["DLT300"]
+
+    linted: list[str] = []
+    real = w._lint_file
+    monkeypatch.setattr(w, "_lint_file", lambda p: linted.append(Path(p).name) or real(p))
+    assert w.poll() == ([], [])
+    assert linted == []
+
+    write(tmp_path, "a.pipeline.yml", "name: a\ncatalog: c\nbogus: 1\n")
+    added, removed = w.poll()
+    assert linted == ["a.pipeline.yml"]
+    assert [f.code for f in added] == ["DLT010"]
+    assert removed == []
+
+
+def test_watch_rediscovers_on_directory_change(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    b = write(tmp_path, "b.pipeline.yml", "name: b\ncatalog: c\ntarget: t\n")
+    w = Watcher([str(tmp_path)], cfg=ToolConfig())
+    w.start()
+
+    write(tmp_path, "new.pipeline.yml", "catalog: c\n")
+    bump_dir(tmp_path)
+    added, removed = w.poll()
+    assert [f.code for f in added] == ["DLT400"]
+    assert removed == []
+
+    b.unlink()
+    bump_dir(tmp_path)
+    added, removed = w.poll()
+    assert added == []
+    assert [f.code for f in removed] == ["DLT300"]
+
+
+def test_watch_config_change_relints_everything(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write(tmp_path, "a.pipeline.yml", "catalog: c\n")
+    w = Watcher([str(tmp_path)], cfg=ToolConfig())
+    assert [f.code for f in w.start()] == ["DLT400"]
+
+    write(tmp_path, "dltlint.toml", 'ignore = ["DLT400"]\n')
+    added, removed = w.poll()
+    assert added == []
+    assert [f.code for f in removed] == ["DLT400"]
+
+
+def test_watch_config_reload_keeps_cli_overrides(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write(tmp_path, "a.pipeline.yml", "catalog: c\nschema: s\n---\ncatalog: c\n")
+    overrides = {"multi_document": True, "read_ahead": 2}
+    w = Watcher([str(tmp_path)], cfg=ToolConfig(multi_document=True, read_ahead=2), overrides=overrides)
+    assert [f.document for f in w.start()] == [0, 1]
+
+    write(tmp_path, "pyproject.toml", '[tool.dltlint]\nignore = ["DLT010"]\n')
+    assert w.poll() == ([], [])
+    assert (w.cfg.multi_document, w.cfg.read_ahead) == (True, 2)
+
+
+def test_watch_keeps_running_on_broken_yaml(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write(tmp_path, "a.pipeline.yml", "catalog: c\n")
+    w = Watcher([str(tmp_path)], cfg=ToolConfig())
+    w.start()
+    write(tmp_path, "a.pipeline.yml", "catalog: [unclosed\n")
+    added, removed = w.poll()
+    assert added == []
+    assert [f.code for f in removed] == ["DLT400"]
+    assert list(w.errors) == [str(tmp_path / "a.pipeline.yml")]